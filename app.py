@@ -9,21 +9,28 @@ load_dotenv()
 from utils.llm import query_model
 from utils.prompts import (
     get_roadmap_prompt, get_chat_prompt, get_projects_prompt,
-    get_resume_prompt, get_interview_prompt, get_followup_prompt
+    get_resume_prompt, get_interview_prompt, get_followup_prompt,
+    RESUME_PROMPT_VERSION
 )
 from utils.storage import (
     save_profile, load_profile, get_all_profiles, delete_profile,
     save_roadmap, save_resume_analysis, save_interview_session,
+    resume_fingerprint, get_cached_resume_analysis, cache_resume_analysis,
     get_profile_stats, export_profile_as_text
 )
-from utils.assessment import get_assessment, calculate_score, get_skill_level, get_available_topics
+from utils.assessment import (
+    get_assessment, calculate_score, get_skill_level, get_available_topics,
+    start_adaptive_assessment, get_adaptive_question, answer_adaptive_question, adaptive_result
+)
 from utils.visualizations import (
     format_stats_for_display, calculate_engagement_score,
     get_next_recommended_action, generate_progress_summary
 )
+from utils.cohort import get_cohort_stats
 from utils.reports import (
-    generate_text_report, generate_csv_export, generate_json_export,
-    generate_summary_stats, get_engagement_level
+    generate_text_report, iter_csv_export, iter_json_export, spool_export,
+    generate_summary_stats, get_engagement_level,
+    HAS_REPORTLAB, generate_pdf_report, generate_batch_pdf_reports, profile_report_inputs
 )
 
 # Page configuration
@@ -373,17 +380,29 @@ with tab4:
         
         if st.button("Analyze Resume", key="analyze_resume"):
             if resume_text:
-                with st.spinner("Analyzing your resume..."):
-                    prompt = get_resume_prompt(resume_text)
-                    analysis = query_model(
-                        "You are an expert career coach analyzing resumes.",
-                        prompt,
-                        max_tokens=1500
-                    )
-                    st.session_state.resume_analysis = analysis
-                    save_resume_analysis(st.session_state.current_profile, analysis)
+                fingerprint = resume_fingerprint(resume_text, "General", RESUME_PROMPT_VERSION)
+                cached = get_cached_resume_analysis(fingerprint)
+                if cached:
+                    st.session_state.resume_analysis = cached["content"]
+                    st.session_state.resume_analysis_cached_at = cached["timestamp"]
+                else:
+                    with st.spinner("Analyzing your resume..."):
+                        prompt = get_resume_prompt(resume_text)
+                        analysis = query_model(
+                            "You are an expert career coach analyzing resumes.",
+                            prompt,
+                            max_tokens=1500
+                        )
+                        st.session_state.resume_analysis = analysis
+                        st.session_state.resume_analysis_cached_at = None
+                        save_resume_analysis(st.session_state.current_profile, analysis)
+                        if not analysis.startswith("Error:"):
+                            cache_resume_analysis(fingerprint, analysis, "General", RESUME_PROMPT_VERSION)
         
         if st.session_state.resume_analysis:
+            cached_at = st.session_state.get("resume_analysis_cached_at")
+            if cached_at:
+                st.caption(f"⚡ Cached from {datetime.fromisoformat(cached_at).strftime('%b %d, %Y %H:%M')}")
             st.markdown(st.session_state.resume_analysis)
     else:
         st.info("👉 Create or select a profile in the sidebar to analyze your resume")
@@ -459,53 +478,109 @@ with tab6:
     topics = get_available_topics()
     selected_topic = st.selectbox("Select Assessment Topic", topics)
     
-    num_questions = st.slider("Number of Questions", 1, 10, 5)
+    mode = st.radio(
+        "Assessment Mode",
+        ["Adaptive", "Fixed length"],
+        horizontal=True,
+        help="Adaptive picks each question from your previous answers and stops as soon as your level is clear"
+    )
+    if mode == "Fixed length":
+        num_questions = st.slider("Number of Questions", 1, 10, 5)
     
     if st.button("Start Assessment"):
-        assessment = get_assessment(selected_topic, num_questions)
-        st.session_state.current_assessment = assessment
-        st.session_state.assessment_answers = {}
+        st.session_state.assessment_mode = mode
+        st.session_state.assessment_topic = selected_topic
+        st.session_state.assessment_result = None
+        if mode == "Adaptive":
+            st.session_state.adaptive_assessment = start_adaptive_assessment(
+                selected_topic, profile=st.session_state.current_profile
+            )
+        else:
+            questions, correct_answers = get_assessment(
+                selected_topic, num_questions, profile=st.session_state.current_profile
+            )
+            st.session_state.current_assessment = {"questions": questions, "correct_answers": correct_answers}
+    
+    active_mode = st.session_state.get("assessment_mode")
+    active_topic = st.session_state.get("assessment_topic")
+    finished_score = None
+    
+    if active_mode == "Adaptive" and st.session_state.get("adaptive_assessment"):
+        state = st.session_state.adaptive_assessment
+        question = get_adaptive_question(state)
+        if question:
+            st.write(f"**Topic:** {active_topic}")
+            st.caption(
+                f"Question {len(state['administered']) + 1} of at most {state['max_questions']} · "
+                f"current precision ±{state['se']:.2f}"
+            )
+            st.divider()
+            st.write(f"**{question['question']}**")
+            choice = st.radio(
+                "Your answer:",
+                range(len(question['options'])),
+                format_func=lambda i: question['options'][i],
+                index=None,
+                key=f"adaptive_q_{len(state['administered'])}"
+            )
+            if st.button("Submit Answer", disabled=choice is None):
+                answer_adaptive_question(state, choice)
+                if state["finished"]:
+                    finished_score = adaptive_result(state)
+                    st.session_state.adaptive_assessment = None
+                else:
+                    st.rerun()
     
-    if hasattr(st.session_state, 'current_assessment'):
+    elif active_mode == "Fixed length" and st.session_state.get("current_assessment"):
         assessment = st.session_state.current_assessment
-        st.write(f"**Topic:** {selected_topic}")
-        st.write(f"**Questions:** {num_questions}")
+        st.write(f"**Topic:** {active_topic}")
+        st.write(f"**Questions:** {len(assessment['questions'])}")
         st.divider()
         
+        answers = []
         for i, q in enumerate(assessment['questions']):
             st.write(f"**Q{i+1}: {q['question']}**")
-            options = [q['a'], q['b'], q['c'], q['d']]
-            answer = st.radio(f"Answer for Q{i+1}:", options, key=f"q_{i}")
-            st.session_state.assessment_answers[i] = answer
+            answers.append(st.radio(
+                f"Answer for Q{i+1}:",
+                range(len(q['options'])),
+                format_func=lambda j, options=q['options']: options[j],
+                key=f"q_{i}"
+            ))
         
         if st.button("Submit Assessment"):
-            score_data = calculate_score(
-                st.session_state.assessment_answers,
-                assessment['correct_answers']
+            finished_score = calculate_score(answers, assessment['correct_answers'])
+            st.session_state.current_assessment = None
+    
+    if finished_score:
+        st.session_state.assessment_result = finished_score
+        st.session_state.assessment_scores[active_topic] = {
+            "percentage": finished_score['percentage'],
+            "level": get_skill_level(finished_score['percentage']),
+            "timestamp": datetime.now().isoformat()
+        }
+        if st.session_state.current_profile:
+            save_profile(st.session_state.current_profile, {
+                **st.session_state.profile_config,
+                "assessment_scores": st.session_state.assessment_scores
+            })
+        st.rerun()
+    
+    score_data = st.session_state.get("assessment_result")
+    if score_data:
+        st.success(f"✅ Assessment Complete!")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Score", f"{score_data['percentage']}%")
+        with col2:
+            st.metric("Skill Level", get_skill_level(score_data['percentage']))
+        with col3:
+            st.metric("Correct Answers", f"{score_data['correct']}/{score_data['total']}")
+        if "theta" in score_data:
+            st.caption(
+                f"Adaptive estimate from {score_data['total']} questions "
+                f"(ability {score_data['theta']:+.2f} ± {score_data['standard_error']:.2f})"
             )
-            percentage = score_data['percentage']
-            skill_level = get_skill_level(percentage)
-            
-            st.session_state.assessment_scores[selected_topic] = {
-                "percentage": percentage,
-                "level": skill_level,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            st.success(f"✅ Assessment Complete!")
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Score", f"{percentage}%")
-            with col2:
-                st.metric("Skill Level", skill_level)
-            with col3:
-                st.metric("Correct Answers", f"{score_data['correct']}/{num_questions}")
-            
-            if st.session_state.current_profile:
-                save_profile(st.session_state.current_profile, {
-                    **st.session_state.profile_config,
-                    "assessment_scores": st.session_state.assessment_scores
-                })
+        st.info(score_data['feedback'])
 
 # ============================================================================
 # TAB 7 - ANALYTICS
@@ -555,7 +630,7 @@ with tab7:
         # Export Options
         st.subheader("📥 Export & Reports")
         
-        col1, col2, col3 = st.columns(3)
+        col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             if st.button("📄 Download TXT Report"):
@@ -569,7 +644,7 @@ with tab7:
         
         with col2:
             if st.button("📊 Download CSV Export"):
-                csv_data = generate_csv_export([st.session_state.current_profile])
+                csv_data = spool_export(iter_csv_export([stats]))
                 st.download_button(
                     label="Download CSV",
                     data=csv_data,
@@ -579,7 +654,7 @@ with tab7:
         
         with col3:
             if st.button("📋 Download JSON Export"):
-                json_data = generate_json_export([st.session_state.current_profile])
+                json_data = spool_export(iter_json_export([stats]))
                 st.download_button(
                     label="Download JSON",
                     data=json_data,
@@ -587,6 +662,16 @@ with tab7:
                     mime="application/json"
                 )
         
+        with col4:
+            if HAS_REPORTLAB and st.button("🧾 Download PDF Report"):
+                report_stats, assessments = profile_report_inputs(st.session_state.current_profile)
+                st.download_button(
+                    label="Download PDF",
+                    data=generate_pdf_report(st.session_state.current_profile, report_stats, assessments),
+                    file_name=f"{st.session_state.current_profile}_report.pdf",
+                    mime="application/pdf"
+                )
+        
         st.divider()
         
         # System Statistics
@@ -599,6 +684,32 @@ with tab7:
             st.metric("Current Session Messages", len(st.session_state.chat_history))
         with col3:
             st.metric("Assessments in System", len(st.session_state.assessment_scores))
+        
+        cohort = get_cohort_stats()
+        if cohort["total_profiles"] > 1:
+            engagement = cohort["engagement"]
+            st.caption("Cohort engagement")
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Average", f"{engagement['mean']:.1f}")
+            with col2:
+                st.metric("Median", f"{engagement['percentiles']['p50']:.1f}")
+            with col3:
+                st.metric("90th Percentile", f"{engagement['percentiles']['p90']:.1f}")
+            with col4:
+                st.metric("Avg. Interactions", f"{cohort['means']['total_interactions']:.1f}")
+            st.dataframe(cohort["by_target_role"], use_container_width=True, hide_index=True)
+        
+        if HAS_REPORTLAB and st.button("🧾 Generate PDF Reports for All Profiles"):
+            output_dir = f"reports/{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            with st.spinner("Rendering reports..."):
+                results = generate_batch_pdf_reports(output_dir)
+            failed = [r for r in results if r["error"]]
+            st.success(f"✅ {len(results) - len(failed)}/{len(results)} reports written to `{output_dir}`")
+            st.dataframe(
+                sorted(results, key=lambda r: r["seconds"], reverse=True),
+                use_container_width=True, hide_index=True
+            )
     else:
         st.info("👉 Create or select a profile in the sidebar to view analytics")
 
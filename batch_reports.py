@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# ============================================================================
+# BATCH PDF REPORTS
+# ============================================================================
+# Render a PDF report for every stored profile (or a chosen few) in parallel.
+#
+#   python batch_reports.py --output reports/cohort --workers 4
+#   python batch_reports.py --profiles alice bob
+
+import argparse
+import time
+from datetime import datetime
+
+from utils.reports import generate_batch_pdf_reports
+
+def main():
+    parser = argparse.ArgumentParser(description="Render PDF reports for stored profiles")
+    parser.add_argument("--output", default=f"reports/{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                        help="Output directory (default: reports/<timestamp>)")
+    parser.add_argument("--profiles", nargs="+", help="Profile names (default: all profiles)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = generate_batch_pdf_reports(args.output, args.profiles, args.workers)
+    elapsed = time.perf_counter() - start
+
+    for result in sorted(results, key=lambda r: r["seconds"], reverse=True):
+        status = f"FAILED: {result['error']}" if result["error"] else result["path"]
+        print(f"{result['seconds']:>8.3f}s  {result['profile_name']:<40} {status}")
+
+    failed = sum(1 for r in results if r["error"])
+    render_time = sum(r["seconds"] for r in results)
+    print(f"\n{len(results) - failed}/{len(results)} reports in {elapsed:.2f}s wall "
+          f"({render_time:.2f}s total render time) -> {args.output}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
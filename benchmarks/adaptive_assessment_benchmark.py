@@ -0,0 +1,78 @@
+# ============================================================================
+# ADAPTIVE ASSESSMENT BENCHMARK
+# ============================================================================
+# Simulated candidates answer a synthetic 2PL item bank. Compares adaptive
+# testing (max-information selection, SE stopping rule) with fixed-length
+# random tests on questions asked and ability-estimate error.
+#
+#   python benchmarks/adaptive_assessment_benchmark.py [--items 200] [--candidates 2000]
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.assessment import (
+    ADAPTIVE_SE_TARGET, estimate_ability, response_probability, select_next_item
+)
+
+def synthetic_bank(items: int, rng: np.random.Generator) -> tuple:
+    """Discrimination and difficulty for a bank of `items` questions"""
+    a = rng.lognormal(mean=0.2, sigma=0.25, size=items)
+    b = rng.normal(0.0, 1.2, size=items)
+    return a, b
+
+def run_adaptive(theta: float, a: np.ndarray, b: np.ndarray, rng: np.random.Generator,
+                 se_target: float, max_questions: int) -> tuple:
+    """Questions used and final estimate for one simulated candidate"""
+    administered, responses = [], []
+    estimate, se = 0.0, 1.0
+    while len(administered) < max_questions and se > se_target:
+        item = select_next_item(estimate, a, b, administered)
+        if item is None:
+            break
+        administered.append(item)
+        responses.append(rng.random() < response_probability(theta, a[item], b[item]))
+        estimate, se = estimate_ability(a[administered], b[administered], np.array(responses))
+    return len(administered), estimate
+
+def run_fixed(theta: float, a: np.ndarray, b: np.ndarray, rng: np.random.Generator, length: int) -> float:
+    """Final estimate after `length` randomly chosen questions"""
+    items = rng.choice(len(a), size=length, replace=False)
+    responses = rng.random(length) < response_probability(theta, a[items], b[items])
+    return estimate_ability(a[items], b[items], responses)[0]
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaptive vs fixed-length assessment simulation")
+    parser.add_argument("--items", type=int, default=200, help="Item bank size")
+    parser.add_argument("--candidates", type=int, default=2000)
+    parser.add_argument("--se-target", type=float, default=ADAPTIVE_SE_TARGET)
+    parser.add_argument("--max-questions", type=int, default=30)
+    parser.add_argument("--fixed-lengths", type=int, nargs="+", default=[5, 10, 15, 20, 30])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    a, b = synthetic_bank(args.items, rng)
+    abilities = rng.normal(0.0, 1.0, size=args.candidates)
+
+    print(f"{args.items} items, {args.candidates} simulated candidates")
+    print(f"{'mode':<28} {'avg questions':>14} {'RMSE':>8}")
+
+    lengths, errors = [], []
+    for theta in abilities:
+        used, estimate = run_adaptive(theta, a, b, rng, args.se_target, args.max_questions)
+        lengths.append(used)
+        errors.append(estimate - theta)
+    label = f"adaptive (SE <= {args.se_target:g})"
+    print(f"{label:<28} {np.mean(lengths):>14.1f} {np.sqrt(np.mean(np.square(errors))):>8.3f}")
+
+    for length in args.fixed_lengths:
+        errors = [run_fixed(theta, a, b, rng, length) - theta for theta in abilities]
+        print(f"{f'fixed random ({length})':<28} {length:>14.1f} {np.sqrt(np.mean(np.square(errors))):>8.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# ============================================================================
+# EXPORT BENCHMARK
+# ============================================================================
+# Time and peak memory of the streaming CSV/JSON exporters vs. building the
+# whole export as one string.
+#
+#   python benchmarks/export_benchmark.py [--sizes 10000 50000 100000]
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.reports import iter_csv_export, iter_json_export
+
+def synthetic_profiles(count: int):
+    """Lazily generate profile stats so the input itself isn't held in memory"""
+    for i in range(count):
+        yield {
+            "profile_name": f"user_{i:06d}",
+            "user_level": ("Beginner", "Intermediate", "Advanced")[i % 3],
+            "target_role": ("Data Scientist", "Web Developer", "ML Engineer")[i % 3],
+            "daily_availability": "2 hours",
+            "timeline": "6 months",
+            "roadmaps_generated": i % 4,
+            "resumes_analyzed": i % 3,
+            "interviews_completed": i % 5,
+            "total_interactions": i % 12,
+            "created_at": "2026-01-15T09:30:00",
+            "updated_at": "2026-10-01T18:45:00",
+        }
+
+def measure(make_chunks, sink) -> tuple:
+    """Run an exporter into `sink`, returning (seconds, peak traced bytes)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    sink(make_chunks())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+def drain(chunks) -> None:
+    """Consume chunks the way a streamed HTTP response would"""
+    for _ in chunks:
+        pass
+
+def materialize(chunks) -> None:
+    """Build the full export string, as the old exporters did"""
+    "".join(chunks)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streaming report exporters")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000, 100_000])
+    args = parser.parse_args()
+
+    exporters = {
+        "csv": lambda n: iter_csv_export(synthetic_profiles(n)),
+        "json": lambda n: iter_json_export(synthetic_profiles(n), total=n),
+    }
+
+    print(f"{'format':<6} {'mode':<8} {'rows':>8} {'seconds':>9} {'us/row':>8} {'peak MiB':>9}")
+    for name, exporter in exporters.items():
+        for mode, sink in (("stream", drain), ("string", materialize)):
+            for size in args.sizes:
+                elapsed, peak = measure(lambda: exporter(size), sink)
+                print(
+                    f"{name:<6} {mode:<8} {size:>8} {elapsed:>9.3f} "
+                    f"{elapsed / size * 1e6:>8.2f} {peak / 2**20:>9.2f}"
+                )
+
+if __name__ == "__main__":
+    main()
@@ -28,8 +28,11 @@ from modules.achievements import render_achievements_page
 from modules.resume_gap_analyzer import render_resume_gap_analyzer
 from modules.market_trends import render_market_trends
 from modules.adaptive_planner import render_adaptive_planner
-from modules.user_history import render_user_history
+from modules.user_history import render_user_history, log_activity, migrate_activity_history
 from utils.profile_manager import ProfileManager
+from utils.profile_buffer import flush_profile_buffer, update_current_profile
+from utils.gamification import record_event
+from utils.activity_store import get_activity_store
 from utils.translations import get_text, get_all_translations
 
 # ── Initialize session state ──────────────────────────────────────────────────
@@ -577,7 +580,10 @@ with st.sidebar:
                 label_visibility="collapsed"
             )
             if selected_profile:
-                st.session_state.current_profile = pm.load_profile(selected_profile)
+                current = st.session_state.current_profile
+                if not current or current.get("name") != selected_profile:
+                    flush_profile_buffer()
+                    st.session_state.current_profile = pm.load_profile(selected_profile)
                 st.success(f"✅ {get_text('profile_loaded', st.session_state.language)} {selected_profile}")
         else:
             st.info(get_text("no_profiles", st.session_state.language))
@@ -586,6 +592,8 @@ with st.sidebar:
         if st.button("🗑️", help=get_text("delete_profile", st.session_state.language)):
             if st.session_state.current_profile:
                 if pm.delete_profile(st.session_state.current_profile["name"]):
+                    get_activity_store().delete(st.session_state.current_profile["name"])
+                    st.session_state.pop("profile_buffer", None)
                     st.session_state.current_profile = None
                     st.rerun()
     
@@ -636,6 +644,7 @@ with st.sidebar:
                         }
                     )
                     st.session_state.current_profile = new_profile
+                    record_event("profile_created")
                     st.success(get_text("profile_created_success", st.session_state.language))
                     st.rerun()
                 else:
@@ -742,6 +751,23 @@ with st.sidebar:
 # ── Main Content Router ───────────────────────────────────────────────────────
 page_key = page.split("  ")[1].strip() if "  " in page else page.strip()
 
+# Leaving a page is a natural checkpoint for buffered profile edits
+if st.session_state.get("last_page") != page_key:
+    flush_profile_buffer()
+    st.session_state.last_page = page_key
+    profile = st.session_state.current_profile
+    if profile:
+        changes = {}
+        if migrate_activity_history(profile):
+            changes["activity_history"] = []  # persisted, or the legacy list is re-imported next session
+        log_activity(profile, page_key)
+        update_current_profile({
+            **changes,
+            "activity_summary": profile["activity_summary"],
+            "streak": profile["streak"],
+        })
+        record_event("activity_logged")
+
 if page_key == "Career Roadmap":
     render_roadmap()
 elif page_key == "Smart Chat":
@@ -0,0 +1,120 @@
+"""
+compression_benchmark.py — Resume Compression Codecs
+Compare ratio and throughput of gzip and zstd (single- and multi-threaded)
+on sample resumes: generated TXT/PDF/DOCX files plus any files given.
+
+    python benchmarks/compression_benchmark.py [files ...] [--large-mb 64] [--repeat 3]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.compression import HAS_ZSTD, compress_stream, decompress_stream
+
+SAMPLE_LINES = [
+    "Jane Doe | jane.doe@example.com | github.com/janedoe",
+    "SKILLS: Python, SQL, Docker, Kubernetes, AWS, React, Machine Learning",
+    "Senior Data Engineer | Acme Corp | 2021-2024",
+    "- Built streaming ETL pipelines processing 2B events/day with Spark and Kafka",
+    "- Cut warehouse costs 35% by partitioning and compacting Parquet tables",
+    "Software Engineer | Initech | 2018-2021",
+    "- Shipped a Flask API serving 4k req/s behind nginx and gunicorn",
+    "EDUCATION: B.Tech Computer Science, XYZ University, 2018",
+    "CERTIFICATIONS: AWS Solutions Architect Associate; CKA",
+]
+
+
+def sample_text(pages):
+    lines = [f"{line} ({page})" for page in range(pages) for line in SAMPLE_LINES * 6]
+    return "\n".join(lines).encode("utf-8")
+
+
+def sample_files(large_mb):
+    """Name → bytes for generated resumes (PDF/DOCX only when their libraries exist)."""
+    samples = {"resume.txt (1 page)": sample_text(1), "resume.txt (5 pages)": sample_text(5)}
+    try:
+        from reportlab.pdfgen import canvas
+        buffer = io.BytesIO()
+        pdf = canvas.Canvas(buffer)
+        for page in range(5):
+            for row, line in enumerate(SAMPLE_LINES * 6):
+                pdf.drawString(40, 800 - row * 14, f"{line} ({page})")
+            pdf.showPage()
+        pdf.save()
+        samples["resume.pdf (5 pages)"] = buffer.getvalue()
+    except ImportError:
+        pass
+    try:
+        from docx import Document
+        document = Document()
+        for line in SAMPLE_LINES * 30:
+            document.add_paragraph(line)
+        buffer = io.BytesIO()
+        document.save(buffer)
+        samples["resume.docx"] = buffer.getvalue()
+    except ImportError:
+        pass
+    if large_mb:
+        text = sample_text(1)
+        samples[f"archive.txt ({large_mb} MB)"] = (text * (large_mb * 2**20 // len(text) + 1))[:large_mb * 2**20]
+    return samples
+
+
+def configurations():
+    threads = max(2, os.cpu_count() or 1)
+    configs = [("gzip-6", "gzip", 6, 1), ("gzip-9", "gzip", 9, 1), (f"gzip-6 x{threads}", "gzip", 6, threads)]
+    if HAS_ZSTD:
+        configs += [("zstd-3", "zstd", 3, 1), ("zstd-19", "zstd", 19, 1), (f"zstd-3 x{threads}", "zstd", 3, threads)]
+    return configs
+
+
+def measure(data, codec, level, threads, repeat):
+    """Best-of-``repeat`` compress and decompress times."""
+    compress_best = decompress_best = float("inf")
+    for _ in range(repeat):
+        compressed = io.BytesIO()
+        start = time.perf_counter()
+        compress_stream(io.BytesIO(data), compressed, codec, level=level, threads=threads)
+        compress_best = min(compress_best, time.perf_counter() - start)
+
+        compressed.seek(0)
+        restored = io.BytesIO()
+        start = time.perf_counter()
+        decompress_stream(compressed, restored, codec)
+        decompress_best = min(decompress_best, time.perf_counter() - start)
+        assert restored.getvalue() == data
+    return len(compressed.getvalue()), compress_best, decompress_best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resume compression codecs")
+    parser.add_argument("files", nargs="*", help="Extra files to include")
+    parser.add_argument("--large-mb", type=int, default=64, help="Size of the large text sample (0 to skip)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    samples = sample_files(args.large_mb)
+    for path in args.files:
+        samples[Path(path).name] = Path(path).read_bytes()
+    if not HAS_ZSTD:
+        print("zstandard not installed: gzip only (pip install zstandard)")
+
+    print(f"{'file':<24} {'codec':<12} {'size':>10} {'ratio':>7} {'comp MB/s':>10} {'decomp MB/s':>12}")
+    for name, data in samples.items():
+        megabytes = len(data) / 2**20
+        for label, codec, level, threads in configurations():
+            size, compress_seconds, decompress_seconds = measure(data, codec, level, threads, args.repeat)
+            print(
+                f"{name:<24} {label:<12} {size:>10} {len(data) / size:>6.2f}x "
+                f"{megabytes / compress_seconds:>10.1f} {megabytes / decompress_seconds:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
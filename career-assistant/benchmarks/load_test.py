@@ -0,0 +1,140 @@
+"""
+load_test.py — Dashboard API Load Test
+Hammer read endpoints with concurrent keep-alive clients and report
+throughput and latency percentiles per endpoint.
+
+    python benchmarks/load_test.py --serve                  # start gunicorn locally
+    python benchmarks/load_test.py --url http://host:5000   # existing server
+"""
+
+import argparse
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+APP_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_PATHS = ["/api/profiles", "/api/stats"]
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_client(host, port, path, deadline, gzip, latencies, errors):
+    """One keep-alive connection issuing requests back to back until ``deadline``."""
+    headers = {"Accept-Encoding": "gzip"} if gzip else {}
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(response.status)
+                continue
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(type(e).__name__)
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=10)
+            continue
+        latencies.append(time.perf_counter() - start)
+    connection.close()
+
+
+def load_endpoint(host, port, path, concurrency, duration, gzip):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    clients = [
+        threading.Thread(target=run_client, args=(host, port, path, deadline, gzip, latencies, errors))
+        for _ in range(concurrency)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / duration,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers):
+    """Launch the production configuration on a free local port."""
+    port = free_port()
+    env = dict(os.environ, DASHBOARD_BIND=f"127.0.0.1:{port}", DASHBOARD_ACCESS_LOG="/dev/null")
+    if workers:
+        env["DASHBOARD_WORKERS"] = str(workers)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "wsgi:app"],
+        cwd=APP_DIR, env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit("gunicorn exited during startup (is it installed?)")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return server, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise SystemExit("gunicorn did not start listening within 30s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the dashboard API")
+    parser.add_argument("--url", default="http://127.0.0.1:5000", help="Server base URL")
+    parser.add_argument("--serve", action="store_true", help="Start gunicorn with gunicorn.conf.py first")
+    parser.add_argument("--workers", type=int, help="Worker count for --serve")
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per endpoint")
+    parser.add_argument("--no-gzip", action="store_true", help="Don't send Accept-Encoding: gzip")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if args.serve:
+        server, url = start_server(args.workers)
+    target = urlsplit(url)
+
+    try:
+        print(f"{url}  concurrency={args.concurrency}  duration={args.duration:g}s  gzip={not args.no_gzip}")
+        print(f"{'path':<20} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+        for path in args.paths:
+            result = load_endpoint(
+                target.hostname, target.port or 80, path,
+                args.concurrency, args.duration, not args.no_gzip,
+            )
+            print(
+                f"{path:<20} {result['requests']:>9} {result['errors']:>7} "
+                f"{result['rps']:>9.0f} {result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f}"
+            )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
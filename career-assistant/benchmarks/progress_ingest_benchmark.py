@@ -0,0 +1,71 @@
+"""
+progress_ingest_benchmark.py — Progress Ingestion Throughput
+Compare one log write per event (the per-activity POST endpoint) with the
+grouped commits of ``/api/progress/batch``.
+
+    python benchmarks/progress_ingest_benchmark.py [--events 2000 10000] [--profiles 50]
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.profile_manager import ProgressTracker
+from utils.progress_ingest import ingest_batch
+
+
+def synthetic_events(count, profiles):
+    """LMS-style events spread round-robin over ``profiles`` learners."""
+    return [
+        {
+            "profile": f"learner_{i % profiles:04d}",
+            "type": "milestone_completed" if i % 5 == 0 else "lesson_viewed",
+            "details": {"course": f"course_{i % 17}", "lesson": i},
+            "timestamp": "2026-10-01T12:00:00",
+        }
+        for i in range(count)
+    ]
+
+
+def per_event(tracker, events):
+    for event in events:
+        tracker.log_activity(event["profile"], event["type"], event["details"])
+
+
+def batched(tracker, events):
+    results, _ = ingest_batch(tracker, events, lambda name: True)
+    assert all(result["status"] == 201 for result in results)
+
+
+def measure(mode, events):
+    data_dir = tempfile.mkdtemp(prefix="ingest-bench-")
+    try:
+        tracker = ProgressTracker(data_dir)
+        start = time.perf_counter()
+        mode(tracker, events)
+        return time.perf_counter() - start
+    finally:
+        shutil.rmtree(data_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark progress ingestion throughput")
+    parser.add_argument("--events", type=int, nargs="+", default=[2000, 10000])
+    parser.add_argument("--profiles", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'mode':<10} {'events':>8} {'profiles':>9} {'seconds':>9} {'events/s':>10}")
+    for count in args.events:
+        events = synthetic_events(count, args.profiles)
+        for name, mode in (("per-event", per_event), ("batch", batched)):
+            elapsed = measure(mode, events)
+            print(f"{name:<10} {count:>8} {args.profiles:>9} {elapsed:>9.3f} {count / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,3 +31,10 @@ HF_MODEL         = os.getenv("HF_MODEL",      "mistralai/Mistral-7B-Instruct-v0.
 # ── Generation Parameters ─────────────────────────────────────────────────────
 MAX_TOKENS       = int(os.getenv("MAX_TOKENS", "2048"))
 TEMPERATURE      = float(os.getenv("TEMPERATURE", "0.7"))
+
+# ── Resume Uploads ────────────────────────────────────────────────────────────
+MAX_UPLOAD_MB          = float(os.getenv("MAX_UPLOAD_MB", "10"))
+MAX_PDF_PAGES          = int(os.getenv("MAX_PDF_PAGES", "50"))
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))  # smaller PDFs stay in-process
+EXTRACTION_WORKERS     = int(os.getenv("EXTRACTION_WORKERS", "4"))
+EXTRACTION_CACHE_SIZE  = int(os.getenv("EXTRACTION_CACHE_SIZE", "64"))  # distinct uploads kept in memory
@@ -1,12 +1,15 @@
 """
 dashboard.py — Flask Web Dashboard
 Web interface for Career Assistant Platform
-Run with: python dashboard.py
+Run with: python dashboard.py  (development server)
+Production: gunicorn -c gunicorn.conf.py wsgi:app
 """
 
-from flask import Flask, render_template, jsonify, request, send_file
+from flask import Flask, render_template, jsonify, request, send_file, Response, stream_with_context
 from flask_cors import CORS
+import gzip
 import json
+import re
 from pathlib import Path
 from datetime import datetime
 import sys
@@ -15,15 +18,114 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from utils.profile_manager import ProfileManager, ProgressTracker
+from utils.profile_manager import ProfileManager, ProgressTracker, ProfileVersionConflict
+from utils.atomic_io import LockTimeout
+from utils.export_import import BulkExportManager
+from utils.activity_store import get_activity_store
+from utils.read_model import DashboardReadModel, InvalidQuery
+from utils.progress_ingest import BatchRejected, ingest_batch, parse_batch
+from utils.event_broker import EventBroker
 
 # Initialize Flask app
-app = Flask(__name__, static_url_path='/static', static_folder='dashboard/static')
+app = Flask(__name__, static_url_path='/static', static_folder='dashboard/static', template_folder='dashboard/templates')
 CORS(app)
 
 # Initialize managers
 profile_mgr = ProfileManager()
 progress_tracker = ProgressTracker()
+event_broker = EventBroker()
+read_model = DashboardReadModel(profile_mgr, progress_tracker, events=event_broker)
+
+
+@app.before_request
+def _start_read_model():
+    # Started lazily so each (possibly forked) server process gets its own watcher
+    read_model.ensure_started()
+
+
+def _conditional_json(payload, etag):
+    """JSON response with validators; answers 304 if the client copy is current."""
+    response = jsonify(payload)
+    response.set_etag(etag)
+    response.last_modified = read_model.last_modified
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _profile_etag(profile_name, profile):
+    """Validator for one profile resource; carries the profile version so it can come back as If-Match."""
+    return f"profile-v{profile.get('version', 0)}-{read_model.resource_etag(profile_name)}"
+
+
+def _if_match_version(value):
+    """
+    Profile version named by an ``If-Match`` header (None for ``*``).
+
+    Accepts the ETag from GET /api/profiles/<name> or a bare version number.
+
+    Raises:
+        ValueError: If the header names neither
+    """
+    value = value.strip()
+    if value == '*':
+        return None
+    if value.startswith('W/'):
+        value = value[2:]
+    value = value.strip('"')
+    match = re.fullmatch(r'profile-v(\d+)-[0-9a-f]+|(\d+)', value)
+    if not match:
+        raise ValueError(f"If-Match {value!r} is not a profile ETag or version")
+    return int(match.group(1) or match.group(2))
+
+
+def _body_version(value):
+    """
+    The ``version`` field of a PUT body as an int (None if absent).
+
+    Raises:
+        ValueError: If it is not a non-negative integer
+    """
+    if value is None:
+        return None
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    raise ValueError(f"version {value!r} is not a non-negative integer")
+
+
+# Text responses at least this large are gzipped for clients that accept it
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+COMPRESSIBLE_TYPES = {
+    'application/json', 'application/javascript', 'text/javascript',
+    'text/html', 'text/css', 'text/csv', 'image/svg+xml'
+}
+
+
+@app.after_request
+def _gzip_response(response):
+    """Compress buffered text responses; streamed bodies (SSE, files) pass through."""
+    if (response.direct_passthrough or response.is_streamed
+            or not 200 <= response.status_code < 300
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_TYPES):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    if request.accept_encodings['gzip'] <= 0:
+        return response
+    data = response.get_data()
+    if len(data) < GZIP_MIN_BYTES:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0))
+    response.headers['Content-Encoding'] = 'gzip'
+    # Same content, different bytes: the validator stays usable but is now weak
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
 
 
 # ── Routes ─────────────────────────────────────────────────────────────────────
@@ -34,16 +136,47 @@ def index():
     return render_template('index.html')
 
 
+PAGING_PARAMS = ('limit', 'cursor', 'fields', 'career_field', 'sort')
+
+
 @app.route('/api/profiles', methods=['GET'])
 def get_profiles():
-    """Get all profiles."""
+    """Get profiles.
+
+    Without query parameters every full profile is returned. With any of
+    ``limit``, ``cursor``, ``fields`` (comma-separated), ``career_field``
+    or ``sort`` (``updated_at``, ``created_at``, ``name``; prefix ``-`` for
+    descending) one page is returned along with ``next_cursor``.
+    """
     try:
-        profiles = profile_mgr.list_profiles()
-        return jsonify({
+        if not any(param in request.args for param in PAGING_PARAMS):
+            profiles = read_model.list_profiles()
+            return _conditional_json({
+                "success": True,
+                "data": profiles,
+                "count": len(profiles)
+            }, f"profiles-{read_model.etag}")
+        
+        fields = [f for f in request.args.get('fields', '').split(',') if f] or None
+        profiles, next_cursor, total = read_model.page_profiles(
+            limit=request.args.get('limit', 50, type=int),
+            cursor=request.args.get('cursor'),
+            career_field=request.args.get('career_field'),
+            sort=request.args.get('sort', '-updated_at'),
+            fields=fields,
+        )
+        return _conditional_json({
             "success": True,
             "data": profiles,
-            "count": len(profiles)
-        })
+            "count": len(profiles),
+            "total": total,
+            "next_cursor": next_cursor
+        }, f"profiles-{read_model.etag}")
+    except InvalidQuery as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             "success": False,
@@ -55,24 +188,24 @@ def get_profiles():
 def get_profile(profile_name):
     """Get a specific profile."""
     try:
-        profile = profile_mgr.load_profile(profile_name)
+        profile = read_model.get_profile(profile_name)
         if not profile:
             return jsonify({
                 "success": False,
                 "error": "Profile not found"
             }), 404
         
-        stats = profile_mgr.get_profile_stats(profile_name)
-        progress_stats = progress_tracker.get_statistics(profile_name)
+        stats = read_model.get_profile_stats(profile_name)
+        progress_stats = read_model.get_progress_stats(profile_name)
         
-        return jsonify({
+        return _conditional_json({
             "success": True,
             "data": {
                 "profile": profile,
                 "stats": stats,
                 "progress": progress_stats
             }
-        })
+        }, _profile_etag(profile_name, profile))
     except Exception as e:
         return jsonify({
             "success": False,
@@ -82,10 +215,30 @@ def get_profile(profile_name):
 
 @app.route('/api/profiles/<profile_name>', methods=['PUT'])
 def update_profile(profile_name):
-    """Update a profile."""
+    """Update a profile.
+
+    Send the ETag you last read as ``If-Match`` to get a 412 (or the version
+    as a ``version`` field to get a 409) instead of overwriting someone
+    else's newer changes. A malformed version, or a header and body that
+    name different versions, is a 400.
+    """
+    if_match = request.headers.get('If-Match')
     try:
-        data = request.json
-        profile = profile_mgr.update_profile(profile_name, data)
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({"success": False, "error": "Body must be a JSON object"}), 400
+        try:
+            expected_version = _body_version(data.get('version'))
+            if if_match is not None:
+                header_version = _if_match_version(if_match)
+                if expected_version is not None and header_version is not None and header_version != expected_version:
+                    raise ValueError(f"If-Match names version {header_version} but the body says {expected_version}")
+                if header_version is not None:
+                    expected_version = header_version
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+        profile = profile_mgr.update_profile(profile_name, data, expected_version=expected_version)
+        read_model.refresh_profile(profile_name)
         
         if not profile:
             return jsonify({
@@ -97,6 +250,17 @@ def update_profile(profile_name):
             "success": True,
             "data": profile
         })
+    except ProfileVersionConflict as e:
+        return jsonify({
+            "success": False,
+            "error": str(e),
+            "current_version": e.current_version
+        }), 412 if if_match is not None else 409
+    except LockTimeout as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 503, {'Retry-After': '1'}
     except Exception as e:
         return jsonify({
             "success": False,
@@ -109,6 +273,9 @@ def delete_profile(profile_name):
     """Delete a profile."""
     try:
         success = profile_mgr.delete_profile(profile_name)
+        if success:
+            get_activity_store().delete(profile_name)
+            read_model.refresh_profile(profile_name)
         
         if not success:
             return jsonify({
@@ -196,6 +363,7 @@ def log_progress(profile_name):
             data.get('type', 'activity'),
             data.get('details', {})
         )
+        read_model.refresh_profile(profile_name)
         
         return jsonify({
             "success": True,
@@ -208,32 +376,52 @@ def log_progress(profile_name):
         }), 500
 
 
+@app.route('/api/progress/batch', methods=['POST'])
+def log_progress_batch():
+    """Log many activities across profiles in one request.
+    
+    Accepts NDJSON (``Content-Type: application/x-ndjson``) or a JSON array
+    of ``{"profile", "type", "details", "timestamp"}`` events. Each profile's
+    events are committed with a single log write. Answers 201 when every
+    event was stored, otherwise 207 with a status per event.
+    """
+    try:
+        items = parse_batch(request.get_data(), request.content_type)
+    except BatchRejected as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+    
+    try:
+        results, committed = ingest_batch(
+            progress_tracker, items, lambda name: read_model.get_profile(name) is not None
+        )
+        for profile_name in committed:
+            read_model.refresh_profile(profile_name)
+        
+        accepted = sum(1 for result in results if result["status"] == 201)
+        return jsonify({
+            "success": accepted == len(results),
+            "accepted": accepted,
+            "rejected": len(results) - accepted,
+            "results": results
+        }), 201 if accepted == len(results) else 207
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
 @app.route('/api/stats', methods=['GET'])
 def get_dashboard_stats():
     """Get overall dashboard statistics."""
     try:
-        profiles = profile_mgr.list_profiles()
-        total_profiles = len(profiles)
-        
-        total_activities = 0
-        total_completed = 0
-        
-        for profile in profiles:
-            stats = progress_tracker.get_statistics(profile.get('name', ''))
-            total_activities += stats.get('total_activities', 0)
-            # Count completed activities
-            completed = stats.get('activity_types', {}).get('milestone_completed', 0)
-            total_completed += completed
-        
-        return jsonify({
+        return _conditional_json({
             "success": True,
-            "data": {
-                "total_profiles": total_profiles,
-                "total_activities": total_activities,
-                "total_completed": total_completed,
-                "recent_profiles": profiles[:5]
-            }
-        })
+            "data": read_model.dashboard_stats()
+        }, f"stats-{read_model.etag}")
     except Exception as e:
         return jsonify({
             "success": False,
@@ -241,6 +429,54 @@ def get_dashboard_stats():
         }), 500
 
 
+@app.route('/api/events', methods=['GET'])
+def stream_events():
+    """Live dashboard deltas as server-sent events."""
+    # Ids from another process (or server restart) get a "resync" event
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    
+    response = Response(
+        stream_with_context(event_broker.stream(last_event_id)),
+        mimetype='text/event-stream'
+    )
+    response.cache_control.no_cache = True
+    response.headers['X-Accel-Buffering'] = 'no'  # don't let nginx buffer the stream
+    return response
+
+
+# Upper bound on the client-chosen render threads for a ZIP export
+EXPORT_MAX_WORKERS = 8
+
+
+@app.route('/api/export/profiles.zip', methods=['GET'])
+def export_all_profiles():
+    """Stream every profile (JSON, Markdown, HTML) as one ZIP download."""
+    formats = tuple(f for f in request.args.get('formats', 'json,md,html').split(',') if f in ('json', 'md', 'html'))
+    chunks = BulkExportManager.iter_profiles_zip(
+        profile_mgr.iter_profiles(),
+        formats=formats or ('json',),
+        workers=max(1, min(request.args.get('workers', 4, type=int), EXPORT_MAX_WORKERS)),
+    )
+    filename = f"profiles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    return Response(stream_with_context(chunks), mimetype='application/zip', headers={
+        'Content-Disposition': f'attachment; filename={filename}'
+    })
+
+
+@app.route('/api/export/backup.zip', methods=['GET'])
+def export_backup():
+    """Stream a full backup (profiles + progress logs) as one ZIP download."""
+    chunks = BulkExportManager.iter_backup_zip(
+        profile_mgr.iter_profiles(),
+        progress_tracker.iter_activity_logs(),
+        data_files=get_activity_store().iter_files(),
+    )
+    filename = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    return Response(stream_with_context(chunks), mimetype='application/zip', headers={
+        'Content-Disposition': f'attachment; filename={filename}'
+    })
+
+
 # ── Error Handlers ─────────────────────────────────────────────────────────────
 
 @app.errorhandler(404)
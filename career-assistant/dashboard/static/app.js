@@ -1,13 +1,17 @@
 // ── Dashboard Application ────────────────────────────────────────────────────
 
 const API_BASE = '/api';
+const RECENT_PROFILES_LIMIT = 5;
 let profileChart, activityChart, skillsChart, progressChart;
+let dashboardStats = null;  // last /api/stats payload, kept current by live events
+let eventSource = null;
 
 // ── Initialize Dashboard ─────────────────────────────────────────────────────
 document.addEventListener('DOMContentLoaded', () => {
     initializeEventListeners();
     loadDashboardStats();
     loadProfiles();
+    connectLiveUpdates();
 });
 
 function initializeEventListeners() {
@@ -28,8 +32,8 @@ function initializeEventListeners() {
         });
     }
     
-    // Buttons
-    document.getElementById('sync-btn').addEventListener('click', loadDashboardStats);
+    // Buttons (sync stays as a manual full reload next to the live stream)
+    document.getElementById('sync-btn').addEventListener('click', resyncDashboard);
     document.getElementById('add-profile-btn').addEventListener('click', openNewProfileModal);
     document.getElementById('export-all-btn').addEventListener('click', exportAllProfiles);
     document.getElementById('import-btn').addEventListener('click', importProfiles);
@@ -89,40 +93,43 @@ function switchView(viewName) {
 async function loadDashboardStats() {
     try {
         const response = await axios.get(`${API_BASE}/stats`);
-        const data = response.data.data;
-        
-        // Update stat cards
-        document.getElementById('total-profiles').textContent = data.total_profiles;
-        document.getElementById('total-activities').textContent = data.total_activities;
-        document.getElementById('total-completed').textContent = data.total_completed;
-        
-        const rate = data.total_activities > 0 
-            ? Math.round((data.total_completed / data.total_activities) * 100)
-            : 0;
-        document.getElementById('completion-rate').textContent = `${rate}%`;
-        
-        // Update recent profiles
-        const recentList = document.getElementById('recent-profiles');
-        recentList.innerHTML = '';
-        
-        if (data.recent_profiles.length > 0) {
-            data.recent_profiles.forEach(profile => {
-                const item = createProfileItem(profile);
-                recentList.appendChild(item);
-            });
-        } else {
-            recentList.innerHTML = '<p class="text-muted">No profiles yet</p>';
-        }
-        
-        // Create charts
-        createProfileChart(data);
-        createActivityChart(data);
-        
+        dashboardStats = response.data.data;
+        renderDashboardStats();
+        createActivityChart(dashboardStats);
     } catch (error) {
         console.error('Error loading dashboard stats:', error);
     }
 }
 
+function renderDashboardStats() {
+    const data = dashboardStats;
+    
+    // Update stat cards
+    document.getElementById('total-profiles').textContent = data.total_profiles;
+    document.getElementById('total-activities').textContent = data.total_activities;
+    document.getElementById('total-completed').textContent = data.total_completed;
+    
+    const rate = data.total_activities > 0 
+        ? Math.round((data.total_completed / data.total_activities) * 100)
+        : 0;
+    document.getElementById('completion-rate').textContent = `${rate}%`;
+    
+    // Update recent profiles
+    const recentList = document.getElementById('recent-profiles');
+    recentList.innerHTML = '';
+    
+    if (data.recent_profiles.length > 0) {
+        data.recent_profiles.forEach(profile => {
+            const item = createProfileItem(profile);
+            recentList.appendChild(item);
+        });
+    } else {
+        recentList.innerHTML = '<p class="text-muted">No profiles yet</p>';
+    }
+    
+    createProfileChart(data);
+}
+
 function createProfileItem(profile) {
     const div = document.createElement('div');
     div.className = 'profile-item';
@@ -137,12 +144,23 @@ function createProfileItem(profile) {
     return div;
 }
 
+function profileChartData(data) {
+    return [
+        Math.max(1, data.total_profiles - data.total_completed),
+        data.total_completed,
+        1
+    ];
+}
+
 function createProfileChart(data) {
     const ctx = document.getElementById('profileChart');
     if (!ctx) return;
     
+    // Live updates reuse the chart instead of rebuilding it
     if (profileChart) {
-        profileChart.destroy();
+        profileChart.data.datasets[0].data = profileChartData(data);
+        profileChart.update('none');
+        return;
     }
     
     profileChart = new Chart(ctx, {
@@ -150,11 +168,7 @@ function createProfileChart(data) {
         data: {
             labels: ['Active', 'Completed', 'Pending'],
             datasets: [{
-                data: [
-                    Math.max(1, data.total_profiles - data.total_completed),
-                    data.total_completed,
-                    1
-                ],
+                data: profileChartData(data),
                 backgroundColor: ['#6C63FF', '#43E97B', '#FF6584'],
                 borderColor: '#141528',
                 borderWidth: 2
@@ -222,42 +236,194 @@ function createActivityChart(data) {
     });
 }
 
+// ── Live Updates ─────────────────────────────────────────────────────────────
+// Server-sent events from /api/events carry one delta per changed profile or
+// progress log. EventSource reconnects on its own and resumes from the last
+// event id; the server answers "resync" when it can't replay what was missed.
+function connectLiveUpdates() {
+    if (!('EventSource' in window)) return;
+    
+    eventSource = new EventSource(`${API_BASE}/events`);
+    eventSource.addEventListener('profile-created', (e) => applyProfileChange(JSON.parse(e.data), true));
+    eventSource.addEventListener('profile-updated', (e) => applyProfileChange(JSON.parse(e.data), false));
+    eventSource.addEventListener('profile-deleted', (e) => applyProfileDeleted(JSON.parse(e.data)));
+    eventSource.addEventListener('progress-updated', (e) => applyProgressUpdate(JSON.parse(e.data)));
+    eventSource.addEventListener('resync', resyncDashboard);
+}
+
+function resyncDashboard() {
+    loadDashboardStats();
+    if (profilePager) {
+        loadProfiles();
+    }
+}
+
+function applyProfileChange(profile, created) {
+    if (dashboardStats) {
+        if (created) {
+            dashboardStats.total_profiles += 1;
+            dashboardStats.total_activities += profile.activities;
+            dashboardStats.total_completed += profile.completed;
+        }
+        // Most recently updated first, so a change moves the profile to the top
+        const recent = dashboardStats.recent_profiles.filter(p => p.name !== profile.name);
+        dashboardStats.recent_profiles = [profile, ...recent].slice(0, RECENT_PROFILES_LIMIT);
+        renderDashboardStats();
+    }
+    
+    // Same ordering in the profiles grid: replace the card at the top
+    const profilesList = document.getElementById('profiles-list');
+    if (!profilePager || !profilesList) return;
+    const existing = findProfileCard(profile.name);
+    if (existing) {
+        existing.remove();
+    } else if (!created) {
+        return;  // not loaded yet; it will arrive with its page
+    }
+    if (!profilesList.querySelector('.profile-card')) {
+        profilesList.innerHTML = '';  // drop the "No profiles yet" placeholder
+    }
+    profilesList.prepend(createProfileCard(profile));
+}
+
+function applyProfileDeleted({ name, activities, completed }) {
+    if (dashboardStats) {
+        dashboardStats.total_profiles = Math.max(0, dashboardStats.total_profiles - 1);
+        dashboardStats.total_activities = Math.max(0, dashboardStats.total_activities - activities);
+        dashboardStats.total_completed = Math.max(0, dashboardStats.total_completed - completed);
+        const recent = dashboardStats.recent_profiles.filter(p => p.name !== name);
+        if (recent.length < dashboardStats.recent_profiles.length && dashboardStats.total_profiles > recent.length) {
+            loadDashboardStats();  // refill the recent list from the server
+        } else {
+            dashboardStats.recent_profiles = recent;
+            renderDashboardStats();
+        }
+    }
+    
+    const card = findProfileCard(name);
+    if (card) {
+        card.remove();
+    }
+}
+
+function applyProgressUpdate({ delta_activities: activities, delta_completed: completed }) {
+    if (dashboardStats) {
+        dashboardStats.total_activities = Math.max(0, dashboardStats.total_activities + activities);
+        dashboardStats.total_completed = Math.max(0, dashboardStats.total_completed + completed);
+        renderDashboardStats();
+    }
+    
+    // Count new activity against today's point on the weekly chart
+    if (activityChart && activities > 0) {
+        const today = (new Date().getDay() + 6) % 7;  // Mon = 0
+        activityChart.data.datasets[0].data[today] += activities;
+        activityChart.update('none');
+    }
+}
+
+function findProfileCard(name) {
+    return Array.from(document.querySelectorAll('#profiles-list .profile-card'))
+        .find(card => card.dataset.name === name);
+}
+
 // ── Profiles Management ───────────────────────────────────────────────────────
+const PROFILE_PAGE_SIZE = 24;
+const PROFILE_LIST_FIELDS = 'name,career_field,experience_level,updated_at';
+let profilePager = null;
+
+function createProfileCard(profile) {
+    const card = document.createElement('div');
+    card.className = 'profile-card';
+    card.dataset.name = profile.name;
+    card.innerHTML = `
+        <h3>${profile.name}</h3>
+        <div class="profile-info">
+            <strong>Field:</strong> ${profile.career_field}
+        </div>
+        <div class="profile-info">
+            <strong>Level:</strong> ${profile.experience_level}
+        </div>
+        <div class="profile-info">
+            <strong>Updated:</strong> ${new Date(profile.updated_at).toLocaleDateString()}
+        </div>
+        <span class="profile-badge">View Details →</span>
+    `;
+    card.addEventListener('click', () => openProfileDetail(profile.name));
+    return card;
+}
+
+function isNearViewport(element) {
+    return element.getBoundingClientRect().top < window.innerHeight + 200;
+}
+
 async function loadProfiles() {
+    // Start over: drop any pager (and in-flight page) from a previous load
+    if (profilePager && profilePager.observer) {
+        profilePager.observer.disconnect();
+    }
+    
+    const profilesList = document.getElementById('profiles-list');
+    profilesList.innerHTML = '';
+    
+    let sentinel = document.getElementById('profiles-sentinel');
+    if (!sentinel) {
+        sentinel = document.createElement('div');
+        sentinel.id = 'profiles-sentinel';
+        profilesList.insertAdjacentElement('afterend', sentinel);
+    }
+    
+    profilePager = { cursor: null, done: false, loading: false, observer: null, sentinel };
+    
+    if ('IntersectionObserver' in window) {
+        profilePager.observer = new IntersectionObserver((entries) => {
+            if (entries.some(entry => entry.isIntersecting)) {
+                loadNextProfilesPage();
+            }
+        }, { rootMargin: '200px' });
+        profilePager.observer.observe(sentinel);
+    }
+    
+    await loadNextProfilesPage();
+}
+
+async function loadNextProfilesPage() {
+    const pager = profilePager;
+    if (!pager || pager.loading || pager.done) return;
+    pager.loading = true;
+    
     try {
-        const response = await axios.get(`${API_BASE}/profiles`);
-        const profiles = response.data.data;
+        const params = { limit: PROFILE_PAGE_SIZE, fields: PROFILE_LIST_FIELDS };
+        if (pager.cursor) params.cursor = pager.cursor;
+        const response = await axios.get(`${API_BASE}/profiles`, { params });
+        if (pager !== profilePager) return;  // superseded by a newer loadProfiles()
         
+        const { data: profiles, next_cursor: nextCursor } = response.data;
         const profilesList = document.getElementById('profiles-list');
-        profilesList.innerHTML = '';
         
-        if (profiles.length === 0) {
+        if (!pager.cursor && profiles.length === 0) {
             profilesList.innerHTML = '<p class="text-muted">No profiles yet. Create one to get started!</p>';
-            return;
         }
         
-        profiles.forEach(profile => {
-            const card = document.createElement('div');
-            card.className = 'profile-card';
-            card.innerHTML = `
-                <h3>${profile.name}</h3>
-                <div class="profile-info">
-                    <strong>Field:</strong> ${profile.career_field}
-                </div>
-                <div class="profile-info">
-                    <strong>Level:</strong> ${profile.experience_level}
-                </div>
-                <div class="profile-info">
-                    <strong>Updated:</strong> ${new Date(profile.updated_at).toLocaleDateString()}
-                </div>
-                <span class="profile-badge">View Details →</span>
-            `;
-            card.addEventListener('click', () => openProfileDetail(profile.name));
-            profilesList.appendChild(card);
-        });
+        const fragment = document.createDocumentFragment();
+        profiles.forEach(profile => fragment.appendChild(createProfileCard(profile)));
+        profilesList.appendChild(fragment);
         
+        pager.cursor = nextCursor;
+        pager.done = !nextCursor;
+        if (pager.done && pager.observer) {
+            pager.observer.disconnect();
+        }
     } catch (error) {
         console.error('Error loading profiles:', error);
+        pager.done = true;
+    } finally {
+        pager.loading = false;
+    }
+    
+    // The observer only fires on changes, so keep filling a tall viewport
+    // (or page through everything when IntersectionObserver is unavailable)
+    if (!pager.done && pager === profilePager && (!pager.observer || isNearViewport(pager.sentinel))) {
+        loadNextProfilesPage();
     }
 }
 
@@ -441,8 +607,8 @@ async function loadAnalytics() {
 
 // ── Data Management ──────────────────────────────────────────────────────────
 function exportAllProfiles() {
-    // Trigger download of all profiles as JSON
-    alert('Export would download all profiles as JSON file');
+    // Streamed ZIP download: the browser writes it to disk as it arrives
+    window.location.href = `${API_BASE}/export/profiles.zip`;
 }
 
 function importProfiles() {
@@ -0,0 +1,46 @@
+"""
+gunicorn.conf.py — Multi-Worker Serving for the Web Dashboard
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Every setting can be overridden with ``DASHBOARD_*`` environment
+variables (or regular gunicorn flags).
+"""
+
+import multiprocessing
+import os
+
+
+bind = os.getenv("DASHBOARD_BIND", "0.0.0.0:5000")
+
+# Threaded workers: /api/events holds a connection open per dashboard tab,
+# which would pin a whole sync worker.
+worker_class = "gthread"
+workers = int(os.getenv("DASHBOARD_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("DASHBOARD_THREADS", "8"))
+
+# Load the app (and its read model) once in the master; workers fork warm.
+preload_app = True
+
+# Graceful recycling: each worker is replaced after roughly this many
+# requests (jittered so they don't all restart at once) and gets
+# graceful_timeout seconds to finish in-flight requests.
+max_requests = int(os.getenv("DASHBOARD_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("DASHBOARD_MAX_REQUESTS_JITTER", "200"))
+graceful_timeout = int(os.getenv("DASHBOARD_GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("DASHBOARD_TIMEOUT", "60"))
+keepalive = 5
+
+accesslog = os.getenv("DASHBOARD_ACCESS_LOG", "-")
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    # Start the watcher now instead of on the worker's first request
+    from dashboard import read_model
+    read_model.ensure_started()
+
+
+def worker_exit(server, worker):
+    from dashboard import read_model
+    read_model.stop()
@@ -8,6 +8,7 @@ import streamlit as st
 from utils.model import query_model
 from prompts.chat_prompt import get_chat_system_prompt
 from utils.translations import get_text
+from utils.gamification import record_event
 
 
 def render_chat():
@@ -119,6 +120,7 @@ def render_chat():
             "role": "user",
             "content": user_input
         })
+        record_event("chat_message_sent")
 
         # Display user message immediately
         with st.chat_message("user"):
@@ -3,11 +3,13 @@ gap_analysis.py — Skill Gap Analysis Module
 Analyze gaps between current skills and target role requirements.
 """
 
+import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
 from modules.chat import query_model
+from utils.role_fit import RoleFitMatrix
 
 
 # Job role skill requirements database
@@ -109,19 +111,29 @@ def get_role_requirements(role):
     return ROLE_REQUIREMENTS.get(role, {})
 
 
+# This page's own role table only: the resume analyzer's merged matrix
+# (ROLE_FIT) renames and adds skills, which would disagree with
+# get_role_requirements. That one is for ranking best-fit roles.
+GAP_MATRIX = RoleFitMatrix(ROLE_REQUIREMENTS)
+
+
 def calculate_gaps(current_skills, target_role):
-    """Calculate skill gaps between current and target."""
-    required = get_role_requirements(target_role)
-    
+    """Calculate skill gaps between current and target, via the role-fit matrix."""
+    role = GAP_MATRIX.role_index.get(target_role)
+    if role is None:
+        return {}
+    current = GAP_MATRIX.candidate_vector(current_skills)
+    role_gaps = GAP_MATRIX.gaps(current)[role]
+
     gaps = {}
-    for skill, required_level in required.items():
-        current_level = current_skills.get(skill, 0)
-        gap = required_level - current_level
-        gaps[skill] = {
+    for column in np.flatnonzero(GAP_MATRIX.mask[role]):
+        required_level = float(GAP_MATRIX.required[role, column])
+        current_level = float(current[column])
+        gaps[GAP_MATRIX.skills[column]] = {
             "current": current_level,
             "required": required_level,
-            "gap": gap,
-            "percentage_complete": (current_level / required_level * 100) if required_level > 0 else 0
+            "gap": float(role_gaps[column]),
+            "percentage_complete": current_level / required_level * 100
         }
     
     return gaps
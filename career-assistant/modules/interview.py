@@ -14,6 +14,7 @@ from prompts.interview_prompt import (
     get_interview_eval_prompt,
     get_interview_summary_prompt,
 )
+from utils.gamification import record_event
 
 
 QUESTION_TYPES = [
@@ -230,6 +231,8 @@ def _render_active_interview():
         })
         st.session_state["awaiting_answer"] = False
         st.session_state["current_question"] = None
+        if len(st.session_state["interview_session"]) >= total_q:
+            record_event("interview_completed")
         st.rerun()
 
     if submit_answer and answer.strip():
@@ -248,6 +251,8 @@ def _render_active_interview():
         })
         st.session_state["awaiting_answer"] = False
         st.session_state["current_question"] = None
+        if len(st.session_state["interview_session"]) >= total_q:
+            record_event("interview_completed")
         st.rerun()
 
 
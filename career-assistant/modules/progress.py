@@ -10,6 +10,8 @@ import plotly.graph_objects as go
 import plotly.express as px
 from modules.chat import query_model
 from prompts.skills_prompt import get_progress_tracking_prompt
+from utils.profile_buffer import update_current_profile
+from utils.gamification import record_event
 
 
 def render_progress():
@@ -129,9 +131,9 @@ def render_progress_overview(profile):
                 "title": milestone,
                 "date": str(log_date)
             })
-            # Save to profile
-            profile["progress_data"] = progress_data
-            st.session_state.profile_manager.update_profile(profile["name"], {"progress_data": progress_data})
+            # Save to profile (buffered, written out shortly)
+            update_current_profile({"progress_data": progress_data})
+            record_event("milestone_completed")
             st.success(f"✨ Milestone '{milestone}' logged!")
             st.rerun()
     
@@ -142,9 +144,8 @@ def render_progress_overview(profile):
                 "skill": skill,
                 "start_date": str(log_date)
             })
-            # Save to profile
-            profile["progress_data"] = progress_data
-            st.session_state.profile_manager.update_profile(profile["name"], {"progress_data": progress_data})
+            # Save to profile (buffered, written out shortly)
+            update_current_profile({"progress_data": progress_data})
             st.success(f"🎯 Started learning '{skill}'!")
             st.rerun()
     
@@ -157,9 +158,9 @@ def render_progress_overview(profile):
                 "description": description,
                 "date": str(log_date)
             })
-            # Save to profile
-            profile["progress_data"] = progress_data
-            st.session_state.profile_manager.update_profile(profile["name"], {"progress_data": progress_data})
+            # Save to profile (buffered, written out shortly)
+            update_current_profile({"progress_data": progress_data})
+            record_event("project_completed")
             st.success(f"🚀 Project '{project}' logged!")
             st.rerun()
     
@@ -172,9 +173,8 @@ def render_progress_overview(profile):
                 "level": improvement_level,
                 "date": str(log_date)
             })
-            # Save to profile
-            profile["progress_data"] = progress_data
-            st.session_state.profile_manager.update_profile(profile["name"], {"progress_data": progress_data})
+            # Save to profile (buffered, written out shortly)
+            update_current_profile({"progress_data": progress_data})
             st.success(f"📈 Improvement in '{skill_name}' logged!")
             st.rerun()
     
@@ -239,6 +239,8 @@ def render_milestones_tracker(profile):
                         "title": milestone,
                         "date": datetime.now().strftime("%Y-%m-%d")
                     })
+                    update_current_profile({"progress_data": progress_data})
+                    record_event("milestone_completed")
                     st.success("✅ Milestone completed!")
                     st.rerun()
     
@@ -6,27 +6,22 @@ Enhanced with file upload and compression features.
 """
 
 import streamlit as st
-import os
-import gzip
-import shutil
-from io import BytesIO
+import tempfile
+from datetime import datetime
 from pathlib import Path
+from config import MAX_UPLOAD_MB
 from utils.model import query_model
-from prompts.resume_prompt import RESUME_SYSTEM_PROMPT, get_resume_user_prompt
+from prompts.resume_prompt import RESUME_PROMPT_VERSION, RESUME_SYSTEM_PROMPT, get_resume_user_prompt
+from utils.analysis_cache import analysis_fingerprint, get_analysis_cache
+from utils.compression import (
+    MIME_TYPES, SUFFIXES, available_codecs, compress_stream, decompress_stream, default_codec,
+)
+from utils.gamification import record_event
+from utils.text_extraction import ExtractionError, extract_upload
 
-# Try importing file handling libraries
-try:
-    from PyPDF2 import PdfReader
-    HAS_PDF = True
-except ImportError:
-    HAS_PDF = False
-
-try:
-    from docx import Document
-    HAS_DOCX = True
-except ImportError:
-    HAS_DOCX = False
 
+# Compressed/decompressed files above this size spill from memory to a temp file
+SPOOL_MAX_BYTES = 4 * 1024 * 1024
 
 # Sample resume for quick testing
 SAMPLE_RESUME = """John Doe
@@ -53,60 +48,39 @@ CERTIFICATIONS
 """
 
 
-def extract_text_from_pdf(pdf_file):
-    """Extract text from PDF file."""
-    if not HAS_PDF:
-        st.error("❌ PDF support not installed. Please run: pip install PyPDF2")
-        return None
-    
+def _extract_file_text(file, suffix):
+    """Read a file-like object and extract its text through the shared cache."""
     try:
-        pdf_reader = PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
-    except Exception as e:
-        st.error(f"❌ Error reading PDF: {str(e)}")
+        data = file.getvalue() if hasattr(file, "getvalue") else file.read()
+        return extract_upload(data, f"upload{suffix}")[1]
+    except ExtractionError as e:
+        st.error(f"❌ {e}")
         return None
 
 
+def extract_text_from_pdf(pdf_file):
+    """Extract text from PDF file."""
+    return _extract_file_text(pdf_file, ".pdf")
+
+
 def extract_text_from_docx(docx_file):
     """Extract text from DOCX file."""
-    if not HAS_DOCX:
-        st.error("❌ DOCX support not installed. Please run: pip install python-docx")
-        return None
-    
-    try:
-        doc = Document(docx_file)
-        text = ""
-        for para in doc.paragraphs:
-            text += para.text + "\n"
-        return text
-    except Exception as e:
-        st.error(f"❌ Error reading DOCX: {str(e)}")
-        return None
+    return _extract_file_text(docx_file, ".docx")
 
 
-def compress_file(input_file, filename):
-    """Compress file using gzip."""
+def compress_file(input_file, filename, codec=None):
+    """Compress a file-like object chunk by chunk (zstd when available, else gzip)."""
     try:
-        output_filename = f"{Path(filename).stem}_compressed.gz"
-        
-        # Read input file
-        with open(input_file, 'rb') as f_in:
-            file_data = f_in.read()
-        
-        # Compress
-        compressed_data = BytesIO()
-        with gzip.GzipFile(fileobj=compressed_data, mode='wb') as gz:
-            gz.write(file_data)
+        codec = codec or default_codec()
+        output_filename = f"{Path(filename).stem}_compressed{SUFFIXES[codec]}"
         
+        # Spills to disk past SPOOL_MAX_BYTES instead of growing in memory
+        compressed_data = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        original_size, compressed_size = compress_stream(input_file, compressed_data, codec)
         compressed_data.seek(0)
         
         # Calculate compression ratio
-        original_size = len(file_data)
-        compressed_size = len(compressed_data.getvalue())
-        ratio = (1 - compressed_size / original_size) * 100
+        ratio = (1 - compressed_size / original_size) * 100 if original_size else 0.0
         
         return compressed_data, output_filename, original_size, compressed_size, ratio
     
@@ -115,12 +89,11 @@ def compress_file(input_file, filename):
         return None, None, None, None, None
 
 
-def decompress_file(gz_file, output_filename):
-    """Decompress gzip file."""
+def decompress_file(compressed_file, output_filename):
+    """Decompress a gzip or zstd file, refusing output larger than MAX_UPLOAD_MB."""
     try:
-        output_data = BytesIO()
-        with gzip.GzipFile(fileobj=gz_file) as gz:
-            output_data.write(gz.read())
+        output_data = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        decompress_stream(compressed_file, output_data, max_bytes=int(MAX_UPLOAD_MB * 1024 * 1024))
         
         output_data.seek(0)
         return output_data
@@ -206,23 +179,13 @@ def render_resume():
             file_size = uploaded_file.size / 1024  # KB
             st.info(f"📄 **File:** {filename} | **Size:** {file_size:.2f} KB | **Type:** {file_type}")
 
-            # Extract text based on file type
-            if filename.endswith('.txt'):
-                resume_text = uploaded_file.read().decode('utf-8')
-            
-            elif filename.endswith('.pdf'):
-                if HAS_PDF:
-                    resume_text = extract_text_from_pdf(uploaded_file)
-                else:
-                    st.warning("⚠️ PDF support not installed. Install with: `pip install PyPDF2`")
-                    resume_text = ""
-            
-            elif filename.endswith('.docx'):
-                if HAS_DOCX:
-                    resume_text = extract_text_from_docx(uploaded_file)
-                else:
-                    st.warning("⚠️ DOCX support not installed. Install with: `pip install python-docx`")
-                    resume_text = ""
+            # Extracted once per distinct file; reruns hit the cache
+            try:
+                digest, resume_text = extract_upload(uploaded_file.getvalue(), filename)
+                st.session_state.resume_text_hash = digest
+            except ExtractionError as e:
+                st.warning(f"⚠️ {e}")
+                resume_text = ""
 
             if resume_text:
                 # Show extracted text preview
@@ -233,14 +196,14 @@ def render_resume():
 
     # ── Mode 3: Upload Compressed File ────────────────────────────────────────
     elif input_mode == "🗜️ Upload Compressed File":
-        st.markdown("#### Upload Compressed Resume (.gz file)")
+        st.markdown("#### Upload Compressed Resume (.gz / .zst file)")
         
         col_decomp1, col_decomp2 = st.columns(2)
         
         with col_decomp1:
             compressed_file = st.file_uploader(
                 "Choose compressed file",
-                type=["gz"],
+                type=["gz", "zst"],
                 label_visibility="collapsed"
             )
 
@@ -282,14 +245,19 @@ def render_resume():
             with col_c1:
                 original_size = file_to_compress.size / 1024
                 st.metric("Original Size", f"{original_size:.2f} KB")
+                codec = st.radio(
+                    "Format",
+                    available_codecs(),
+                    format_func=lambda name: f"{name} ({SUFFIXES[name]})",
+                    horizontal=True,
+                    key="compress_codec"
+                )
             
             if st.button("🗜️ Compress File", use_container_width=True, key="compress_btn"):
-                # Save temporarily
-                temp_path = f"/tmp/{file_to_compress.name}"
-                with open(temp_path, 'wb') as f:
-                    f.write(file_to_compress.read())
-
-                compressed_data, output_name, orig_size, comp_size, ratio = compress_file(temp_path, file_to_compress.name)
+                file_to_compress.seek(0)
+                compressed_data, output_name, orig_size, comp_size, ratio = compress_file(
+                    file_to_compress, file_to_compress.name, codec
+                )
 
                 if compressed_data:
                     with col_c2:
@@ -301,15 +269,12 @@ def render_resume():
                     # Download button
                     st.download_button(
                         label="📥 Download Compressed File",
-                        data=compressed_data.getvalue(),
+                        data=compressed_data.read(),
                         file_name=output_name,
-                        mime="application/gzip",
+                        mime=MIME_TYPES[codec],
                         use_container_width=True
                     )
-
-                # Cleanup
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+                    compressed_data.close()
 
     # ── Analyze Button ────────────────────────────────────────────────────────
     st.markdown("---")
@@ -332,11 +297,22 @@ def render_resume():
             st.warning("⚠️ Your resume seems very short. Please provide more content for accurate analysis.")
             return
 
-        with st.spinner("🤖 Analyzing your resume in depth..."):
-            user_prompt = get_resume_user_prompt(resume_text.strip(), target_role.strip())
-            result = query_model(RESUME_SYSTEM_PROMPT, user_prompt)
-
-        st.success("✅ Analysis complete!")
+        cache = get_analysis_cache()
+        fingerprint = analysis_fingerprint(resume_text, target_role, RESUME_PROMPT_VERSION)
+        cached = cache.get(fingerprint)
+        if cached:
+            result = cached["content"]
+            cached_on = datetime.fromisoformat(cached["created_at"]).strftime("%b %d, %Y %H:%M")
+            st.success(f"⚡ Analysis complete! (cached from {cached_on})")
+        else:
+            with st.spinner("🤖 Analyzing your resume in depth..."):
+                user_prompt = get_resume_user_prompt(resume_text.strip(), target_role.strip())
+                result = query_model(RESUME_SYSTEM_PROMPT, user_prompt)
+            if not result.startswith("❌"):  # never cache provider errors
+                cache.put(fingerprint, result, target_role.strip(), RESUME_PROMPT_VERSION)
+            st.success("✅ Analysis complete!")
+
+        record_event("resume_analyzed")
         st.markdown("---")
         st.markdown(result)
 
@@ -8,7 +8,11 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 from datetime import datetime
-from modules.resume import extract_text_from_pdf, extract_text_from_docx
+from utils.text_extraction import ExtractionError, extract_upload, get_extracted_text
+from modules.gap_analysis import ROLE_REQUIREMENTS
+from utils.resume_parser import parse_resume
+from utils.role_fit import RoleFitMatrix
+from utils.skill_matcher import SkillMatcher
 import re
 
 
@@ -76,6 +80,31 @@ JOB_REQUIREMENTS = {
     },
 }
 
+# ROLE_REQUIREMENTS names for the same skills and roles, mapped to the names
+# used above (and by SKILL_KEYWORDS, so resume matches land on them)
+SKILL_ALIASES = {
+    "Containerization (Docker)": "Docker",
+    "Linux/Unix": "Linux",
+    "AWS/Azure/GCP": "AWS",
+    "Cloud Platforms": "AWS",
+    "CI/CD Pipelines": "CI/CD",
+    "Monitoring & Logging": "Monitoring",
+    "Security Awareness": "Security",
+    "Architecture Design": "System Design",
+    "Machine Learning Algorithms": "Machine Learning",
+    "Version Control": "Git",
+    "APIs & Integration": "APIs",
+    "Testing & Debugging": "Testing",
+}
+
+ROLE_ALIASES = {
+    "DevOps": "DevOps Engineer",
+    "Data Science": "Data Scientist",
+    "Cloud Architecture": "Cloud Architect",
+    "Machine Learning": "Machine Learning Engineer",
+    "Full Stack Web Dev": "Full Stack Developer",
+}
+
 # Skill level estimation keywords
 SKILL_KEYWORDS = {
     "Python": ["python", "py"],
@@ -93,21 +122,40 @@ SKILL_KEYWORDS = {
     "Statistics": ["statistics", "statistical"],
     "Deep Learning": ["deep learning", "neural network", "cnn", "rnn"],
     "Terraform": ["terraform", "iac"],
+    "CI/CD": ["ci/cd", "jenkins", "github actions", "gitlab ci"],
+    "Infrastructure as Code": ["infrastructure as code", "iac", "terraform", "cloudformation", "ansible"],
     "Linux": ["linux", "unix", "bash"],
 }
 
 
+# Compiled once: every synonym lives in one token trie
+SKILL_MATCHER = SkillMatcher(SKILL_KEYWORDS)
+
+# Both requirement tables as one role × skill matrix, for ranking every role at once
+ROLE_FIT = RoleFitMatrix(JOB_REQUIREMENTS, ROLE_REQUIREMENTS,
+                         skill_aliases=SKILL_ALIASES, role_aliases=ROLE_ALIASES)
+
+# Level assumed for a skill found in a resume (mentions carry no level)
+RESUME_SKILL_LEVEL = 6
+
+
 def extract_skills_from_resume(resume_text):
-    """Extract skills mentioned in resume."""
-    extracted_skills = {}
-    resume_lower = resume_text.lower()
-    
-    for skill, keywords in SKILL_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in resume_lower:
-                extracted_skills[skill] = extracted_skills.get(skill, 0) + 1
-    
-    return extracted_skills
+    """Extract skills mentioned in resume as ``{skill: mentions}``."""
+    return SKILL_MATCHER.counts(resume_text)
+
+
+def find_skill_mentions(resume_text):
+    """Skills in the resume with mention counts and character offsets."""
+    return SKILL_MATCHER.scan(resume_text)
+
+
+def skills_by_section(resume_text):
+    """``{skill: [sections]}``: where in the resume each skill is mentioned."""
+    found = {}
+    for section, lines in parse_resume(resume_text).items():
+        for skill in SKILL_MATCHER.counts("\n".join(lines)):
+            found.setdefault(skill, []).append(section)
+    return found
 
 
 def calculate_readiness_score(extracted_skills, job_requirements):
@@ -121,8 +169,7 @@ def calculate_readiness_score(extracted_skills, job_requirements):
     
     for skill, required_level in job_requirements.items():
         if skill in extracted_skills:
-            # Assume extracted = level 6/10
-            score = min(6, required_level)
+            score = min(RESUME_SKILL_LEVEL, required_level)
             skill_scores[skill] = score
             matched_skills += 1
         else:
@@ -132,6 +179,16 @@ def calculate_readiness_score(extracted_skills, job_requirements):
     return readiness, skill_scores
 
 
+def rank_best_fit_roles(extracted_skills, top=None):
+    """Readiness for every known role at once, best fit first."""
+    return ROLE_FIT.rank_roles(extracted_skills, assumed_level=RESUME_SKILL_LEVEL, top=top)
+
+
+def current_resume_text():
+    """Text of this session's uploaded resume (None if none, or evicted from the cache)."""
+    return get_extracted_text(st.session_state.get("resume_text_hash"))
+
+
 def render_resume_gap_analyzer():
     """Render advanced resume gap analyzer."""
     st.markdown("""
@@ -159,18 +216,13 @@ def render_resume_gap_analyzer():
             )
             
             if uploaded_file:
-                file_type = uploaded_file.type
-                
-                # Extract text based on file type
-                if file_type == "application/pdf":
-                    resume_text = extract_text_from_pdf(uploaded_file)
-                elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                    resume_text = extract_text_from_docx(uploaded_file)
-                else:
-                    resume_text = uploaded_file.read().decode("utf-8")
-                
-                st.success("✅ Resume uploaded and processed!")
-                st.session_state.resume_text = resume_text
+                # Session keeps only the content hash; the text lives in the shared cache
+                try:
+                    digest, _ = extract_upload(uploaded_file.getvalue(), uploaded_file.name)
+                    st.session_state.resume_text_hash = digest
+                    st.success("✅ Resume uploaded and processed!")
+                except ExtractionError as e:
+                    st.error(f"❌ {e}")
         
         with col2:
             # Target role selector
@@ -182,11 +234,12 @@ def render_resume_gap_analyzer():
             st.session_state.target_role_analyzer = target_role
         
         # Display extracted text preview
-        if st.session_state.get("resume_text"):
+        resume_text = current_resume_text()
+        if resume_text:
             with st.expander("📃 Resume Text Preview"):
                 st.text_area(
                     "Extracted resume text:",
-                    value=st.session_state.resume_text[:1000] + "...",
+                    value=resume_text[:1000] + "...",
                     height=150,
                     disabled=True
                 )
@@ -194,12 +247,13 @@ def render_resume_gap_analyzer():
     with tab2:
         st.subheader("Step 2: Skill Gap Analysis")
         
-        if not st.session_state.get("resume_text"):
+        resume_text = current_resume_text()
+        if not resume_text:
             st.info("📌 Upload a resume first!")
             return
         
         # Extract skills from resume
-        extracted_skills = extract_skills_from_resume(st.session_state.resume_text)
+        extracted_skills = extract_skills_from_resume(resume_text)
         job_reqs = JOB_REQUIREMENTS.get(st.session_state.target_role_analyzer, {})
         
         if not extracted_skills:
@@ -217,9 +271,10 @@ def render_resume_gap_analyzer():
         
         with col1:
             st.markdown("### 📊 Extracted Skills")
+            sections = skills_by_section(resume_text)
             skills_df = pd.DataFrame(
-                list(extracted_skills.items()),
-                columns=["Skill", "Mentions"]
+                [(skill, count, ", ".join(sections.get(skill, []))) for skill, count in extracted_skills.items()],
+                columns=["Skill", "Mentions", "Sections"]
             ).sort_values("Mentions", ascending=False)
             st.dataframe(skills_df, use_container_width=True, hide_index=True)
         
@@ -331,6 +386,31 @@ def render_resume_gap_analyzer():
         
         st.markdown(f"**{label}**  \n{description}")
         
+        # Best-fit roles across both requirement tables
+        st.divider()
+        st.markdown("### 🧭 Best-Fit Roles")
+        
+        ranking = rank_best_fit_roles(extract_skills_from_resume(current_resume_text() or ""), top=5)
+        fig = go.Figure(data=[
+            go.Bar(
+                y=[row["role"] for row in ranking][::-1],
+                x=[row["readiness"] for row in ranking][::-1],
+                orientation="h",
+                marker=dict(color="#6C63FF"),
+                text=[f"{row['readiness']:.0f}%" for row in ranking][::-1],
+                textposition="auto",
+            )
+        ])
+        fig.update_layout(xaxis_title="Readiness (%)", xaxis_range=[0, 100], height=320)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        for row in ranking[:3]:
+            top_gaps = [f"{skill} (+{gap:.0f})" for skill, gap in row["gaps"].items() if gap > 0][:3]
+            st.caption(
+                f"**{row['role']}** — {row['matched']}/{row['total']} skills matched"
+                + (f"; biggest gaps: {', '.join(top_gaps)}" if top_gaps else "")
+            )
+        
         # Learning plan
         st.divider()
         st.markdown("### 📚 Recommended Learning Path")
@@ -7,6 +7,8 @@ Career Roadmap Generator module — Streamlit UI + logic.
 import streamlit as st
 from utils.model import query_model
 from prompts.roadmap_prompt import ROADMAP_SYSTEM_PROMPT, get_roadmap_user_prompt
+from utils.profile_buffer import update_current_profile
+from utils.gamification import record_event
 
 
 def render_roadmap():
@@ -91,9 +93,10 @@ def render_roadmap():
                     "daily_hours": daily_hours,
                     "timeline": timeline,
                     "roadmap": result,
-                    "created_at": st.session_state.profile_manager.load_profile(profile["name"]).get("updated_at", "")
+                    "created_at": profile.get("updated_at", "")
                 }
-                st.session_state.profile_manager.update_profile(profile["name"], {"roadmap_data": profile["roadmap_data"]})
+                update_current_profile({"roadmap_data": profile["roadmap_data"]})
+                record_event("roadmap_saved")
                 st.success("✅ Roadmap saved to profile!")
 
         # Download option
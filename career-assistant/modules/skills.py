@@ -6,6 +6,8 @@ Evaluate user skills and provide improvement recommendations.
 import streamlit as st
 from modules.chat import query_model
 from prompts.skills_prompt import get_skill_assessment_prompt, get_skill_recommendations_prompt
+from utils.profile_buffer import update_current_profile
+from utils.gamification import record_event
 import json
 
 
@@ -94,8 +96,8 @@ def render_skills():
             }
             
             # Save to profile
-            profile["skill_assessment"] = st.session_state.skill_assessment
-            st.session_state.profile_manager.update_profile(profile["name"], st.session_state.skill_assessment)
+            update_current_profile({"skill_assessment": st.session_state.skill_assessment})
+            record_event("assessment_submitted")
             
             st.success("✅ Assessment saved! Check recommendations →")
     
@@ -6,12 +6,18 @@ Tracks daily usage patterns, feature access, and engagement metrics
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
-from datetime import datetime, timedelta
-from collections import Counter
+from datetime import datetime
 import json
+from utils.activity_store import (
+    RETENTION_DAYS, get_activity_store, empty_events_frame,
+    new_activity_summary, summarize_events, apply_event_to_summary,
+)
+from utils.gamification import build_streak_state, current_streak, record_active_day
+from utils.profile_buffer import update_current_profile
 
 # Feature emoji mapping
 FEATURE_EMOJI = {
@@ -29,116 +35,165 @@ FEATURE_EMOJI = {
     "Gamification": "🎮",
 }
 
+# Days shown in the Streaks tab calendar
+CALENDAR_DAYS = 30
+
 
 def log_activity(profile, feature_name: str, duration_minutes: int = 5):
-    """Log user activity to profile"""
-    if not profile:
-        return
+    """Record a feature visit in the activity store and update the profile rollups.
     
-    today = datetime.now().strftime("%Y-%m-%d")
-    
-    # Initialize history if not exists
-    if "activity_history" not in profile:
-        profile["activity_history"] = []
+    Events are appended to the per-profile store; the profile itself only
+    carries ``activity_summary`` and ``streak``, which the caller persists
+    as usual.
+    """
+    if not profile:
+        return None
     
-    # Add activity entry
-    activity_entry = {
-        "date": today,
-        "timestamp": datetime.now().isoformat(),
-        "feature": feature_name,
-        "duration_minutes": duration_minutes,
-    }
+    migrate_activity_history(profile)
+    ensure_streak_state(profile)
     
-    profile["activity_history"].append(activity_entry)
+    now = datetime.now()
+    date_str = now.strftime("%Y-%m-%d")
+    _rollup_cache.pop(profile["name"], None)
+    get_activity_store().append(profile["name"], feature_name, duration_minutes, timestamp=now)
     
-    # Keep only last 90 days
-    cutoff_date = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
-    profile["activity_history"] = [
-        a for a in profile["activity_history"] if a["date"] >= cutoff_date
-    ]
+    record_active_day(profile["streak"], date_str)
+    summary = profile.setdefault("activity_summary", new_activity_summary())
+    return apply_event_to_summary(summary, feature_name, duration_minutes, date_str)
 
 
-def get_daily_summary(activity_history: list) -> dict:
-    """Get today's activity summary"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    today_activities = [a for a in activity_history if a["date"] == today]
+def migrate_activity_history(profile):
+    """Move a legacy in-profile ``activity_history`` list into the store (once)."""
+    legacy = profile.get("activity_history")
+    if not legacy:
+        return False
     
-    return {
-        "total_features_accessed": len(set(a["feature"] for a in today_activities)),
-        "total_time_minutes": sum(a["duration_minutes"] for a in today_activities),
-        "features_list": [a["feature"] for a in today_activities],
-        "activity_count": len(today_activities),
-    }
+    store = get_activity_store()
+    store.import_events(profile["name"], legacy)
+    profile["activity_history"] = []
+    profile["activity_summary"] = summarize_events(store.load(profile["name"]))
+    return True
 
 
-def get_weekly_stats(activity_history: list) -> dict:
-    """Get week's activity stats"""
-    week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-    week_activities = [
-        a for a in activity_history 
-        if datetime.fromisoformat(a["timestamp"]) >= datetime.fromisoformat(week_ago + "T00:00:00")
-    ]
+def ensure_streak_state(profile):
+    """Backfill ``profile["streak"]`` from stored events the first time only."""
+    if "streak" in profile:
+        return False
+    events = get_activity_store().load(profile["name"])
+    profile["streak"] = build_streak_state(events["timestamp"].dt.strftime("%Y-%m-%d"))
+    return True
+
+
+def load_activity_events(profile, days: int = RETENTION_DAYS):
+    """Load the last ``days`` of events for a profile as a typed DataFrame."""
+    if not profile:
+        return empty_events_frame()
     
-    # Daily breakdown
-    daily_data = {}
-    for activity in week_activities:
-        date = activity["date"]
-        daily_data[date] = daily_data.get(date, 0) + activity["duration_minutes"]
+    migrate_activity_history(profile)
     
-    # Feature usage count
-    feature_usage = Counter([a["feature"] for a in week_activities])
+    start = pd.Timestamp.now().normalize() - pd.Timedelta(days=days)
+    return get_activity_store().load(profile["name"], start=start)
+
+
+def _feature_labels(features):
+    """Prefix feature names with their emoji (per category, not per row)."""
+    return features.cat.rename_categories(
+        lambda f: f"{FEATURE_EMOJI.get(f, '📌')} {f}"
+    ).astype(str)
+
+
+def _calendar_grid(daily_minutes, today, days: int = CALENDAR_DAYS):
+    """Lay the last ``days`` of minutes out as a weekday × week matrix."""
+    window = pd.date_range(end=today, periods=days, freq="D")
+    grid_start = window[0] - pd.Timedelta(days=window[0].weekday())
+    offsets = (window - grid_start).days.values
+    n_weeks = offsets[-1] // 7 + 1
     
-    return {
-        "daily_breakdown": daily_data,
-        "feature_usage": dict(feature_usage),
-        "total_activities": len(week_activities),
-        "unique_days": len(set(a["date"] for a in week_activities)),
-    }
+    minutes = np.full((7, n_weeks), np.nan)
+    minutes[offsets % 7, offsets // 7] = daily_minutes.reindex(window, fill_value=0).values
+    week_labels = [
+        (grid_start + pd.Timedelta(weeks=w)).strftime("%b %d") for w in range(n_weeks)
+    ]
+    return minutes, week_labels
 
 
-def get_monthly_streak(activity_history: list) -> dict:
-    """Calculate user's login/activity streak"""
-    if not activity_history:
-        return {"current_streak": 0, "longest_streak": 0}
+def compute_activity_rollups(events, today=None) -> dict:
+    """
+    Build every Activity History view from one pass over an events frame.
     
-    dates = sorted(set(a["date"] for a in activity_history))
+    Events are grouped once by (day, feature); the daily, weekly, feature
+    and calendar views are all slices of that single aggregation.
+    """
+    today = pd.Timestamp(today or datetime.now()).normalize()
+    week_start = today - pd.Timedelta(days=7)
     
-    if not dates:
-        return {"current_streak": 0, "longest_streak": 0}
+    day = events["timestamp"].dt.normalize().rename("day")
+    by_day_feature = (
+        events.assign(day=day)
+        .groupby(["day", "feature"], observed=True)["duration_minutes"]
+        .agg(["size", "sum"])
+    )
+    daily = by_day_feature.groupby(level="day").sum()
+    days_index = daily.index
     
-    # Calculate current streak
-    current_streak = 0
-    today = datetime.now().date()
-    check_date = today
+    today_features = (
+        by_day_feature.xs(today, level="day")["size"]
+        if today in days_index else pd.Series(dtype="int64")
+    )
+    week_slice = by_day_feature[by_day_feature.index.get_level_values("day") >= week_start]
+    week_daily = daily[days_index >= week_start]
+    week_features = week_slice.groupby(level="feature", observed=True)["size"].sum()
     
-    for date_str in reversed(dates):
-        activity_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        if (check_date - activity_date).days <= 1:
-            current_streak += 1
-            check_date = activity_date
-        else:
-            break
+    calendar_minutes, calendar_weeks = _calendar_grid(daily["sum"], today)
     
-    # Calculate longest streak
-    longest_streak = 1
-    temp_streak = 1
-    for i in range(1, len(dates)):
-        date1 = datetime.strptime(dates[i-1], "%Y-%m-%d").date()
-        date2 = datetime.strptime(dates[i], "%Y-%m-%d").date()
-        
-        if (date2 - date1).days == 1:
-            temp_streak += 1
-            longest_streak = max(longest_streak, temp_streak)
-        else:
-            temp_streak = 1
+    history = events.sort_values("timestamp", ascending=False)
+    history_df = pd.DataFrame({
+        "Date": history["timestamp"].dt.strftime("%Y-%m-%d"),
+        "Time": history["timestamp"].dt.strftime("%H:%M"),
+        "Feature": _feature_labels(history["feature"]),
+        "Duration (min)": history["duration_minutes"],
+    })
     
     return {
-        "current_streak": current_streak,
-        "longest_streak": longest_streak,
-        "total_active_days": len(dates),
+        "today": {
+            "total_features_accessed": int(len(today_features)),
+            "total_time_minutes": int(daily["sum"].get(today, 0)),
+            "feature_counts": {
+                str(f): int(c) for f, c in today_features.sort_values(ascending=False).items()
+            },
+            "activity_count": int(daily["size"].get(today, 0)),
+        },
+        "week": {
+            "daily_breakdown": {
+                d.strftime("%Y-%m-%d"): int(m) for d, m in week_daily["sum"].items()
+            },
+            "feature_usage": {str(f): int(c) for f, c in week_features.items() if c},
+            "total_activities": int(week_daily["size"].sum()),
+            "unique_days": int(len(week_daily)),
+        },
+        "calendar": {"minutes": calendar_minutes, "weeks": calendar_weeks},
+        "history": history_df,
     }
 
 
+# Per-profile rollups, reused across reruns until the event store changes
+_rollup_cache = {}
+
+
+def get_activity_rollups(profile) -> dict:
+    """Cached ``compute_activity_rollups`` for a profile's recent events."""
+    name = profile["name"]
+    key = (get_activity_store().signature(name), datetime.now().strftime("%Y-%m-%d"))
+    
+    cached = _rollup_cache.get(name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    rollups = compute_activity_rollups(load_activity_events(profile))
+    _rollup_cache[name] = (key, rollups)
+    return rollups
+
+
 def render_user_history():
     """Main user history dashboard"""
     
@@ -148,13 +203,21 @@ def render_user_history():
         return
     
     profile = st.session_state.current_profile
-    activity_history = profile.get("activity_history", [])
+    migrated = migrate_activity_history(profile)
+    if migrated:
+        update_current_profile({
+            "activity_history": [],
+            "activity_summary": profile["activity_summary"],
+        })
+    if ensure_streak_state(profile):
+        update_current_profile({"streak": profile["streak"]})
+    rollups = get_activity_rollups(profile)
     language = st.session_state.get("language", "en")
     
     # ─── Main UI ─────────────────────────────────────────────────────────
     st.title("📊 User Activity History")
     
-    if not activity_history:
+    if rollups["history"].empty:
         st.info("🎯 No activity recorded yet. Start using features to build your history!")
         return
     
@@ -165,7 +228,7 @@ def render_user_history():
     
     # ─── TAB 1: Daily Summary ─────────────────────────────────────────────
     with tab1:
-        daily_summary = get_daily_summary(activity_history)
+        daily_summary = rollups["today"]
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -201,23 +264,22 @@ def render_user_history():
         st.divider()
         
         # Today's features
-        if daily_summary["features_list"]:
+        if daily_summary["feature_counts"]:
             st.subheader("✨ Features Used Today")
             
-            feature_counts = Counter(daily_summary["features_list"])
             today_df = pd.DataFrame([
                 {
                     "Feature": f"{FEATURE_EMOJI.get(f, '📌')} {f}",
                     "Times Accessed": count,
                 }
-                for f, count in sorted(feature_counts.items(), key=lambda x: x[1], reverse=True)
+                for f, count in daily_summary["feature_counts"].items()
             ])
             
             st.dataframe(today_df, use_container_width=True, hide_index=True)
     
     # ─── TAB 2: Weekly Stats ──────────────────────────────────────────────
     with tab2:
-        weekly_stats = get_weekly_stats(activity_history)
+        weekly_stats = rollups["week"]
         
         col1, col2, col3 = st.columns(3)
         
@@ -300,7 +362,7 @@ def render_user_history():
     
     # ─── TAB 3: Streaks & Milestones ──────────────────────────────────────
     with tab3:
-        streak_data = get_monthly_streak(activity_history)
+        streak_data = dict(profile["streak"], current_streak=current_streak(profile["streak"]))
         
         col1, col2, col3 = st.columns(3)
         
@@ -330,98 +392,33 @@ def render_user_history():
         # Streak visualization
         st.subheader("🗓️ Activity Calendar")
         
-        # Create a 30-day calendar heatmap
-        dates = sorted(set(a["date"] for a in activity_history))
-        date_activity = {}
-        
-        for date_str in dates:
-            activities = [a for a in activity_history if a["date"] == date_str]
-            total_minutes = sum(a["duration_minutes"] for a in activities)
-            date_activity[date_str] = total_minutes
-        
-        # Get last 30 days
-        last_30_days = []
-        today = datetime.now().date()
-        for i in range(29, -1, -1):
-            date = (today - timedelta(days=i)).strftime("%Y-%m-%d")
-            last_30_days.append({
-                "date": date,
-                "minutes": date_activity.get(date, 0),
-                "week": (datetime.strptime(date, "%Y-%m-%d").date().weekday()),
-                "day": (datetime.strptime(date, "%Y-%m-%d").date().day),
-            })
-        
-        # Create heatmap
-        week_groups = {}
-        for item in last_30_days:
-            week_start = datetime.strptime(item["date"], "%Y-%m-%d").date() - timedelta(days=item["week"])
-            week_key = week_start.strftime("%Y-W%U")
-            if week_key not in week_groups:
-                week_groups[week_key] = []
-            week_groups[week_key].append(item)
-        
-        days_labels = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        
-        # Heatmap visualization
-        heatmap_data = []
-        for week_key in sorted(week_groups.keys()):
-            week_data = week_groups[week_key]
-            for i in range(7):
-                matching = [d for d in week_data if d["week"] == i]
-                if matching:
-                    heatmap_data.append(matching[0]["minutes"])
-                else:
-                    heatmap_data.append(0)
-        
-        # Create mini calendar
-        col_days = st.columns(7)
-        for i, day_label in enumerate(days_labels):
-            with col_days[i]:
-                st.write(f"**{day_label}**")
-        
-        # Display activity as color blocks
-        for idx, item in enumerate(last_30_days):
-            if idx % 7 == 0:
-                cols = st.columns(7)
-            
-            col_idx = idx % 7
-            with cols[col_idx]:
-                minutes = item["minutes"]
-                if minutes == 0:
-                    color = "⬜"
-                elif minutes < 10:
-                    color = "🟩"
-                elif minutes < 30:
-                    color = "🟩"
-                elif minutes < 60:
-                    color = "🟩"
-                else:
-                    color = "🟩"
-                
-                status = f"{color} {minutes}m" if minutes > 0 else f"{color}"
-                st.write(status)
+        calendar = rollups["calendar"]
+        fig = go.Figure(data=[
+            go.Heatmap(
+                z=calendar["minutes"],
+                x=calendar["weeks"],
+                y=["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+                colorscale="Greens",
+                zmin=0,
+                xgap=3,
+                ygap=3,
+                colorbar=dict(title="Minutes"),
+                hovertemplate="Week of %{x}, %{y}<br>%{z} minutes<extra></extra>",
+            )
+        ])
+        fig.update_layout(
+            title=f"Last {CALENDAR_DAYS} Days",
+            xaxis_title="Week of",
+            yaxis=dict(autorange="reversed"),
+            height=300,
+        )
+        st.plotly_chart(fig, use_container_width=True)
     
     # ─── TAB 4: Full History ──────────────────────────────────────────────
     with tab4:
         st.subheader("📑 Complete Activity Log")
         
-        # Sort by date descending
-        sorted_history = sorted(
-            activity_history,
-            key=lambda x: x["timestamp"],
-            reverse=True
-        )
-        
-        # Create dataframe
-        history_df = pd.DataFrame([
-            {
-                "Date": a["date"],
-                "Time": datetime.fromisoformat(a["timestamp"]).strftime("%H:%M"),
-                "Feature": f"{FEATURE_EMOJI.get(a['feature'], '📌')} {a['feature']}",
-                "Duration (min)": a["duration_minutes"],
-            }
-            for a in sorted_history
-        ])
+        history_df = rollups["history"]
         
         # Display
         st.dataframe(history_df, use_container_width=True, hide_index=True)
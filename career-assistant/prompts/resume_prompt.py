@@ -4,6 +4,11 @@ prompts/resume_prompt.py
 System prompt for the Resume Analyzer module.
 """
 
+from utils.resume_parser import resume_digest
+
+# Bump whenever the prompts below change: cached analyses are keyed on it
+RESUME_PROMPT_VERSION = 3
+
 RESUME_SYSTEM_PROMPT = """
 You are a Professional Resume Coach and Technical Recruiter with 12+ years of
 experience hiring and coaching candidates across software, data, design, marketing,
@@ -55,14 +60,14 @@ Brief feedback on: Summary/Objective, Experience, Skills, Projects, Education (i
 
 
 def get_resume_user_prompt(resume_text: str, target_role: str) -> str:
-    """Build the user-side prompt for resume analysis."""
+    """Build the user-side prompt for resume analysis from the resume's section digest."""
     return f"""
 Please analyze my resume for the target role of **{target_role}**.
 
-Here is my resume text:
+Here is my resume, parsed into sections (contact details removed):
 
 ---
-{resume_text}
+{resume_digest(resume_text)}
 ---
 
 Provide a thorough analysis including: skill gaps, missing keywords, role alignment,
@@ -0,0 +1,227 @@
+"""
+screen_resumes.py — Batch Resume Screening
+Extract skills from every resume in a directory and score them against
+one or all roles, streaming one result per resume to CSV or JSONL.
+
+Run with:
+    python screen_resumes.py resumes/ -o results.csv
+    python screen_resumes.py resumes/ --role "Data Scientist" -o results.jsonl --workers 8
+    python screen_resumes.py resumes/ --llm -o results.jsonl   # adds LLM feedback (slow)
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Files are already spread over worker processes; don't also split PDFs
+os.environ.setdefault("EXTRACTION_WORKERS", "1")
+
+
+def _quiet_streamlit():
+    # The extractors report failures with st.error; outside a Streamlit
+    # session that only logs bare-mode warnings, one batch per file
+    from streamlit import config, logger
+    config.get_config_options()  # parse now: a later first parse resets the level
+    logger.set_log_level("critical")
+
+RESUME_SUFFIXES = {".pdf", ".docx", ".txt"}
+TOP_GAPS = 3
+
+
+# ── Worker ────────────────────────────────────────────────────────────────────
+
+def extract_resume_text(path):
+    """Text of a PDF, DOCX or TXT resume (None if it can't be read)."""
+    from modules.resume import extract_text_from_docx, extract_text_from_pdf
+
+    suffix = path.suffix.lower()
+    if suffix == ".txt":
+        return path.read_text(encoding="utf-8", errors="replace")
+    with open(path, "rb") as f:
+        if suffix == ".pdf":
+            return extract_text_from_pdf(f)
+        return extract_text_from_docx(f)
+
+
+def screen_resume(path, roles=None, use_llm=False):
+    """Extract, match and score one resume; never raises."""
+    from modules.resume_gap_analyzer import extract_skills_from_resume, rank_best_fit_roles
+
+    start = time.perf_counter()
+    result = {"file": str(path), "status": "ok", "error": ""}
+    try:
+        text = extract_resume_text(path)
+        if not text or not text.strip():
+            raise ValueError("could not extract text (unreadable or empty file)")
+
+        skills = extract_skills_from_resume(text)
+        ranking = rank_best_fit_roles(skills)
+        if roles:
+            ranking = [row for row in ranking if row["role"] in roles]
+        best = ranking[0]
+
+        result.update({
+            "chars": len(text),
+            "skills": dict(sorted(skills.items(), key=lambda item: -item[1])),
+            "best_role": best["role"],
+            "best_readiness": best["readiness"],
+            "top_gaps": [skill for skill, gap in best["gaps"].items() if gap > 0][:TOP_GAPS],
+            "readiness": {row["role"]: row["readiness"] for row in ranking},
+        })
+        if use_llm:
+            from prompts.resume_prompt import RESUME_PROMPT_VERSION, RESUME_SYSTEM_PROMPT, get_resume_user_prompt
+            from utils.analysis_cache import analysis_fingerprint, get_analysis_cache
+            from utils.model import query_model
+
+            cache = get_analysis_cache()
+            fingerprint = analysis_fingerprint(text, best["role"], RESUME_PROMPT_VERSION)
+            cached = cache.get(fingerprint)
+            if cached:
+                analysis = cached["content"]
+            else:
+                analysis = query_model(RESUME_SYSTEM_PROMPT, get_resume_user_prompt(text, best["role"]))
+                if not analysis.startswith("❌"):
+                    cache.put(fingerprint, analysis, best["role"], RESUME_PROMPT_VERSION)
+            result["llm_analysis"] = analysis
+    except Exception as e:
+        result.update(status="failed", error=str(e))
+    result["seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+# ── Output ────────────────────────────────────────────────────────────────────
+
+class JsonlWriter:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, result):
+        self.stream.write(json.dumps(result) + "\n")
+        self.stream.flush()
+
+
+class CsvWriter:
+    """Flattens results: one readiness column per role, skills as name:count."""
+
+    def __init__(self, stream, roles, use_llm):
+        self.stream = stream
+        self.roles = roles
+        columns = ["file", "status", "error", "seconds", "chars", "skill_count", "skills",
+                   "best_role", "best_readiness", "top_gaps"]
+        columns += [f"readiness:{role}" for role in roles]
+        if use_llm:
+            columns.append("llm_analysis")
+        self.writer = csv.DictWriter(stream, fieldnames=columns, extrasaction="ignore")
+        self.writer.writeheader()
+
+    def write(self, result):
+        row = dict(result)
+        skills = result.get("skills", {})
+        row["skill_count"] = len(skills)
+        row["skills"] = "; ".join(f"{skill}:{count}" for skill, count in skills.items())
+        row["top_gaps"] = "; ".join(result.get("top_gaps", []))
+        for role, readiness in result.get("readiness", {}).items():
+            row[f"readiness:{role}"] = readiness
+        self.writer.writerow(row)
+        self.stream.flush()
+
+
+def find_resumes(directory, recursive=True):
+    pattern = "**/*" if recursive else "*"
+    return sorted(p for p in Path(directory).glob(pattern) if p.is_file() and p.suffix.lower() in RESUME_SUFFIXES)
+
+
+class Progress:
+    """Single-line progress on a terminal, a line per 10% otherwise."""
+
+    def __init__(self, total):
+        self.total = total
+        self.started = time.perf_counter()
+        self.interactive = sys.stderr.isatty()
+        self.last_shown = 0.0
+        self.last_decile = 0
+
+    def update(self, done, failed):
+        now = time.perf_counter()
+        finished = done == self.total
+        if self.interactive:
+            if not finished and now - self.last_shown < 0.1:
+                return
+            end = "\n" if finished else ""
+            prefix = "\r"
+        else:
+            decile = done * 10 // self.total
+            if decile == self.last_decile and not finished:
+                return
+            self.last_decile = decile
+            end, prefix = "\n", ""
+        self.last_shown = now
+        rate = done / (now - self.started)
+        sys.stderr.write(f"{prefix}[{done:>{len(str(self.total))}}/{self.total}] "
+                         f"{rate:6.1f} resumes/s  failed={failed}{end}")
+        sys.stderr.flush()
+
+
+# ── Entry Point ───────────────────────────────────────────────────────────────
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Screen a directory of resumes against job roles")
+    parser.add_argument("directory", help="Folder containing PDF, DOCX or TXT resumes")
+    parser.add_argument("-o", "--output", help="Output .csv or .jsonl file (default: JSONL on stdout)")
+    parser.add_argument("--role", action="append", dest="roles", help="Role to score (repeatable; default: all roles)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--no-recursive", action="store_true", help="Don't descend into subfolders")
+    parser.add_argument("--llm", action="store_true", help="Also request LLM resume feedback (one API call per resume)")
+    args = parser.parse_args(argv)
+
+    from modules.resume_gap_analyzer import ROLE_FIT
+
+    if args.roles:
+        args.roles = list(dict.fromkeys(ROLE_FIT.resolve_role(role) for role in args.roles))
+    unknown = [role for role in args.roles or [] if role not in ROLE_FIT.role_index]
+    if unknown:
+        parser.error(f"unknown role(s): {', '.join(unknown)}. Known roles: {', '.join(ROLE_FIT.roles)}")
+    roles = args.roles or ROLE_FIT.roles
+
+    paths = find_resumes(args.directory, recursive=not args.no_recursive)
+    if not paths:
+        parser.error(f"no PDF, DOCX or TXT files found in {args.directory}")
+
+    stream = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    as_csv = bool(args.output) and args.output.lower().endswith(".csv")
+    writer = CsvWriter(stream, roles, args.llm) if as_csv else JsonlWriter(stream)
+
+    progress = Progress(len(paths))
+    failed = 0
+    extract_seconds = 0.0
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=_quiet_streamlit) as pool:
+            futures = [pool.submit(screen_resume, path, args.roles, args.llm) for path in paths]
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                failed += result["status"] != "ok"
+                extract_seconds += result["seconds"]
+                writer.write(result)
+                progress.update(done, failed)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    elapsed = time.perf_counter() - progress.started
+    sys.stderr.write(
+        f"Screened {len(paths)} resumes in {elapsed:.2f}s "
+        f"({len(paths) / elapsed:.1f} resumes/s, {extract_seconds:.2f}s total worker time); "
+        f"{failed} failed\n"
+    )
+    return 1 if failed == len(paths) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,670 @@
+import gzip
+import io
+import json
+import multiprocessing
+import shutil
+import tempfile
+import threading
+import unittest
+import zipfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+import dashboard
+from modules.gap_analysis import ROLE_REQUIREMENTS, calculate_gaps, get_role_requirements
+from modules.resume_gap_analyzer import ROLE_FIT, extract_skills_from_resume, find_skill_mentions, rank_best_fit_roles
+from modules.user_history import compute_activity_rollups
+from utils.activity_store import ActivityStore
+from screen_resumes import find_resumes, screen_resume
+from utils.analysis_cache import AnalysisCache, analysis_fingerprint
+from utils.compression import (
+    DecompressionLimitExceeded, available_codecs, compress_stream, decompress_stream,
+)
+from utils.event_broker import EventBroker
+from utils.gamification import (
+    ACHIEVEMENTS, build_streak_state, current_streak, emit_event, ensure_gamification_state,
+    new_streak_state, record_active_day,
+)
+from utils.profile_manager import ProfileManager, ProgressTracker, ProfileVersionConflict
+from utils.progress_ingest import BatchRejected, ingest_batch, parse_batch
+from utils.read_model import DashboardReadModel
+from utils.resume_parser import clean_line, parse_resume, resume_digest
+from utils.role_fit import RoleFitMatrix
+from utils.skill_matcher import SkillMatcher
+from utils.text_extraction import ExtractionError, extract_upload, get_extracted_text
+
+
+def _update_field(profiles_dir, worker_id, rounds):
+    pm = ProfileManager(profiles_dir)
+    for i in range(rounds):
+        pm.update_profile("shared", {f"worker_{worker_id}": i})
+
+
+def _bump_counter(profiles_dir, rounds):
+    pm = ProfileManager(profiles_dir)
+    for _ in range(rounds):
+        while True:
+            profile = pm.load_profile("shared")
+            try:
+                pm.update_profile("shared", {"counter": profile["counter"] + 1},
+                                  expected_version=profile["version"])
+                break
+            except ProfileVersionConflict:
+                continue
+
+
+class TestProfileConcurrency(unittest.TestCase):
+    WORKERS = 4
+    ROUNDS = 25
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.profiles_dir = str(Path(self.tmp) / "profiles")
+        self.pm = ProfileManager(self.profiles_dir)
+        self.pm.create_profile("shared", {"career_field": "Data Science", "counter": 0})
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _run_processes(self, target, make_args):
+        procs = [multiprocessing.Process(target=target, args=(self.profiles_dir, *make_args(i)))
+                 for i in range(self.WORKERS)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(60)
+            self.assertEqual(p.exitcode, 0)
+
+    def test_concurrent_field_updates_are_not_lost(self):
+        self._run_processes(_update_field, lambda i: (i, self.ROUNDS))
+
+        profile = self.pm.load_profile("shared")
+        for worker_id in range(self.WORKERS):
+            self.assertEqual(profile[f"worker_{worker_id}"], self.ROUNDS - 1)
+        self.assertEqual(profile["version"], 1 + self.WORKERS * self.ROUNDS)
+
+    def test_optimistic_increments_serialize(self):
+        self._run_processes(_bump_counter, lambda i: (self.ROUNDS,))
+
+        self.assertEqual(self.pm.load_profile("shared")["counter"], self.WORKERS * self.ROUNDS)
+
+    def test_stale_version_is_rejected(self):
+        profile = self.pm.load_profile("shared")
+        self.pm.update_profile("shared", {"goal": "first"}, expected_version=profile["version"])
+
+        with self.assertRaises(ProfileVersionConflict):
+            self.pm.update_profile("shared", {"goal": "second"}, expected_version=profile["version"])
+        self.assertEqual(self.pm.load_profile("shared")["goal"], "first")
+
+    def test_readers_never_see_partial_files(self):
+        stop = threading.Event()
+        errors = []
+
+        def read_forever():
+            path = Path(self.profiles_dir) / "shared.json"
+            while not stop.is_set():
+                try:
+                    json.loads(path.read_text())
+                except json.JSONDecodeError as e:
+                    errors.append(e)
+
+        reader = threading.Thread(target=read_forever)
+        reader.start()
+        try:
+            for i in range(200):
+                self.pm.update_profile("shared", {"payload": "x" * (i * 50)})
+        finally:
+            stop.set()
+            reader.join()
+
+        self.assertEqual(errors, [])
+
+    def test_progress_log_appends_are_not_lost(self):
+        tracker = ProgressTracker(str(Path(self.tmp) / "progress"))
+        threads = [
+            threading.Thread(target=lambda: [tracker.log_activity("shared", "milestone_completed", {})
+                                             for _ in range(self.ROUNDS)])
+            for _ in range(self.WORKERS)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(tracker.get_activity_log("shared")), self.WORKERS * self.ROUNDS)
+
+
+class TestActivityRollups(unittest.TestCase):
+    TODAY = datetime(2026, 10, 15)
+
+    def _events(self, rows):
+        frame = pd.DataFrame(rows, columns=["timestamp", "feature", "duration_minutes"])
+        return frame.astype({"feature": "category", "duration_minutes": "int32"})
+
+    def test_views_match_event_log(self):
+        day = lambda n, hour=9: self.TODAY - timedelta(days=n) + timedelta(hours=hour)
+        events = self._events([
+            (day(20), "Chat", 10),
+            (day(3), "Chat", 5),
+            (day(2), "Skills", 15),
+            (day(1), "Chat", 5),
+            (day(0), "Chat", 5),
+            (day(0, 14), "Roadmap", 20),
+            (day(0, 15), "Chat", 5),
+        ])
+
+        rollups = compute_activity_rollups(events, today=self.TODAY)
+
+        self.assertEqual(rollups["today"], {
+            "total_features_accessed": 2,
+            "total_time_minutes": 30,
+            "feature_counts": {"Chat": 2, "Roadmap": 1},
+            "activity_count": 3,
+        })
+        self.assertEqual(rollups["week"]["total_activities"], 6)
+        self.assertEqual(rollups["week"]["unique_days"], 4)
+        self.assertEqual(rollups["week"]["feature_usage"], {"Chat": 4, "Roadmap": 1, "Skills": 1})
+        self.assertEqual(rollups["week"]["daily_breakdown"]["2026-10-15"], 30)
+        self.assertEqual(int(pd.Series(rollups["calendar"]["minutes"].ravel()).sum()), 65)
+        self.assertEqual(rollups["history"]["Feature"].iloc[0], "💬 Chat")
+
+
+class TestActivityImport(unittest.TestCase):
+    def test_reimporting_legacy_history_adds_nothing(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            store = ActivityStore(tmp)
+            legacy = [
+                {"timestamp": "2026-09-30T10:00:00", "feature": "Chat", "duration_minutes": 5},
+                {"timestamp": "2026-10-01T09:00:00", "feature": "Roadmap", "duration_minutes": 10},
+                {"timestamp": "2026-10-01T09:00:00", "feature": "Roadmap", "duration_minutes": 10},
+                {"timestamp": "2026-10-01T09:00:00", "feature": "Chat", "duration_minutes": 5},
+            ]
+            self.assertEqual(store.import_events("ann", legacy), 3)
+            self.assertEqual(store.import_events("ann", legacy), 0)
+            self.assertEqual(store.import_events("ann", legacy + [
+                {"timestamp": "2026-10-02T09:00:00", "feature": "Chat", "duration_minutes": 5},
+            ]), 1)
+            self.assertEqual(len(store.load("ann")), 4)
+        finally:
+            shutil.rmtree(tmp)
+
+
+class TestStreakState(unittest.TestCase):
+    def test_incremental_matches_backfill(self):
+        days = ["2026-10-01", "2026-10-02", "2026-10-03", "2026-10-05", "2026-10-06"]
+        streak = new_streak_state()
+        for day in days + ["2026-10-06", "2026-10-04"]:
+            record_active_day(streak, day)
+
+        self.assertEqual(streak, build_streak_state(days))
+        self.assertEqual(streak, {
+            "last_active_date": "2026-10-06",
+            "current_streak": 2,
+            "longest_streak": 3,
+            "total_active_days": 5,
+        })
+
+    def test_current_streak_lapses_after_missed_day(self):
+        streak = build_streak_state(["2026-10-14", "2026-10-15"])
+
+        self.assertEqual(current_streak(streak, today=datetime(2026, 10, 16).date()), 2)
+        self.assertEqual(current_streak(streak, today=datetime(2026, 10, 17).date()), 0)
+        self.assertEqual(current_streak(None), 0)
+
+
+class TestAchievementEngine(unittest.TestCase):
+    def test_counters_accumulate_and_award_once(self):
+        profile = {"name": "p", "gamification": {"counters": {}, "earned_badges": [], "total_xp": 0}}
+        for _ in range(2):
+            self.assertEqual(emit_event(profile, "interview_completed"), [])
+        earned = emit_event(profile, "interview_completed")
+        again = emit_event(profile, "interview_completed")
+
+        self.assertEqual([badge_id for badge_id, _ in earned], ["interview_master"])
+        self.assertEqual(again, [])
+        self.assertEqual(profile["gamification"]["counters"]["interview_completed"], 4)
+        self.assertEqual(profile["gamification"]["total_xp"], ACHIEVEMENTS["interview_master"]["points"])
+
+    def test_one_event_can_award_several_badges(self):
+        profile = {"name": "p", "gamification": {"counters": {}, "earned_badges": [], "total_xp": 0},
+                   "skill_assessment": {"technical_skills": {s: 5 for s in "abcde"}}}
+
+        earned = emit_event(profile, "assessment_submitted")
+        self.assertEqual({badge_id for badge_id, _ in earned}, {"skill_assessor", "skill_master"})
+
+    def test_only_indexed_rules_are_evaluated(self):
+        profile = {"name": "p", "gamification": {"counters": {}, "earned_badges": [], "total_xp": 0},
+                   "streak": {"longest_streak": 10}}
+
+        self.assertEqual(emit_event(profile, "roadmap_saved")[0][0], "roadmap_builder")
+        self.assertNotIn("streak_champion", profile["gamification"]["earned_badges"])
+        earned = emit_event(profile, "activity_logged")
+        self.assertEqual({badge_id for badge_id, _ in earned}, {"first_step", "streak_champion"})
+
+    def test_existing_profiles_are_seeded_once(self):
+        profile = {"name": "p", "roadmap_data": {}, "progress_data": {
+            "completed_milestones": [{"title": "a"}], "projects_completed": [{}] * 5,
+        }}
+
+        earned = {badge_id for badge_id, _ in ensure_gamification_state(profile)}
+        self.assertEqual(earned, {"first_step", "roadmap_builder", "progress_tracker", "project_hero"})
+        self.assertIsNone(ensure_gamification_state(profile))
+
+    def test_first_event_on_unseeded_profile_is_counted_once(self):
+        profile = {"name": "p", "progress_data": {"projects_completed": [{}] * 4}}  # 4th just logged
+
+        earned = {badge_id for badge_id, _ in emit_event(profile, "project_completed")}
+        self.assertEqual(profile["gamification"]["counters"]["project_completed"], 4)
+        self.assertNotIn("project_hero", earned)
+        emit_event(profile, "chat_message_sent")
+        self.assertEqual(profile["gamification"]["counters"]["chat_message_sent"], 1)
+        self.assertIn("project_hero", {badge_id for badge_id, _ in emit_event(profile, "project_completed")})
+
+
+class TestDashboardReadModel(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.pm = ProfileManager(str(Path(self.tmp) / "profiles"))
+        self.tracker = ProgressTracker(str(Path(self.tmp) / "progress"))
+        self.pm.create_profile("alice", {"career_field": "Data Science"})
+        self.model = DashboardReadModel(self.pm, self.tracker)
+        self.model.load()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_polling_picks_up_external_changes(self):
+        etag = self.model.etag
+        self.pm.create_profile("bob", {"career_field": "Web"})
+        self.tracker.log_activity("bob", "milestone_completed", {})
+
+        self.assertEqual(len(self.model.list_profiles()), 1)
+        self.model.poll_once()
+        self.assertEqual({p["name"] for p in self.model.list_profiles()}, {"alice", "bob"})
+        self.assertEqual(self.model.dashboard_stats()["total_completed"], 1)
+        self.assertNotEqual(self.model.etag, etag)
+
+        self.pm.delete_profile("alice")
+        self.model.poll_once()
+        self.assertIsNone(self.model.get_profile("alice"))
+
+    def test_unchanged_files_keep_etag(self):
+        etag = self.model.etag
+        self.model.poll_once()
+        self.model.refresh_profile("alice")
+        self.assertEqual(self.model.etag, etag)
+
+    def test_cursor_paging_is_stable_under_inserts(self):
+        for i in range(9):
+            self.pm.create_profile(f"user_{i}", {"career_field": "Web" if i % 3 else "Data Science"})
+        self.model.poll_once()
+
+        page, cursor, total = self.model.page_profiles(limit=4, sort="name", fields=["name"])
+        self.assertEqual(total, 10)
+        self.assertEqual(page, [{"name": n} for n in ["alice", "user_0", "user_1", "user_2"]])
+
+        self.pm.create_profile("aaron", {"career_field": "Web"})
+        self.model.poll_once()
+        rest = []
+        while cursor:
+            page, cursor, _ = self.model.page_profiles(limit=4, cursor=cursor, sort="name")
+            rest += [p["name"] for p in page]
+        self.assertEqual(rest, [f"user_{i}" for i in range(3, 9)])
+
+        page, cursor, total = self.model.page_profiles(career_field="data science", sort="-name")
+        self.assertEqual([p["name"] for p in page], ["user_6", "user_3", "user_0", "alice"])
+        self.assertIsNone(cursor)
+
+    def test_etag_is_content_derived(self):
+        other = DashboardReadModel(self.pm, self.tracker)
+        other.load()
+        self.assertEqual(other.etag, self.model.etag)
+
+
+class TestDashboardApi(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.saved = (dashboard.profile_mgr, dashboard.progress_tracker, dashboard.read_model)
+        dashboard.profile_mgr = ProfileManager(str(Path(self.tmp) / "profiles"))
+        dashboard.progress_tracker = ProgressTracker(str(Path(self.tmp) / "progress"))
+        dashboard.read_model = DashboardReadModel(dashboard.profile_mgr, dashboard.progress_tracker)
+        dashboard.profile_mgr.create_profile("alice", {"career_field": "Data Science"})
+        self.client = dashboard.app.test_client()
+
+    def tearDown(self):
+        dashboard.read_model.stop()
+        dashboard.profile_mgr, dashboard.progress_tracker, dashboard.read_model = self.saved
+        shutil.rmtree(self.tmp)
+
+    def test_etag_from_get_works_as_if_match(self):
+        etag = self.client.get("/api/profiles/alice").headers["ETag"]
+        response = self.client.put("/api/profiles/alice", json={"goal": "ML"}, headers={"If-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["data"]["goal"], "ML")
+
+        stale = self.client.put("/api/profiles/alice", json={"goal": "Web"}, headers={"If-Match": etag})
+        self.assertEqual(stale.status_code, 412)
+        self.assertEqual(stale.get_json()["current_version"], response.get_json()["data"]["version"])
+
+    def test_malformed_if_match_is_rejected(self):
+        for value in ('"profile-abc"', "latest", '"profiles-0123abcd"'):
+            response = self.client.put("/api/profiles/alice", json={"goal": "ML"}, headers={"If-Match": value})
+            self.assertEqual(response.status_code, 400, value)
+        self.assertNotIn("goal", dashboard.profile_mgr.load_profile("alice"))
+
+    def test_body_version_is_validated_and_not_overridden(self):
+        for version in ("two", 1.5, True, -1, [1]):
+            response = self.client.put("/api/profiles/alice", json={"goal": "ML", "version": version})
+            self.assertEqual(response.status_code, 400, version)
+
+        current = dashboard.profile_mgr.load_profile("alice")["version"]
+        self.client.put("/api/profiles/alice", json={"goal": "ML"})
+        response = self.client.put("/api/profiles/alice", json={"goal": "Web", "version": current + 1},
+                                   headers={"If-Match": str(current)})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.put("/api/profiles/alice", json={"goal": "Web", "version": current}).status_code, 409)
+        self.assertEqual(self.client.put("/api/profiles/alice", data="not json").status_code, 400)
+        self.assertEqual(dashboard.profile_mgr.load_profile("alice")["goal"], "ML")
+
+
+    def test_profiles_zip_streams_every_profile(self):
+        dashboard.profile_mgr.create_profile("bob", {"career_field": "Web"})
+        for workers in ("1", "1000", "-5"):
+            response = self.client.get(f"/api/export/profiles.zip?formats=json,md&workers={workers}")
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.is_streamed)
+            with zipfile.ZipFile(io.BytesIO(response.get_data())) as archive:
+                self.assertEqual(sorted(archive.namelist()), ["alice.json", "alice.md", "bob.json", "bob.md"])
+                self.assertEqual(json.loads(archive.read("bob.json"))["career_field"], "Web")
+                self.assertIn("alice", archive.read("alice.md").decode())
+
+
+class TestSkillMatcher(unittest.TestCase):
+    def test_matches_whole_tokens_only(self):
+        counts = extract_skills_from_resume("Happy to write HTML and Bash; shipped ML models in Python.")
+        self.assertEqual(counts, {"Linux": 1, "Machine Learning": 1, "Python": 1})
+
+    def test_longest_phrase_wins_and_offsets_point_into_text(self):
+        text = "Ran CI/CD on Amazon\nWeb Services (AWS) with machine-learning"
+        mentions = find_skill_mentions(text)
+        self.assertEqual(mentions["AWS"]["count"], 2)
+        self.assertEqual([text[a:b] for a, b in mentions["AWS"]["offsets"]], ["Amazon\nWeb Services", "AWS"])
+        self.assertEqual(mentions["DevOps"]["offsets"], [(4, 9)])
+        self.assertIn("Machine Learning", mentions)
+
+    def test_phrase_shared_by_several_skills(self):
+        matcher = SkillMatcher({"Git": ["gitlab"], "DevOps": ["gitlab"]})
+        matcher.add("C++", "c++")
+        self.assertEqual(matcher.counts("GitLab pipelines, C++ and C"), {"Git": 1, "DevOps": 1, "C++": 1})
+
+
+class TestRoleFitMatrix(unittest.TestCase):
+    def setUp(self):
+        self.matrix = RoleFitMatrix(
+            {"Data": {"Python": 8, "SQL": 6}},
+            {"Web": {"JavaScript": 8, "SQL": 4}, "Data": {"Statistics": 6}},
+        )
+
+    def test_tables_share_one_skill_index(self):
+        self.assertEqual(self.matrix.roles, ["Data", "Web"])
+        self.assertEqual(self.matrix.skills, ["JavaScript", "Python", "SQL", "Statistics"])
+        self.assertEqual(self.matrix.required.shape, (2, 4))
+
+    def test_rank_roles_caps_levels_at_requirement(self):
+        ranking = self.matrix.rank_roles({"SQL": 10, "JavaScript": 4, "Rust": 9})
+        self.assertEqual([row["role"] for row in ranking], ["Web", "Data"])
+        self.assertEqual(ranking[0]["readiness"], round(8 / 12 * 100, 1))
+        self.assertEqual(ranking[0]["gaps"], {"JavaScript": 4.0, "SQL": -6.0})  # surplus, as in calculate_gaps
+        self.assertEqual((ranking[1]["matched"], ranking[1]["total"]), (1, 3))
+
+    def test_batch_matches_single_candidate_scoring(self):
+        candidates = {"ann": {"Python": 8}, "bob": {"JavaScript": 2, "SQL": 2}}
+        frame = self.matrix.rank_batch(candidates)
+        self.assertEqual(list(frame["best_role"]), ["Data", "Web"])
+        for name, skills in candidates.items():
+            for row in self.matrix.rank_roles(skills):
+                self.assertAlmostEqual(frame.loc[name, row["role"]], row["readiness"])
+        levels = self.matrix.candidate_matrix(list(candidates.values()))
+        self.assertEqual(self.matrix.gaps(levels).shape, (2, 2, 4))
+
+    def test_aliases_merge_skills_and_roles(self):
+        matrix = RoleFitMatrix(
+            {"DevOps Engineer": {"Linux": 9, "AWS": 8}},
+            {"DevOps": {"Linux/Unix": 7, "AWS/Azure/GCP": 9, "Scripting": 8}},
+            skill_aliases={"Linux/Unix": "Linux", "AWS/Azure/GCP": "AWS"},
+            role_aliases={"DevOps": "DevOps Engineer"},
+        )
+        self.assertEqual(matrix.roles, ["DevOps Engineer"])
+        self.assertEqual(matrix.role_requirements("DevOps"), {"AWS": 9.0, "Linux": 9.0, "Scripting": 8.0})
+        self.assertEqual(matrix.rank_roles({"Linux/Unix": 9, "Linux": 3})[0]["gaps"]["Linux"], 0.0)
+
+    def test_equivalent_role_names_score_the_same_resume_alike(self):
+        skills = extract_skills_from_resume("Docker and Kubernetes on AWS, Jenkins CI/CD, Linux, Terraform")
+        readiness = {row["role"]: row["readiness"] for row in rank_best_fit_roles(skills)}
+        self.assertNotIn("DevOps", readiness)
+        self.assertEqual(max(readiness, key=readiness.get), "DevOps Engineer")
+        self.assertGreater(readiness["DevOps Engineer"], 40)
+
+    def test_calculate_gaps_keeps_the_pages_own_role_table(self):
+        for role in ROLE_REQUIREMENTS:
+            self.assertEqual(set(calculate_gaps({}, role)), set(get_role_requirements(role)))
+        gaps = calculate_gaps({"Linux/Unix": 5, "Containerization (Docker)": 9, "Docker": 2}, "DevOps")
+        self.assertEqual(gaps["Linux/Unix"], {"current": 5.0, "required": 9.0, "gap": 4.0,
+                                              "percentage_complete": 5 / 9 * 100})
+        self.assertEqual(gaps["Containerization (Docker)"]["gap"], 0.0)
+        self.assertNotIn("Docker", gaps)
+        self.assertEqual(len(calculate_gaps({}, "Data Science")), 8)
+        self.assertEqual(calculate_gaps({"Linux": 5}, "DevOps Engineer"), {})
+
+
+class TestResumeScreening(unittest.TestCase):
+    def test_screen_text_resume_for_selected_roles(self):
+        tmp = Path(tempfile.mkdtemp())
+        try:
+            (tmp / "ann.txt").write_text("Python, SQL and statistics; machine learning with scikit")
+            (tmp / "notes.md").write_text("ignored")
+            paths = find_resumes(tmp)
+            self.assertEqual([p.name for p in paths], ["ann.txt"])
+
+            result = screen_resume(paths[0], roles=["Data Scientist", "DevOps Engineer"])
+            self.assertEqual(result["status"], "ok")
+            self.assertEqual(result["best_role"], "Data Scientist")
+            self.assertEqual(list(result["readiness"]), ["Data Scientist", "DevOps Engineer"])
+            self.assertEqual(result["skills"]["Machine Learning"], 2)
+        finally:
+            shutil.rmtree(tmp)
+
+
+class TestAnalysisCache(unittest.TestCase):
+    def test_fingerprint_folds_case_and_whitespace_only(self):
+        key = analysis_fingerprint("Jane Doe\n\nPython,  SQL", "Data Scientist", 1)
+        self.assertEqual(analysis_fingerprint("  jane doe python, sql\t", " data  scientist", 1), key)
+        self.assertNotEqual(analysis_fingerprint("Jane Doe Python, SQL, Go", "Data Scientist", 1), key)
+        self.assertNotEqual(analysis_fingerprint("Jane Doe Python, SQL", "Data Analyst", 1), key)
+        self.assertNotEqual(analysis_fingerprint("Jane Doe Python, SQL", "Data Scientist", 2), key)
+
+    def test_entries_persist_across_instances(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            key = analysis_fingerprint("resume", "role", 1)
+            self.assertIsNone(AnalysisCache(tmp).get(key))
+            AnalysisCache(tmp).put(key, "### Score: 7/10", "role", 1)
+            entry = AnalysisCache(tmp).get(key)
+            self.assertEqual(entry["content"], "### Score: 7/10")
+            self.assertIn("created_at", entry)
+        finally:
+            shutil.rmtree(tmp)
+
+
+class TestCompression(unittest.TestCase):
+    DATA = b"Python, SQL and Docker resume line\n" * 20000
+
+    def roundtrip(self, codec, **options):
+        compressed = io.BytesIO()
+        bytes_in, bytes_out = compress_stream(io.BytesIO(self.DATA), compressed, codec, **options)
+        self.assertEqual((bytes_in, bytes_out), (len(self.DATA), len(compressed.getvalue())))
+        compressed.seek(0)
+        restored = io.BytesIO()
+        decompress_stream(compressed, restored)  # codec detected from magic bytes
+        self.assertEqual(restored.getvalue(), self.DATA)
+        return compressed.getvalue()
+
+    def test_roundtrip_every_codec(self):
+        for codec in available_codecs():
+            with self.subTest(codec=codec):
+                self.roundtrip(codec, threads=1, chunk_size=4096)
+
+    def test_threaded_gzip_is_standard_gzip(self):
+        compressed = self.roundtrip("gzip", threads=3, chunk_size=65536)
+        self.assertEqual(gzip.decompress(compressed), self.DATA)
+
+    def test_decompression_limit(self):
+        compressed = io.BytesIO(gzip.compress(self.DATA))
+        with self.assertRaises(DecompressionLimitExceeded):
+            decompress_stream(compressed, io.BytesIO(), max_bytes=1000)
+        with self.assertRaises(ValueError):
+            decompress_stream(io.BytesIO(b"plain text"), io.BytesIO())
+
+
+class TestResumeParser(unittest.TestCase):
+    RESUME = """Jane Roe
+jane@example.com | +1 (555) 123-4567 | linkedin.com/in/janeroe
+
+TECHNICAL SKILLS:
+Languages: Python, SQL, python
+Tools: Docker / Kubernetes
+## Work Experience
+* Built ETL pipelines in Python
+- Built ETL   pipelines in Python
+Education: MSc Data Science, 2019-2021
+"""
+
+    def test_sections_are_cleaned_and_deduplicated(self):
+        sections = parse_resume(self.RESUME)
+        self.assertEqual(sections["skills"], ["Python", "SQL", "Docker", "Kubernetes"])
+        self.assertEqual(sections["experience"], ["Built ETL pipelines in Python"])
+        self.assertEqual(sections["education"], ["MSc Data Science, 2019-2021"])
+        self.assertEqual(sections["other"], ["Jane Roe"])
+
+    def test_digest_drops_contact_details(self):
+        digest = resume_digest(self.RESUME)
+        self.assertTrue(digest.startswith("SKILLS: Python, SQL, Docker, Kubernetes"))
+        for detail in ("jane@example.com", "555", "linkedin"):
+            self.assertNotIn(detail, digest)
+        self.assertEqual(resume_digest("no   headings\n\nat all"), "no headings\nat all")
+
+    def test_date_ranges_survive_while_phones_are_stripped(self):
+        for line in ("Software Engineer, Acme 2019-2021 2021-2023", "Analyst 2015 - 2017, 2017 - 2019",
+                     "Intern 06/2018 - 09/2018 | SAT 1450/1600"):
+            self.assertEqual(clean_line(line), line)
+        for phone in ("+1 (555) 123-4567", "(555) 123-4567", "555-123-4567", "555.123.4567", "+44 20 7946 0958"):
+            self.assertEqual(clean_line(f"Call {phone} today"), "Call today")
+
+
+class TestTextExtraction(unittest.TestCase):
+    def test_upload_is_extracted_once_and_cached_by_hash(self):
+        data = b"Python and SQL resume"
+        digest, text = extract_upload(data, "cv.txt")
+        self.assertEqual(text, "Python and SQL resume")
+        self.assertEqual(get_extracted_text(digest), text)
+        self.assertEqual(extract_upload(data, "renamed.TXT")[0], digest)
+        self.assertIsNone(get_extracted_text("unknown"))
+
+    def test_rejects_unsupported_and_oversized_uploads(self):
+        with self.assertRaises(ExtractionError):
+            extract_upload(b"data", "cv.odt")
+        with self.assertRaises(ExtractionError):
+            extract_upload(b"x" * (11 * 1024 * 1024), "cv.txt")
+        with self.assertRaises(ExtractionError):
+            extract_upload(b"not a pdf", "cv.pdf")
+
+
+class TestProgressBatch(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.tracker = ProgressTracker(str(Path(self.tmp) / "progress"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_ndjson_lines_are_reported_per_item(self):
+        body = '{"profile": "alice", "type": "lesson"}\n\nnot json\n{"profile": "bob"}\n'
+        items = parse_batch(body.encode(), "application/x-ndjson; charset=utf-8")
+        self.assertEqual(len(items), 3)
+        self.assertIsInstance(items[1], ValueError)
+        with self.assertRaises(BatchRejected):
+            parse_batch(b'{"profile": "alice"}', "application/json")
+        for content_type in ("application/json", "application/x-ndjson"):
+            with self.assertRaises(BatchRejected):
+                parse_batch(b'[{"profile": "\xff\xfe"}]', content_type)
+
+    def test_valid_events_commit_once_per_profile(self):
+        items = [
+            {"profile": "alice", "type": "milestone_completed", "timestamp": "2026-10-01T09:00:00"},
+            {"profile": "ghost", "type": "lesson"},
+            {"profile": "alice", "type": "lesson", "details": {"course": "sql"}},
+            {"profile": "alice", "details": []},
+        ]
+        writes = []
+        log_activities = self.tracker.log_activities
+        self.tracker.log_activities = lambda name, acts: writes.append(name) or log_activities(name, acts)
+
+        results, committed = ingest_batch(self.tracker, items, lambda name: name == "alice")
+        self.assertEqual([r["status"] for r in results], [201, 404, 201, 400])
+        self.assertEqual((committed, writes), (["alice"], ["alice"]))
+
+        log = self.tracker.get_activity_log("alice")
+        self.assertEqual([entry["type"] for entry in log], ["milestone_completed", "lesson"])
+        self.assertEqual(log[0]["timestamp"], "2026-10-01T09:00:00")
+
+
+class TestLiveEvents(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.pm = ProfileManager(str(Path(self.tmp) / "profiles"))
+        self.tracker = ProgressTracker(str(Path(self.tmp) / "progress"))
+        self.pm.create_profile("alice", {"career_field": "Data Science"})
+        self.broker = EventBroker()
+        self.model = DashboardReadModel(self.pm, self.tracker, events=self.broker)
+        self.model.load()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def drain(self, subscriber):
+        messages = []
+        while not subscriber.empty():
+            messages.append(subscriber.get_nowait())
+        return messages
+
+    def test_changes_publish_deltas(self):
+        subscriber = self.broker.subscribe()
+        self.assertEqual(self.drain(subscriber), [])  # initial load is silent
+
+        self.tracker.log_activity("alice", "milestone_completed", {})
+        self.pm.create_profile("bob", {"career_field": "Web"})
+        self.model.poll_once()
+        self.pm.delete_profile("bob")
+        self.model.poll_once()
+
+        events = {event: data for _, event, data in self.drain(subscriber)}
+        self.assertEqual(events["progress-updated"]["delta_completed"], 1)
+        self.assertEqual(events["profile-created"]["career_field"], "Web")
+        self.assertEqual(events["profile-deleted"], {"name": "bob", "activities": 0, "completed": 0})
+
+    def test_reconnect_replays_or_resyncs(self):
+        first = self.broker.publish("profile-updated", {"name": "alice"})
+        second = self.broker.publish("profile-updated", {"name": "alice"})
+
+        replayed = self.drain(self.broker.subscribe(last_event_id=first))
+        self.assertEqual([self.broker._format_id(m[0]) for m in replayed], [second])
+        self.assertEqual(self.drain(self.broker.subscribe(last_event_id=second)), [])
+        for foreign in (f"{self.broker.instance}.99", EventBroker().publish("x", {}), "garbage"):
+            self.assertEqual(self.drain(self.broker.subscribe(last_event_id=foreign))[0][1], "resync")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+"""
+activity_store.py — Per-Profile Activity Event Store
+Keeps feature-usage events out of the profile JSON, partitioned by month
+so that date-range reads only touch the months they need.
+
+Layout::
+
+    data/activity/<profile>/2026-10.csv       ← current month, append-only
+    data/activity/<profile>/2026-09.parquet   ← closed months (if pyarrow)
+"""
+
+import csv
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from utils.atomic_io import file_lock
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+
+
+EVENT_COLUMNS = ["timestamp", "feature", "duration_minutes"]
+RETENTION_DAYS = 90
+
+
+def _month_key(value):
+    return value.strftime("%Y-%m")
+
+
+def empty_events_frame():
+    """Typed, zero-row events frame."""
+    return pd.DataFrame({
+        "timestamp": pd.Series(dtype="datetime64[ns]"),
+        "feature": pd.Series(dtype="category"),
+        "duration_minutes": pd.Series(dtype="int32"),
+    })
+
+
+class ActivityStore:
+    """Month-partitioned, columnar activity events per profile."""
+
+    def __init__(self, data_dir="data/activity", retention_days=RETENTION_DAYS):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.retention_days = retention_days
+
+    def _profile_dir(self, profile_name):
+        return self.data_dir / profile_name
+
+    # ── Writes ────────────────────────────────────────────────────────────────
+
+    def append(self, profile_name, feature, duration_minutes, timestamp=None):
+        """Append one event. O(1): only the current month's file is touched."""
+        timestamp = timestamp or datetime.now()
+        profile_dir = self._profile_dir(profile_name)
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        path = profile_dir / f"{_month_key(timestamp)}.csv"
+
+        with file_lock(path):
+            new_partition = not path.exists()
+            with open(path, 'a', newline='') as f:
+                writer = csv.writer(f)
+                if new_partition:
+                    writer.writerow(EVENT_COLUMNS)
+                writer.writerow([timestamp.isoformat(), feature, int(duration_minutes)])
+
+        if new_partition:
+            # Month rollover: the cheap moment to compact and expire old months
+            self.compact(profile_name, before=timestamp)
+            self.prune(profile_name, now=timestamp)
+
+    def import_events(self, profile_name, events):
+        """
+        Bulk-load legacy ``activity_history`` dicts, one write per month.
+
+        Events already in the store (same timestamp and feature) are
+        skipped, so re-running an interrupted migration is harmless.
+        Returns the number of events written.
+        """
+        if not events:
+            return 0
+        frame = pd.DataFrame(events)
+        frame["timestamp"] = pd.to_datetime(frame["timestamp"], format="ISO8601")
+        frame = frame[EVENT_COLUMNS].drop_duplicates(subset=["timestamp", "feature"])
+
+        stored = self.load(profile_name, start=frame["timestamp"].min(), end=frame["timestamp"].max())
+        if not stored.empty:
+            seen = set(zip(stored["timestamp"], stored["feature"].astype(str)))
+            frame = frame[[key not in seen for key in zip(frame["timestamp"], frame["feature"].astype(str))]]
+        if frame.empty:
+            return 0
+        profile_dir = self._profile_dir(profile_name)
+        profile_dir.mkdir(parents=True, exist_ok=True)
+
+        for month, group in frame.groupby(frame["timestamp"].dt.strftime("%Y-%m")):
+            path = profile_dir / f"{month}.csv"
+            with file_lock(path):
+                group.assign(timestamp=group["timestamp"].map(datetime.isoformat)).to_csv(
+                    path, mode='a', header=not path.exists(), index=False
+                )
+        return len(frame)
+
+    def compact(self, profile_name, before=None):
+        """Rewrite closed months' CSV partitions as Parquet (when available)."""
+        if not HAS_PARQUET:
+            return
+        current = _month_key(before or datetime.now())
+        for path in self._profile_dir(profile_name).glob("*.csv"):
+            if path.stem >= current:
+                continue
+            with file_lock(path):
+                frame = self._read_partition(path)
+                target = path.with_suffix(".parquet")
+                if target.exists():
+                    frame = pd.concat([self._read_partition(target), frame], ignore_index=True)
+                frame.to_parquet(target, index=False)
+                path.unlink()
+
+    def prune(self, profile_name, now=None):
+        """Drop whole partitions that fall entirely outside the retention window."""
+        cutoff = _month_key((now or datetime.now()) - timedelta(days=self.retention_days))
+        for path in self._partition_files(profile_name):
+            if path.stem < cutoff:
+                path.unlink()
+
+    def delete(self, profile_name):
+        """Remove all events for a profile."""
+        for path in self._partition_files(profile_name):
+            path.unlink()
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+
+    def _partition_files(self, profile_name):
+        profile_dir = self._profile_dir(profile_name)
+        if not profile_dir.exists():
+            return []
+        return sorted(
+            p for p in profile_dir.iterdir()
+            if p.suffix in (".csv", ".parquet") and not p.name.startswith(".")
+        )
+
+    def _read_partition(self, path):
+        if path.suffix == ".parquet":
+            frame = pd.read_parquet(path)
+        else:
+            frame = pd.read_csv(path)
+            frame["timestamp"] = pd.to_datetime(frame["timestamp"], format="ISO8601")
+        return frame.astype({"feature": "category", "duration_minutes": "int32"})
+
+    def signature(self, profile_name):
+        """Cheap change token: partition names, sizes and mtimes."""
+        signature = []
+        for path in self._partition_files(profile_name):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            signature.append((path.name, stat.st_size, stat.st_mtime_ns))
+        return tuple(signature)
+
+    def load(self, profile_name, start=None, end=None):
+        """
+        Load events as a typed DataFrame, reading only the months that
+        overlap ``[start, end]`` (datetimes or dates; either may be None).
+        """
+        start = pd.Timestamp(start) if start is not None else None
+        end = pd.Timestamp(end) if end is not None else None
+        first = _month_key(start) if start is not None else ""
+        last = _month_key(end) if end is not None else "9999-99"
+
+        frames = []
+        for path in self._partition_files(profile_name):
+            if first <= path.stem <= last:
+                try:
+                    frames.append(self._read_partition(path))
+                except FileNotFoundError:
+                    continue
+        if not frames:
+            return empty_events_frame()
+
+        frame = pd.concat(frames, ignore_index=True)
+        frame["feature"] = frame["feature"].astype("category")
+        if start is not None:
+            frame = frame[frame["timestamp"] >= start]
+        if end is not None:
+            frame = frame[frame["timestamp"] <= end]
+        return frame.sort_values("timestamp", ignore_index=True)
+
+    def iter_files(self):
+        """Yield ``(arcname, path)`` for every partition, for backups."""
+        for path in sorted(self.data_dir.glob("*/*")):
+            if path.suffix in (".csv", ".parquet") and not path.name.startswith("."):
+                yield f"activity/{path.parent.name}/{path.name}", path
+
+
+def new_activity_summary():
+    """Empty rollup kept inside the profile in place of the raw events."""
+    return {
+        "total_events": 0,
+        "total_minutes": 0,
+        "first_date": None,
+        "last_date": None,
+        "by_feature": {},
+    }
+
+
+def summarize_events(frame):
+    """Build the profile rollup from an events frame."""
+    summary = new_activity_summary()
+    if frame.empty:
+        return summary
+    dates = frame["timestamp"].dt.strftime("%Y-%m-%d")
+    summary.update({
+        "total_events": int(len(frame)),
+        "total_minutes": int(frame["duration_minutes"].sum()),
+        "first_date": dates.min(),
+        "last_date": dates.max(),
+        "by_feature": {str(k): int(v) for k, v in frame["feature"].value_counts().items() if v},
+    })
+    return summary
+
+
+def apply_event_to_summary(summary, feature, duration_minutes, date_str):
+    """Fold one event into the rollup in O(1)."""
+    summary["total_events"] += 1
+    summary["total_minutes"] += int(duration_minutes)
+    summary["first_date"] = summary["first_date"] or date_str
+    summary["last_date"] = max(summary["last_date"] or date_str, date_str)
+    summary["by_feature"][feature] = summary["by_feature"].get(feature, 0) + 1
+    return summary
+
+
+_default_store = None
+
+
+def get_activity_store():
+    """Process-wide store rooted at ``data/activity``."""
+    global _default_store
+    if _default_store is None:
+        _default_store = ActivityStore()
+    return _default_store
@@ -0,0 +1,65 @@
+"""
+analysis_cache.py — Persistent LLM Analysis Cache
+Resume analyses keyed by a fingerprint of the normalized resume text,
+target role and prompt version. Re-analyzing the same resume for the
+same role returns the stored result instead of another generation.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from utils.atomic_io import atomic_write_json
+
+
+def normalize_text(text):
+    """Case- and whitespace-folded text: formatting-only edits keep their key."""
+    return " ".join(text.casefold().split())
+
+
+def analysis_fingerprint(resume_text, target_role, prompt_version):
+    """Stable cache key for one resume, role and prompt version."""
+    key = "\x00".join((str(prompt_version), normalize_text(target_role), normalize_text(resume_text)))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class AnalysisCache:
+    """One JSON file per fingerprint under ``cache_dir``."""
+
+    def __init__(self, cache_dir="data/analysis_cache"):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, fingerprint):
+        return self.cache_dir / f"{fingerprint}.json"
+
+    def get(self, fingerprint):
+        """Cached entry (``content``, ``created_at``, ...) or None."""
+        try:
+            with open(self._path(fingerprint), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, fingerprint, content, target_role="", prompt_version=""):
+        """Store an analysis and return its cache entry."""
+        entry = {
+            "fingerprint": fingerprint,
+            "target_role": target_role,
+            "prompt_version": prompt_version,
+            "content": content,
+            "created_at": datetime.now().isoformat(),
+        }
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(self._path(fingerprint), entry)
+        return entry
+
+
+_default_cache = None
+
+
+def get_analysis_cache():
+    """Process-wide cache rooted at ``data/analysis_cache``."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = AnalysisCache()
+    return _default_cache
@@ -0,0 +1,95 @@
+"""
+atomic_io.py — Crash-Safe File Writes & Advisory Locks
+Shared by the Streamlit app, the Flask dashboard and any extra server
+processes pointed at the same data directory.
+"""
+
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+    import msvcrt
+
+
+LOCK_TIMEOUT_SECONDS = float(os.getenv("PROFILE_LOCK_TIMEOUT", "10"))
+LOCK_POLL_SECONDS = 0.01
+
+
+class LockTimeout(TimeoutError):
+    """Raised when an advisory lock could not be taken in time."""
+
+
+def atomic_write_json(path, data, indent=2):
+    """
+    Write JSON to ``path`` via a temp file + rename.
+
+    Readers see either the old document or the new one, never a
+    half-written file, and a crash mid-write leaves the old file intact.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _try_lock(fd):
+    try:
+        if HAS_FCNTL:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(fd):
+    if HAS_FCNTL:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path, timeout=None):
+    """
+    Hold an exclusive advisory lock on ``<path>.lock`` for the block.
+
+    The lock is tied to the open file, so it is released by the OS if the
+    holding process dies. Raises ``LockTimeout`` after ``timeout`` seconds.
+    """
+    timeout = LOCK_TIMEOUT_SECONDS if timeout is None else timeout
+    path = Path(path)
+    lock_path = path.parent / f".{path.name}.lock"
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        while not _try_lock(fd):
+            if time.monotonic() >= deadline:
+                raise LockTimeout(f"Timed out after {timeout:.1f}s waiting for lock on {path.name}")
+            time.sleep(LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,174 @@
+"""
+compression.py — Streaming Resume File Compression
+Chunked gzip and zstd compression between file objects in constant
+memory. zstd is used when the ``zstandard`` package is installed, gzip
+otherwise; both can compress large inputs on several threads.
+"""
+
+import gzip
+import os
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+
+CHUNK_SIZE = 1 << 20                 # bytes read / written per step
+THREADED_MIN_BYTES = 4 * CHUNK_SIZE  # smaller inputs aren't worth a thread pool
+DEFAULT_LEVELS = {"gzip": 6, "zstd": 3}
+SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+MIME_TYPES = {"gzip": "application/gzip", "zstd": "application/zstd"}
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class DecompressionLimitExceeded(ValueError):
+    """Raised when decompressed output grows past the caller's limit."""
+
+
+def available_codecs():
+    return ["zstd", "gzip"] if HAS_ZSTD else ["gzip"]
+
+
+def default_codec():
+    return "zstd" if HAS_ZSTD else "gzip"
+
+
+def detect_codec(header):
+    """Codec from a file's first bytes (None if neither gzip nor zstd)."""
+    if header.startswith(GZIP_MAGIC):
+        return "gzip"
+    if header.startswith(ZSTD_MAGIC):
+        return "zstd"
+    return None
+
+
+def _remaining_size(src):
+    try:
+        return os.fstat(src.fileno()).st_size - src.tell()
+    except (AttributeError, OSError, ValueError):
+        pass
+    try:
+        position = src.tell()
+        end = src.seek(0, os.SEEK_END)
+        src.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _chunks(src, chunk_size):
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+# ── Compression ───────────────────────────────────────────────────────────────
+
+def _gzip_member(chunk, level):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip header + trailer
+    return compressor.compress(chunk) + compressor.flush()
+
+
+def _compress_gzip(src, dst, level, threads, chunk_size):
+    bytes_in = bytes_out = 0
+    if threads <= 1:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        for chunk in _chunks(src, chunk_size):
+            bytes_in += len(chunk)
+            bytes_out += dst.write(compressor.compress(chunk))
+        return bytes_in, bytes_out + dst.write(compressor.flush())
+
+    # pigz-style: each chunk becomes its own gzip member (concatenated
+    # members are one valid .gz). zlib releases the GIL, so members
+    # compress in parallel; at most 2 × threads chunks are in flight.
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        pending = deque()
+        for chunk in _chunks(src, chunk_size):
+            bytes_in += len(chunk)
+            pending.append(pool.submit(_gzip_member, chunk, level))
+            if len(pending) >= 2 * threads:
+                bytes_out += dst.write(pending.popleft().result())
+        while pending:
+            bytes_out += dst.write(pending.popleft().result())
+    return bytes_in, bytes_out
+
+
+def _compress_zstd(src, dst, level, threads, chunk_size, size):
+    # threads=0 compresses on the calling thread; above that zstd splits
+    # the input into jobs itself
+    compressor = zstandard.ZstdCompressor(level=level, threads=threads if threads > 1 else 0)
+    return compressor.copy_stream(
+        src, dst,
+        size=size if size is not None else -1,
+        read_size=chunk_size, write_size=chunk_size,
+    )
+
+
+def compress_stream(src, dst, codec=None, level=None, threads=None, chunk_size=CHUNK_SIZE):
+    """
+    Compress binary file ``src`` into ``dst`` chunk by chunk.
+
+    ``codec`` defaults to zstd when available. ``threads=None`` uses one
+    thread per CPU for inputs of at least ``THREADED_MIN_BYTES`` (when
+    their size can be determined) and a single thread otherwise.
+
+    Returns ``(bytes_in, bytes_out)``.
+    """
+    codec = codec or default_codec()
+    if codec not in available_codecs():
+        raise ValueError(f"Unsupported codec: {codec}")
+    level = DEFAULT_LEVELS[codec] if level is None else level
+    size = _remaining_size(src)
+    if threads is None:
+        large = size is not None and size >= THREADED_MIN_BYTES
+        threads = (os.cpu_count() or 1) if large else 1
+
+    if codec == "zstd":
+        return _compress_zstd(src, dst, level, threads, chunk_size, size)
+    return _compress_gzip(src, dst, level, threads, chunk_size)
+
+
+# ── Decompression ─────────────────────────────────────────────────────────────
+
+def _decompressed_chunks(src, codec, chunk_size):
+    if codec == "zstd":
+        reader = zstandard.ZstdDecompressor().stream_reader(src, read_across_frames=True, closefd=False)
+    else:
+        reader = gzip.GzipFile(fileobj=src, mode="rb")
+    with reader:
+        yield from _chunks(reader, chunk_size)
+
+
+def decompress_stream(src, dst, codec=None, max_bytes=None, chunk_size=CHUNK_SIZE):
+    """
+    Decompress ``src`` into ``dst`` chunk by chunk; returns bytes written.
+
+    The codec is detected from the magic bytes unless given. Output past
+    ``max_bytes`` raises ``DecompressionLimitExceeded``, so a small
+    upload can't expand into an unbounded amount of memory or disk.
+    """
+    if codec is None:
+        position = src.tell()
+        codec = detect_codec(src.read(4))
+        src.seek(position)
+        if codec is None:
+            raise ValueError("Not a gzip or zstd file")
+    if codec == "zstd" and not HAS_ZSTD:
+        raise ValueError("zstd support not installed. Please run: pip install zstandard")
+
+    written = 0
+    for chunk in _decompressed_chunks(src, codec, chunk_size):
+        written += len(chunk)
+        if max_bytes is not None and written > max_bytes:
+            raise DecompressionLimitExceeded(f"Decompressed data exceeds {max_bytes} bytes")
+        dst.write(chunk)
+    return written
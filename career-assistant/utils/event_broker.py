@@ -0,0 +1,128 @@
+"""
+event_broker.py — In-Process Event Fan-Out for Server-Sent Events
+Publishes dashboard deltas to every connected ``/api/events`` client and
+keeps a short replay buffer so reconnecting clients can resume from
+their ``Last-Event-ID`` without a full reload.
+"""
+
+import json
+import os
+import queue
+import threading
+import uuid
+from collections import deque
+
+
+REPLAY_BUFFER_SIZE = 1000
+SUBSCRIBER_QUEUE_SIZE = REPLAY_BUFFER_SIZE + 1
+HEARTBEAT_SECONDS = 15.0
+
+
+class EventBroker:
+    """
+    Fan-out of ``(id, event, data)`` messages to subscriber queues.
+
+    Event ids are ``<instance>.<sequence>``: each server process has its
+    own broker, so a client reconnecting to a different worker presents
+    an id that is recognizably foreign and gets a resync.
+    """
+
+    def __init__(self, replay_size=REPLAY_BUFFER_SIZE, queue_size=SUBSCRIBER_QUEUE_SIZE):
+        self.replay_size = replay_size
+        self.queue_size = queue_size
+        self._reset_state()
+
+    def _reset_state(self):
+        self._pid = os.getpid()
+        self.instance = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self._last_id = 0
+        self._replay = deque(maxlen=self.replay_size)
+        self._subscribers = set()
+
+    def _check_fork(self):
+        # A forked worker must not share the parent's ids or replay buffer
+        if self._pid != os.getpid():
+            self._reset_state()
+
+    def publish(self, event, data):
+        """Send an event to every subscriber (never blocks on slow clients)."""
+        self._check_fork()
+        with self._lock:
+            self._last_id += 1
+            message = (self._last_id, event, data)
+            self._replay.append(message)
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(message)
+            except queue.Full:
+                # The client fell too far behind: tell it to reload instead
+                self._reset(subscriber)
+        return self._format_id(message[0])
+
+    def _format_id(self, sequence):
+        return f"{self.instance}.{sequence}"
+
+    def _parse_id(self, event_id):
+        instance, _, sequence = str(event_id).partition(".")
+        if instance != self.instance or not sequence.isdigit():
+            return None
+        return int(sequence)
+
+    def _reset(self, subscriber):
+        with subscriber.mutex:
+            subscriber.queue.clear()
+        subscriber.put_nowait((None, "resync", {}))
+
+    def subscribe(self, last_event_id=None):
+        """
+        Register a new subscriber queue.
+
+        With ``last_event_id`` the queue is pre-filled with everything
+        published since; if that id has already left the replay buffer
+        (or was issued by another server process) a ``resync`` is queued
+        so the client reloads instead of silently missing changes.
+        """
+        self._check_fork()
+        subscriber = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            if last_event_id is not None:
+                last_sequence = self._parse_id(last_event_id)
+                newest = self._last_id
+                oldest = self._replay[0][0] if self._replay else newest + 1
+                if last_sequence is not None and oldest - 1 <= last_sequence <= newest:
+                    for message in self._replay:
+                        if message[0] > last_sequence:
+                            subscriber.put(message)
+                else:
+                    subscriber.put_nowait((None, "resync", {}))
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def stream(self, last_event_id=None, heartbeat=HEARTBEAT_SECONDS):
+        """Yield SSE-formatted text for one client until it disconnects."""
+        subscriber = self.subscribe(last_event_id)
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    event_id, event, data = subscriber.get(timeout=heartbeat)
+                except queue.Empty:
+                    # Comment line: keeps proxies from closing an idle stream
+                    yield ": ping\n\n"
+                    continue
+                lines = [f"event: {event}", f"data: {json.dumps(data)}"]
+                if event_id is not None:
+                    lines.insert(0, f"id: {self._format_id(event_id)}")
+                yield "\n".join(lines) + "\n\n"
+        finally:
+            self.unsubscribe(subscriber)
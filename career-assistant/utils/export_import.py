@@ -9,6 +9,8 @@ from pathlib import Path
 from datetime import datetime
 from io import StringIO, BytesIO
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 
 class ProfileExporter:
@@ -168,61 +170,165 @@ class ProfileImporter:
         return data_dict
 
 
+class ZipStream:
+    """Write-only file object that hands out ZIP bytes as they are produced.
+
+    ``zipfile`` treats it as a non-seekable stream, so entries are written
+    with data descriptors and nothing has to be rewound or kept around.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.buffered = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        self.buffered += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        """Return and forget everything written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks = []
+        self.buffered = 0
+        return data
+
+
+def render_profile_entries(profile, formats=("json", "md", "html"), prefix=""):
+    """Render one profile into ``(arcname, content)`` ZIP entries."""
+    profile_name = profile.get('name', 'profile')
+    renderers = {
+        "json": ProfileExporter.to_json,
+        "md": ProfileExporter.to_markdown,
+        "html": ProfileExporter.to_html,
+    }
+    return [
+        (f"{prefix}{profile_name}.{ext}", renderers[ext](profile))
+        for ext in formats
+    ]
+
+
 class BulkExportManager:
     """Manage bulk export of multiple profiles."""
     
+    CHUNK_SIZE = 64 * 1024
+    
     @staticmethod
-    def export_all_profiles_zip(profiles_list):
-        """Export all profiles as a ZIP file."""
-        zip_buffer = BytesIO()
+    def _rendered(profiles, formats, prefix, workers):
+        """Yield rendered entries per profile, keeping at most a small window in flight."""
+        if not workers or workers <= 1:
+            for profile in profiles:
+                yield render_profile_entries(profile, formats, prefix)
+            return
         
-        with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
-            for profile in profiles_list:
-                profile_name = profile.get('name', 'profile')
-                
-                # Add JSON file
-                json_content = ProfileExporter.to_json(profile)
-                zip_file.writestr(f"{profile_name}.json", json_content)
-                
-                # Add Markdown file
-                md_content = ProfileExporter.to_markdown(profile)
-                zip_file.writestr(f"{profile_name}.md", md_content)
-                
-                # Add HTML file
-                html_content = ProfileExporter.to_html(profile)
-                zip_file.writestr(f"{profile_name}.html", html_content)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for profile in profiles:
+                pending.append(pool.submit(render_profile_entries, profile, formats, prefix))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    @staticmethod
+    def iter_profiles_zip(profiles, formats=("json", "md", "html"), workers=None,
+                          compression=zipfile.ZIP_STORED):
+        """
+        Stream a ZIP of all profiles as byte chunks.
         
-        zip_buffer.seek(0)
-        return zip_buffer
+        ``profiles`` may be any iterable (e.g. ``ProfileManager.iter_profiles()``);
+        each profile is rendered only when it is reached, so memory holds one
+        render window plus ZIP's small per-entry central-directory records.
+        """
+        stream = ZipStream()
+        with zipfile.ZipFile(stream, 'w', compression=compression) as zip_file:
+            for entries in BulkExportManager._rendered(profiles, formats, "", workers):
+                for arcname, content in entries:
+                    zip_file.writestr(arcname, content)
+                if stream.buffered >= BulkExportManager.CHUNK_SIZE:
+                    yield stream.drain()
+        yield stream.drain()
     
     @staticmethod
-    def create_backup_zip(profiles_list, progress_logs):
-        """Create a complete backup ZIP with all data."""
-        zip_buffer = BytesIO()
+    def iter_backup_zip(profiles, progress_logs, workers=None,
+                        compression=zipfile.ZIP_STORED, data_files=()):
+        """
+        Stream a complete backup ZIP as byte chunks.
+        
+        ``progress_logs`` is a mapping or an iterable of ``(log_name, log_data)``
+        pairs. ``data_files`` is an iterable of ``(arcname, path)`` copied from
+        disk as-is (e.g. activity partitions). Totals for the metadata file are
+        counted on the way through.
+        """
+        if isinstance(progress_logs, dict):
+            progress_logs = progress_logs.items()
         
-        with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
+        stream = ZipStream()
+        total_profiles = 0
+        total_logs = 0
+        with zipfile.ZipFile(stream, 'w', compression=compression) as zip_file:
             # Add profiles
-            profiles_dir = "profiles/"
-            for profile in profiles_list:
-                profile_name = profile.get('name', 'profile')
-                json_content = ProfileExporter.to_json(profile)
-                zip_file.writestr(f"{profiles_dir}{profile_name}.json", json_content)
+            for entries in BulkExportManager._rendered(profiles, ("json",), "profiles/", workers):
+                for arcname, content in entries:
+                    zip_file.writestr(arcname, content)
+                total_profiles += 1
+                if stream.buffered >= BulkExportManager.CHUNK_SIZE:
+                    yield stream.drain()
             
             # Add progress logs
-            logs_dir = "progress_logs/"
-            for log_name, log_data in progress_logs.items():
-                json_content = json.dumps(log_data, indent=2)
-                zip_file.writestr(f"{logs_dir}{log_name}.json", json_content)
+            for log_name, log_data in progress_logs:
+                zip_file.writestr(f"progress_logs/{log_name}.json", json.dumps(log_data, indent=2))
+                total_logs += 1
+                if stream.buffered >= BulkExportManager.CHUNK_SIZE:
+                    yield stream.drain()
+            
+            # Add raw data files
+            for arcname, path in data_files:
+                zip_file.write(path, arcname)
+                if stream.buffered >= BulkExportManager.CHUNK_SIZE:
+                    yield stream.drain()
             
             # Add metadata
             metadata = {
                 "backup_date": datetime.now().isoformat(),
-                "total_profiles": len(profiles_list),
-                "total_progress_logs": len(progress_logs),
+                "total_profiles": total_profiles,
+                "total_progress_logs": total_logs,
                 "version": "1.0"
             }
             zip_file.writestr("BACKUP_METADATA.json", json.dumps(metadata, indent=2))
-        
+        yield stream.drain()
+    
+    @staticmethod
+    def write_zip(chunks, fileobj):
+        """Write streamed ZIP chunks to an open binary file; returns bytes written."""
+        written = 0
+        for chunk in chunks:
+            if chunk:
+                fileobj.write(chunk)
+                written += len(chunk)
+        return written
+    
+    @staticmethod
+    def export_all_profiles_zip(profiles_list):
+        """Export all profiles as a ZIP file."""
+        zip_buffer = BytesIO()
+        BulkExportManager.write_zip(BulkExportManager.iter_profiles_zip(profiles_list), zip_buffer)
+        zip_buffer.seek(0)
+        return zip_buffer
+    
+    @staticmethod
+    def create_backup_zip(profiles_list, progress_logs):
+        """Create a complete backup ZIP with all data."""
+        zip_buffer = BytesIO()
+        BulkExportManager.write_zip(BulkExportManager.iter_backup_zip(profiles_list, progress_logs), zip_buffer)
         zip_buffer.seek(0)
         return zip_buffer
 
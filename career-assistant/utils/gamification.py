@@ -4,137 +4,226 @@ Track achievements, earn badges, and maintain streaks.
 """
 
 import streamlit as st
-from datetime import datetime, timedelta
+from datetime import datetime
+from utils.profile_buffer import update_current_profile
 from utils.translations import get_text
 
 
-# Achievement definitions
+# Achievement definitions.
+# ``events`` lists the domain events that can change a rule's outcome;
+# ``condition(profile, counters)`` is only evaluated when one of them fires.
 ACHIEVEMENTS = {
     "first_step": {
         "name": "Getting Started",
         "description": "Create your first career profile",
         "emoji": "🌱",
         "points": 10,
-        "condition": lambda profile: profile is not None,
+        "events": ("profile_created", "activity_logged"),
+        "condition": lambda profile, counters: True,
     },
     "skill_assessor": {
         "name": "Skill Assessor",
         "description": "Complete your first skill assessment",
         "emoji": "🎯",
         "points": 25,
-        "condition": lambda profile: profile and "skill_assessment" in profile and len(profile.get("skill_assessment", {})) > 0,
+        "events": ("assessment_submitted",),
+        "condition": lambda profile, counters: counters.get("assessment_submitted", 0) >= 1,
     },
     "roadmap_builder": {
         "name": "Roadmap Builder",
         "description": "Create your first career roadmap",
         "emoji": "🗺️",
         "points": 30,
-        "condition": lambda profile: profile and "roadmap_data" in profile,
+        "events": ("roadmap_saved",),
+        "condition": lambda profile, counters: counters.get("roadmap_saved", 0) >= 1,
     },
     "progress_tracker": {
         "name": "Progress Tracker",
         "description": "Log your first milestone in progress tracking",
         "emoji": "📊",
         "points": 20,
-        "condition": lambda profile: profile and "progress_data" in profile and len(profile.get("progress_data", {}).get("completed_milestones", [])) > 0,
+        "events": ("milestone_completed",),
+        "condition": lambda profile, counters: counters.get("milestone_completed", 0) >= 1,
     },
     "mentor_seeker": {
         "name": "Mentor Seeker",
         "description": "Have 10 conversations with the AI mentor",
         "emoji": "💬",
         "points": 50,
-        "condition": lambda msgs: len(st.session_state.get("chat_messages", [])) >= 10,
+        "events": ("chat_message_sent",),
+        "condition": lambda profile, counters: counters.get("chat_message_sent", 0) >= 10,
     },
     "resume_optimizer": {
         "name": "Resume Optimizer",
         "description": "Upload and analyze your resume",
         "emoji": "📄",
         "points": 15,
-        "condition": lambda _: st.session_state.get("resume_uploaded", False),
+        "events": ("resume_analyzed",),
+        "condition": lambda profile, counters: counters.get("resume_analyzed", 0) >= 1,
     },
     "interview_master": {
         "name": "Interview Master",
         "description": "Complete 3 mock interviews",
         "emoji": "🎤",
         "points": 40,
-        "condition": lambda _: st.session_state.get("interview_count", 0) >= 3,
+        "events": ("interview_completed",),
+        "condition": lambda profile, counters: counters.get("interview_completed", 0) >= 3,
     },
     "streak_champion": {
         "name": "Streak Champion",
         "description": "Maintain a 7-day login streak",
         "emoji": "🔥",
         "points": 100,
-        "condition": lambda _: st.session_state.get("login_streak", 0) >= 7,
+        "events": ("activity_logged",),
+        "condition": lambda profile, counters: profile.get("streak", {}).get("longest_streak", 0) >= 7,
     },
     "skill_master": {
         "name": "Skill Master",
         "description": "Assess 5 different skills",
         "emoji": "⭐",
         "points": 75,
-        "condition": lambda profile: profile and len(profile.get("skill_assessment", {}).get("technical_skills", {})) >= 5,
+        "events": ("assessment_submitted",),
+        "condition": lambda profile, counters: len(profile.get("skill_assessment", {}).get("technical_skills", {})) >= 5,
     },
     "project_hero": {
         "name": "Project Hero",
         "description": "Complete 5 project ideas",
         "emoji": "💻",
         "points": 60,
-        "condition": lambda _: st.session_state.get("projects_completed", 0) >= 5,
+        "events": ("project_completed",),
+        "condition": lambda profile, counters: counters.get("project_completed", 0) >= 5,
     },
 }
 
+# Event type -> badge ids whose outcome may change when it fires
+RULES_BY_EVENT = {}
+for _badge_id, _achievement in ACHIEVEMENTS.items():
+    for _event in _achievement["events"]:
+        RULES_BY_EVENT.setdefault(_event, []).append(_badge_id)
 
-def initialize_gamification():
-    """Initialize gamification in session state."""
-    if "earned_badges" not in st.session_state:
-        st.session_state.earned_badges = []
-    
-    if "total_xp" not in st.session_state:
-        st.session_state.total_xp = 0
-    
-    if "login_streak" not in st.session_state:
-        st.session_state.login_streak = 1
-    
-    if "last_login" not in st.session_state:
-        st.session_state.last_login = datetime.now().isoformat()
 
+# ── Achievement Engine ────────────────────────────────────────────────────────
 
-def check_achievements(profile):
-    """Check and award achievements."""
-    initialize_gamification()
-    
-    earned = st.session_state.earned_badges
-    
-    for badge_id, achievement in ACHIEVEMENTS.items():
-        if badge_id not in earned:
-            try:
-                if achievement["condition"](profile):
-                    earned.append(badge_id)
-                    st.session_state.total_xp += achievement["points"]
-                    return badge_id, achievement
-            except:
-                pass
-    
-    return None, None
+def new_gamification_state():
+    """Empty achievements state, persisted in the profile under ``gamification``."""
+    return {"counters": {}, "earned_badges": [], "total_xp": 0}
 
 
-def update_login_streak():
-    """Update login streak based on consecutive days."""
-    last_login = datetime.fromisoformat(st.session_state.last_login)
-    today = datetime.now()
-    
-    days_diff = (today.date() - last_login.date()).days
-    
-    if days_diff == 0:
-        # Same day, no change
-        pass
-    elif days_diff == 1:
-        # Consecutive day
-        st.session_state.login_streak += 1
-    else:
-        # Streak broken
-        st.session_state.login_streak = 1
+def _award(profile, state, badge_ids):
+    """Evaluate the given rules and award any newly satisfied badges."""
+    earned = []
+    for badge_id in badge_ids:
+        if badge_id in state["earned_badges"]:
+            continue
+        achievement = ACHIEVEMENTS[badge_id]
+        if achievement["condition"](profile, state["counters"]):
+            state["earned_badges"].append(badge_id)
+            state["total_xp"] += achievement["points"]
+            earned.append((badge_id, achievement))
+    return earned
+
+
+def ensure_gamification_state(profile):
+    """
+    Seed counters from existing profile data the first time only.
+
+    Returns the badges earned retroactively, or None if the state already
+    existed.
+    """
+    if "gamification" in profile:
+        return None
+    state = profile["gamification"] = new_gamification_state()
+    progress_data = profile.get("progress_data")
+    if not isinstance(progress_data, dict):
+        progress_data = {}
+    seeded = {
+        "assessment_submitted": int(bool(profile.get("skill_assessment"))),
+        "roadmap_saved": int("roadmap_data" in profile),
+        "milestone_completed": len(progress_data.get("completed_milestones", [])),
+        "project_completed": len(progress_data.get("projects_completed", [])),
+    }
+    state["counters"] = {event: count for event, count in seeded.items() if count}
+    return _award(profile, state, ACHIEVEMENTS)
+
+
+# Events whose counters ensure_gamification_state derives from profile data
+SEEDED_EVENTS = frozenset({"assessment_submitted", "roadmap_saved", "milestone_completed", "project_completed"})
+
+
+def emit_event(profile, event_type, count=1):
+    """
+    Record a domain event against a profile.
+
+    Bumps the event's counter and evaluates only the rules indexed under
+    it. Returns a list of ``(badge_id, achievement)`` newly earned.
+
+    Callers emit after changing the profile, so when this call is the one
+    that seeds the counters, a seeded event is already counted in the data.
+    """
+    seeding = "gamification" not in profile
+    earned = ensure_gamification_state(profile) or []
+    state = profile["gamification"]
+    if not (seeding and event_type in SEEDED_EVENTS):
+        state["counters"][event_type] = state["counters"].get(event_type, 0) + count
+    return earned + _award(profile, state, RULES_BY_EVENT.get(event_type, ()))
+
+
+def record_event(event_type, count=1):
+    """Emit an event for the current profile and buffer the updated state."""
+    profile = st.session_state.get("current_profile")
+    if not profile:
+        return []
+    earned = emit_event(profile, event_type, count)
+    update_current_profile({"gamification": profile["gamification"]})
+    if earned:
+        st.session_state.setdefault("new_achievements", []).extend(earned)
+    return earned
+
+
+# ── Activity Streak ───────────────────────────────────────────────────────────
+
+def new_streak_state():
+    """Empty streak state, persisted in the profile under ``streak``."""
+    return {
+        "last_active_date": None,
+        "current_streak": 0,
+        "longest_streak": 0,
+        "total_active_days": 0,
+    }
+
+
+def record_active_day(streak, date_str):
+    """Fold one active day (``YYYY-MM-DD``) into the streak state in O(1)."""
+    last = streak["last_active_date"]
+    if last is not None and date_str <= last:
+        # Same day (or a late, out-of-order event): nothing changes
+        return streak
     
-    st.session_state.last_login = datetime.now().isoformat()
+    gap = (datetime.fromisoformat(date_str) - datetime.fromisoformat(last)).days if last else None
+    streak["current_streak"] = streak["current_streak"] + 1 if gap == 1 else 1
+    streak["longest_streak"] = max(streak["longest_streak"], streak["current_streak"])
+    streak["total_active_days"] += 1
+    streak["last_active_date"] = date_str
+    return streak
+
+
+def build_streak_state(active_dates):
+    """Streak state from a one-off scan of past active dates (for backfills)."""
+    streak = new_streak_state()
+    for date_str in sorted(set(active_dates)):
+        record_active_day(streak, date_str)
+    return streak
+
+
+def current_streak(streak, today=None):
+    """Current streak as of ``today``: zero once a whole day has been missed."""
+    last = (streak or {}).get("last_active_date")
+    if not last:
+        return 0
+    today = today or datetime.now().date()
+    if (today - datetime.fromisoformat(last).date()).days > 1:
+        return 0
+    return streak["current_streak"]
 
 
 def render_achievements():
@@ -151,40 +240,44 @@ def render_achievements():
     </div>
     """, unsafe_allow_html=True)
     
-    # Initialize
-    initialize_gamification()
-    update_login_streak()
+    # Load persisted state (seeding it once for older profiles)
+    profile = st.session_state.get("current_profile") or {}
+    if profile:
+        retroactive = ensure_gamification_state(profile)
+        if retroactive is not None:
+            update_current_profile({"gamification": profile["gamification"]})
+            st.session_state.setdefault("new_achievements", []).extend(retroactive)
+    state = profile.get("gamification") or new_gamification_state()
+    total_xp = state["total_xp"]
     
     # XP and Streak Display
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Total XP", st.session_state.total_xp, "Points")
+        st.metric("Total XP", total_xp, "Points")
     
     with col2:
-        st.metric("Login Streak", st.session_state.login_streak, "Days 🔥")
+        st.metric("Activity Streak", current_streak(profile.get("streak")), "Days 🔥")
     
     with col3:
-        badges_earned = len(st.session_state.earned_badges)
+        badges_earned = len(state["earned_badges"])
         total_badges = len(ACHIEVEMENTS)
         st.metric("Badges Earned", f"{badges_earned}/{total_badges}", "")
     
     st.divider()
     
-    # Check for new achievements
-    if st.session_state.get("current_profile"):
-        new_badge_id, new_achievement = check_achievements(st.session_state.current_profile)
-        if new_badge_id and new_achievement:
-            st.success(f"🎉 **New Achievement!** {new_achievement['emoji']} {new_achievement['name']}")
-            st.subheader(f"{new_achievement['emoji']} {new_achievement['name']}")
-            st.write(new_achievement['description'])
-            st.info(f"**+{new_achievement['points']} XP**")
+    # Announce badges earned since the last visit
+    for new_badge_id, new_achievement in st.session_state.pop("new_achievements", []):
+        st.success(f"🎉 **New Achievement!** {new_achievement['emoji']} {new_achievement['name']}")
+        st.subheader(f"{new_achievement['emoji']} {new_achievement['name']}")
+        st.write(new_achievement['description'])
+        st.info(f"**+{new_achievement['points']} XP**")
     
     st.divider()
     
     # Earned Badges
     st.subheader("🏅 Earned Badges")
-    earned = st.session_state.earned_badges
+    earned = state["earned_badges"]
     
     if earned:
         badges_per_row = 3
@@ -235,10 +328,10 @@ def render_achievements():
     st.divider()
     
     # Level calculation
-    level = st.session_state.total_xp // 100 + 1
-    xp_for_next_level = ((level) * 100) - st.session_state.total_xp
+    level = total_xp // 100 + 1
+    xp_for_next_level = ((level) * 100) - total_xp
     
     st.subheader(f"⭐ Level {level}")
-    progress_pct = (st.session_state.total_xp % 100) / 100
-    st.progress(progress_pct, text=f"{st.session_state.total_xp % 100}/100 XP to next level")
+    progress_pct = (total_xp % 100) / 100
+    st.progress(progress_pct, text=f"{total_xp % 100}/100 XP to next level")
     st.caption(f"Next level in {xp_for_next_level} XP")
@@ -0,0 +1,116 @@
+"""
+profile_buffer.py — Write-Behind Profile Cache
+Serve the current profile from memory and coalesce UI mutations into
+occasional writes instead of one full JSON rewrite per button click.
+"""
+
+import atexit
+import threading
+import time
+import weakref
+
+import streamlit as st
+
+
+# Seconds a dirty profile may sit in memory before it is written out
+FLUSH_INTERVAL_SECONDS = 2.0
+
+_live_buffers = weakref.WeakSet()
+
+
+class ProfileWriteBuffer:
+    """Per-session cached copy of one profile with dirty-field tracking."""
+
+    def __init__(self, profile_manager, profile, flush_interval=FLUSH_INTERVAL_SECONDS):
+        self.profile_manager = profile_manager
+        self.profile = profile
+        self.flush_interval = flush_interval
+        self._dirty = {}
+        self._lock = threading.RLock()
+        self._timer = None
+        self.last_flush = time.monotonic()
+        _live_buffers.add(self)
+
+    @property
+    def name(self):
+        return self.profile["name"]
+
+    @property
+    def dirty(self):
+        return bool(self._dirty)
+
+    def get(self, key, default=None):
+        """Read a field from the cached profile."""
+        return self.profile.get(key, default)
+
+    def update(self, data):
+        """Apply changes in memory and schedule a coalesced write."""
+        with self._lock:
+            self.profile.update(data)
+            self._dirty.update(data)
+            if self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return self.profile
+
+    def flush(self):
+        """Write all pending fields in a single profile update."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return False
+            pending, self._dirty = self._dirty, {}
+            try:
+                saved = self.profile_manager.update_profile(self.name, pending)
+            except Exception:
+                # Keep the edits (and anything newer) for the next attempt
+                self._dirty = {**pending, **self._dirty}
+                raise
+            if saved:
+                self.profile["updated_at"] = saved.get("updated_at", self.profile.get("updated_at"))
+                self.profile["version"] = saved.get("version", self.profile.get("version"))
+            self.last_flush = time.monotonic()
+            return bool(saved)
+
+
+def get_profile_buffer():
+    """Return the session's buffer for the current profile, or None."""
+    profile = st.session_state.get("current_profile")
+    if not profile:
+        return None
+
+    buffer = st.session_state.get("profile_buffer")
+    if buffer is None or buffer.profile is not profile:
+        if buffer is not None:
+            buffer.flush()
+        buffer = ProfileWriteBuffer(st.session_state.profile_manager, profile)
+        st.session_state.profile_buffer = buffer
+    return buffer
+
+
+def update_current_profile(data):
+    """Buffer an update to the current profile (no-op without a profile)."""
+    buffer = get_profile_buffer()
+    if buffer is None:
+        return None
+    return buffer.update(data)
+
+
+def flush_profile_buffer():
+    """Write out the session's pending profile changes, if any."""
+    buffer = st.session_state.get("profile_buffer")
+    if buffer is not None:
+        buffer.flush()
+
+
+@atexit.register
+def _flush_all_buffers():
+    """Don't lose buffered changes when the server shuts down."""
+    for buffer in list(_live_buffers):
+        try:
+            buffer.flush()
+        except Exception:
+            pass
@@ -8,6 +8,49 @@ import os
 from datetime import datetime
 from pathlib import Path
 import pandas as pd
+from utils.atomic_io import atomic_write_json, file_lock
+
+
+class ProfileVersionConflict(ValueError):
+    """Raised when a profile changed since the caller last read it."""
+    
+    def __init__(self, profile_name, expected_version, current_version):
+        super().__init__(
+            f"Profile '{profile_name}' is at version {current_version}, expected {expected_version}"
+        )
+        self.profile_name = profile_name
+        self.expected_version = expected_version
+        self.current_version = current_version
+
+
+def summarize_profile(profile):
+    """Dashboard stats for a loaded profile."""
+    return {
+        "name": profile.get("name", ""),
+        "career_field": profile.get("career_field", ""),
+        "experience_level": profile.get("experience_level", ""),
+        "created_at": profile.get("created_at", ""),
+        "updated_at": profile.get("updated_at", ""),
+        "has_roadmap": "roadmap_data" in profile,
+        "has_skills": "skill_assessment" in profile,
+        "has_progress": "progress_data" in profile,
+    }
+
+
+def summarize_activity_log(logs):
+    """Progress statistics for a loaded activity log."""
+    stats = {
+        "total_activities": len(logs),
+        "activity_types": {},
+        "recent_activity": logs[-5:] if logs else [],
+    }
+    
+    # Count activity types
+    for log in logs:
+        activity_type = log.get("type", "unknown")
+        stats["activity_types"][activity_type] = stats["activity_types"].get(activity_type, 0) + 1
+    
+    return stats
 
 
 class ProfileManager:
@@ -17,63 +60,90 @@ class ProfileManager:
         self.profiles_dir = Path(profiles_dir)
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
     
+    def _profile_path(self, profile_name):
+        return self.profiles_dir / f"{profile_name}.json"
+    
+    def _read(self, file_path):
+        if not file_path.exists():
+            return None
+        with open(file_path, 'r') as f:
+            return json.load(f)
+    
     def create_profile(self, profile_name, data):
         """Create a new profile."""
-        profile_data = {
-            "name": profile_name,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            **data
-        }
+        file_path = self._profile_path(profile_name)
         
-        file_path = self.profiles_dir / f"{profile_name}.json"
-        with open(file_path, 'w') as f:
-            json.dump(profile_data, f, indent=2)
+        with file_lock(file_path):
+            existing = self._read(file_path)
+            profile_data = {
+                "name": profile_name,
+                "created_at": datetime.now().isoformat(),
+                "updated_at": datetime.now().isoformat(),
+                **data,
+                "version": (existing or {}).get("version", 0) + 1,
+            }
+            atomic_write_json(file_path, profile_data)
         
         return profile_data
     
     def load_profile(self, profile_name):
         """Load a profile by name."""
-        file_path = self.profiles_dir / f"{profile_name}.json"
-        
-        if not file_path.exists():
+        try:
+            return self._read(self._profile_path(profile_name))
+        except FileNotFoundError:
             return None
-        
-        with open(file_path, 'r') as f:
-            return json.load(f)
     
-    def update_profile(self, profile_name, data):
-        """Update an existing profile."""
-        profile = self.load_profile(profile_name)
-        if not profile:
-            return None
+    def update_profile(self, profile_name, data, expected_version=None):
+        """
+        Update an existing profile.
         
-        profile.update(data)
-        profile["updated_at"] = datetime.now().isoformat()
+        The read-modify-write runs under the profile's lock, so concurrent
+        field updates from different sessions or processes are all kept.
+        Pass ``expected_version`` to fail with ``ProfileVersionConflict``
+        instead of overwriting changes made since that version was read.
+        """
+        file_path = self._profile_path(profile_name)
         
-        file_path = self.profiles_dir / f"{profile_name}.json"
-        with open(file_path, 'w') as f:
-            json.dump(profile, f, indent=2)
+        with file_lock(file_path):
+            profile = self._read(file_path)
+            if not profile:
+                return None
+            
+            current_version = profile.get("version", 0)
+            if expected_version is not None and int(expected_version) != current_version:
+                raise ProfileVersionConflict(profile_name, expected_version, current_version)
+            
+            profile.update({k: v for k, v in data.items() if k != "version"})
+            profile["updated_at"] = datetime.now().isoformat()
+            profile["version"] = current_version + 1
+            atomic_write_json(file_path, profile)
         
         return profile
     
     def list_profiles(self):
         """List all profiles."""
-        profiles = []
-        for file_path in self.profiles_dir.glob("*.json"):
-            with open(file_path, 'r') as f:
-                profile = json.load(f)
-                profiles.append(profile)
+        profiles = list(self.iter_profiles())
         
         return sorted(profiles, key=lambda x: x.get("updated_at", ""), reverse=True)
     
+    def iter_profiles(self):
+        """Yield profiles one at a time, in no particular order."""
+        for file_path in self.profiles_dir.glob("*.json"):
+            try:
+                with open(file_path, 'r') as f:
+                    yield json.load(f)
+            except FileNotFoundError:
+                # Deleted between listing and reading
+                continue
+    
     def delete_profile(self, profile_name):
         """Delete a profile."""
-        file_path = self.profiles_dir / f"{profile_name}.json"
+        file_path = self._profile_path(profile_name)
         
-        if file_path.exists():
-            file_path.unlink()
-            return True
+        with file_lock(file_path):
+            if file_path.exists():
+                file_path.unlink()
+                return True
         
         return False
     
@@ -110,35 +180,25 @@ class ProfileManager:
         profile = self.load_profile(profile_name)
         if not profile:
             return None
-        
-        stats = {
-            "name": profile.get("name", ""),
-            "career_field": profile.get("career_field", ""),
-            "experience_level": profile.get("experience_level", ""),
-            "created_at": profile.get("created_at", ""),
-            "updated_at": profile.get("updated_at", ""),
-            "has_roadmap": "roadmap_data" in profile,
-            "has_skills": "skill_assessment" in profile,
-            "has_progress": "progress_data" in profile,
-        }
-        
-        return stats
+        return summarize_profile(profile)
     
     def merge_profiles(self, source_name, target_name):
         """Merge source profile into target profile."""
         source = self.load_profile(source_name)
-        target = self.load_profile(target_name)
-        
-        if not source or not target:
+        if not source:
             return None
         
-        # Merge data (target takes precedence on conflicts)
-        merged = {**source, **target}
-        merged["updated_at"] = datetime.now().isoformat()
-        
-        file_path = self.profiles_dir / f"{target_name}.json"
-        with open(file_path, 'w') as f:
-            json.dump(merged, f, indent=2)
+        file_path = self._profile_path(target_name)
+        with file_lock(file_path):
+            target = self._read(file_path)
+            if not target:
+                return None
+            
+            # Merge data (target takes precedence on conflicts)
+            merged = {**source, **target}
+            merged["updated_at"] = datetime.now().isoformat()
+            merged["version"] = target.get("version", 0) + 1
+            atomic_write_json(file_path, merged)
         
         return merged
 
@@ -152,23 +212,39 @@ class ProgressTracker:
     
     def log_activity(self, profile_name, activity_type, details):
         """Log an activity for a profile."""
-        log_data = {
-            "timestamp": datetime.now().isoformat(),
-            "type": activity_type,
-            "details": details
-        }
+        self.log_activities(profile_name, [{"type": activity_type, "details": details}])
+    
+    def log_activities(self, profile_name, activities):
+        """
+        Append many activities to a profile's log in a single commit.
         
-        log_file = self.data_dir / f"{profile_name}_log.json"
+        Each activity is a dict with ``type``, ``details`` and an optional
+        ``timestamp`` (defaults to now). The log is read, extended and
+        rewritten once under the lock, however many activities there are.
+        """
+        now = datetime.now().isoformat()
+        entries = [
+            {
+                "timestamp": activity.get("timestamp") or now,
+                "type": activity["type"],
+                "details": activity.get("details", {})
+            }
+            for activity in activities
+        ]
+        if not entries:
+            return 0
         
-        logs = []
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                logs = json.load(f)
-        
-        logs.append(log_data)
+        log_file = self.data_dir / f"{profile_name}_log.json"
         
-        with open(log_file, 'w') as f:
-            json.dump(logs, f, indent=2)
+        with file_lock(log_file):
+            logs = []
+            if log_file.exists():
+                with open(log_file, 'r') as f:
+                    logs = json.load(f)
+            
+            logs.extend(entries)
+            atomic_write_json(log_file, logs)
+        return len(entries)
     
     def get_activity_log(self, profile_name):
         """Get activity log for a profile."""
@@ -180,19 +256,12 @@ class ProgressTracker:
         with open(log_file, 'r') as f:
             return json.load(f)
     
+    def iter_activity_logs(self):
+        """Yield ``(log_name, logs)`` pairs one file at a time."""
+        for log_file in self.data_dir.glob("*_log.json"):
+            with open(log_file, 'r') as f:
+                yield log_file.stem, json.load(f)
+    
     def get_statistics(self, profile_name):
         """Get statistics for profile progress."""
-        logs = self.get_activity_log(profile_name)
-        
-        stats = {
-            "total_activities": len(logs),
-            "activity_types": {},
-            "recent_activity": logs[-5:] if logs else [],
-        }
-        
-        # Count activity types
-        for log in logs:
-            activity_type = log.get("type", "unknown")
-            stats["activity_types"][activity_type] = stats["activity_types"].get(activity_type, 0) + 1
-        
-        return stats
+        return summarize_activity_log(self.get_activity_log(profile_name))
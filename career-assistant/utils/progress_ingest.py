@@ -0,0 +1,131 @@
+"""
+progress_ingest.py — Bulk Progress Ingestion
+Parse, validate and commit large batches of activity events (e.g. from
+LMS integrations) across many profiles, one log write per profile.
+"""
+
+import json
+from collections import defaultdict
+from datetime import datetime
+
+from utils.atomic_io import LockTimeout
+
+
+MAX_BATCH_EVENTS = 10000
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+class BatchRejected(ValueError):
+    """Raised when a batch body cannot be read at all (per-item problems are reported per item)."""
+
+
+def parse_batch(body, content_type):
+    """
+    Split a request body into raw items.
+
+    NDJSON bodies yield one item per non-blank line; a line that is not
+    valid JSON becomes a ``ValueError`` placeholder so it can be reported
+    against its index. Anything else must be a JSON array (or an object
+    with an ``events`` array).
+    """
+    try:
+        text = body.decode("utf-8") if isinstance(body, bytes) else body
+    except UnicodeDecodeError as e:
+        raise BatchRejected(f"Body is not valid UTF-8 (byte {e.start})") from e
+    mimetype = (content_type or "").split(";")[0].strip().lower()
+
+    if mimetype in NDJSON_TYPES:
+        items = []
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                items.append(ValueError(f"Invalid JSON: {e.msg}"))
+    else:
+        try:
+            items = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise BatchRejected(f"Invalid JSON body: {e.msg}") from e
+        if isinstance(items, dict):
+            items = items.get("events")
+        if not isinstance(items, list):
+            raise BatchRejected("Expected a JSON array of events, an {\"events\": [...]} object or NDJSON")
+
+    if not items:
+        raise BatchRejected("Batch contains no events")
+    if len(items) > MAX_BATCH_EVENTS:
+        raise BatchRejected(f"Batch has {len(items)} events; the limit is {MAX_BATCH_EVENTS}")
+    return items
+
+
+def validate_event(item, profile_exists):
+    """
+    Check one raw item and normalize it to ``(profile_name, activity)``.
+
+    Raises ``ValueError`` for malformed events and ``LookupError`` for
+    events naming an unknown profile.
+    """
+    if isinstance(item, ValueError):
+        raise item
+    if not isinstance(item, dict):
+        raise ValueError("Event must be a JSON object")
+
+    profile_name = item.get("profile")
+    if not isinstance(profile_name, str) or not profile_name.strip():
+        raise ValueError("Missing 'profile'")
+    activity_type = item.get("type", "activity")
+    if not isinstance(activity_type, str) or not activity_type.strip():
+        raise ValueError("'type' must be a non-empty string")
+    details = item.get("details", {})
+    if not isinstance(details, dict):
+        raise ValueError("'details' must be an object")
+
+    timestamp = item.get("timestamp")
+    if timestamp is not None:
+        try:
+            timestamp = datetime.fromisoformat(str(timestamp)).isoformat()
+        except ValueError:
+            raise ValueError(f"Invalid timestamp: {timestamp!r}")
+
+    if not profile_exists(profile_name):
+        raise LookupError(f"Profile '{profile_name}' not found")
+    return profile_name, {"type": activity_type, "details": details, "timestamp": timestamp}
+
+
+def ingest_batch(progress_tracker, items, profile_exists):
+    """
+    Validate every item, then commit the valid ones grouped per profile.
+
+    Returns ``(results, committed_profiles)`` where ``results`` holds one
+    ``{"index", "status", ...}`` entry per input item, in input order.
+    """
+    results = [None] * len(items)
+    groups = defaultdict(list)
+
+    for index, item in enumerate(items):
+        try:
+            profile_name, activity = validate_event(item, profile_exists)
+        except LookupError as e:
+            results[index] = {"index": index, "status": 404, "error": str(e)}
+            continue
+        except ValueError as e:
+            results[index] = {"index": index, "status": 400, "error": str(e)}
+            continue
+        groups[profile_name].append((index, activity))
+
+    committed = []
+    for profile_name, entries in groups.items():
+        try:
+            progress_tracker.log_activities(profile_name, [activity for _, activity in entries])
+            outcome = {"status": 201, "profile": profile_name}
+            committed.append(profile_name)
+        except LockTimeout as e:
+            outcome = {"status": 503, "profile": profile_name, "error": str(e)}
+        except (OSError, ValueError) as e:
+            outcome = {"status": 500, "profile": profile_name, "error": str(e)}
+        for index, _ in entries:
+            results[index] = {"index": index, **outcome}
+
+    return results, committed
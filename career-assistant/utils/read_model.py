@@ -0,0 +1,411 @@
+"""
+read_model.py — In-Memory Dashboard Read Model
+Holds every profile and its progress statistics in memory so the
+dashboard API never re-reads the data directories per request.
+Kept fresh by a filesystem watcher (watchdog/inotify when installed,
+directory polling otherwise); every change is also published as a
+delta event for the dashboard's live ``/api/events`` stream.
+"""
+
+import base64
+import bisect
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from utils.profile_manager import summarize_activity_log, summarize_profile
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+    FileSystemEventHandler = object
+
+
+POLL_INTERVAL_SECONDS = float(os.getenv("READ_MODEL_POLL_INTERVAL", "2"))
+PROGRESS_SUFFIX = "_log"
+
+# Profile fields with a maintained sort index (``sort=field`` / ``sort=-field``)
+SORT_FIELDS = ("updated_at", "created_at", "name")
+MAX_PAGE_SIZE = 500
+
+# Profile fields carried by live profile events (what list views render)
+EVENT_PROFILE_FIELDS = ("name", "career_field", "experience_level", "created_at", "updated_at")
+
+
+class InvalidQuery(ValueError):
+    """Raised for unusable paging parameters (bad sort field or cursor)."""
+
+
+def _field_key(value):
+    return (value or "").strip().lower()
+
+
+def _encode_cursor(entry):
+    return base64.urlsafe_b64encode(json.dumps(entry).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor):
+    try:
+        value, name = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return (str(value), str(name))
+    except (ValueError, TypeError) as e:
+        raise InvalidQuery(f"Invalid cursor: {cursor!r}") from e
+
+
+def _completed_count(progress_stats):
+    return progress_stats["activity_types"].get("milestone_completed", 0)
+
+
+def _is_data_file(path):
+    # Skip lock sidecars and atomic-write temp files (both dot-prefixed)
+    return path.suffix == ".json" and not path.name.startswith(".")
+
+
+def _stat_signature(path):
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class _ChangeHandler(FileSystemEventHandler):
+    """Forward watchdog events for data files to the read model."""
+
+    def __init__(self, read_model):
+        self.read_model = read_model
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        for attr in ("src_path", "dest_path"):
+            path = getattr(event, attr, None)
+            if path:
+                self.read_model.refresh_path(Path(os.fsdecode(path)))
+
+
+class DashboardReadModel:
+    """Profiles + progress stats served from memory, refreshed on file change."""
+
+    def __init__(self, profile_manager, progress_tracker, poll_interval=POLL_INTERVAL_SECONDS, events=None):
+        self.profile_manager = profile_manager
+        self.progress_tracker = progress_tracker
+        self.events = events
+        self.profiles_dir = Path(profile_manager.profiles_dir).resolve()
+        self.progress_dir = Path(progress_tracker.data_dir).resolve()
+        self.poll_interval = poll_interval
+
+        self._lock = threading.RLock()
+        self._profiles = {}
+        self._progress = {}
+        self._signatures = {}
+        self._indexes = {}
+        self._derived = {}
+        self._etag = None
+        self.last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+        self._loaded = False
+        self._watcher = None
+        self._watcher_pid = None
+        self._stop = threading.Event()
+
+    # ── Population ────────────────────────────────────────────────────────────
+
+    def load(self):
+        """Read every profile and progress log once."""
+        with self._lock:
+            self._loaded = False
+            self._profiles.clear()
+            self._progress.clear()
+            self._signatures.clear()
+            self._indexes.clear()
+            for directory in (self.profiles_dir, self.progress_dir):
+                for path in directory.glob("*.json"):
+                    if _is_data_file(path):
+                        self._refresh(path)
+            self._loaded = True
+            self._changed()
+
+    def _key(self, path):
+        path = path if path.is_absolute() else path.resolve()
+        if path.parent == self.profiles_dir:
+            return ("profile", path.stem)
+        if path.parent == self.progress_dir and path.stem.endswith(PROGRESS_SUFFIX):
+            return ("progress", path.stem[:-len(PROGRESS_SUFFIX)])
+        return None
+
+    def _refresh(self, path):
+        """Re-read one file into memory. Returns True if anything changed."""
+        key = self._key(path)
+        if key is None:
+            return False
+        kind, name = key
+        signature = _stat_signature(path)
+        if signature == self._signatures.get(key):
+            return False
+
+        store = self._profiles if kind == "profile" else self._progress
+        if signature is None:
+            if kind == "profile":
+                self._unindex(name)
+            previous = store.pop(name, None)
+            self._signatures.pop(key, None)
+            self._publish(kind, name, previous, None)
+            return True
+
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            # Vanished or replaced mid-read; the next event will settle it
+            return False
+        previous = store.get(name)
+        if kind == "profile":
+            self._unindex(name)
+            store[name] = data
+            self._index(name)
+        else:
+            store[name] = summarize_activity_log(data)
+        self._signatures[key] = signature
+        self._publish(kind, name, previous, store[name])
+        return True
+
+    def _publish(self, kind, name, previous, current):
+        """
+        Describe one change as a live event (skipped during the initial load).
+
+        Profile events carry that profile's progress totals so clients can
+        adjust the dashboard totals, which only count existing profiles.
+        """
+        if self.events is None or not self._loaded:
+            return
+        if kind == "profile":
+            progress = self._progress.get(name) or summarize_activity_log([])
+            totals = {
+                "activities": progress["total_activities"],
+                "completed": _completed_count(progress),
+            }
+            if current is None:
+                self.events.publish("profile-deleted", {"name": name, **totals})
+                return
+            payload = {field: current.get(field) for field in EVENT_PROFILE_FIELDS}
+            payload.update(totals, name=name)
+            self.events.publish("profile-updated" if previous is not None else "profile-created", payload)
+        elif name in self._profiles:
+            before = previous or summarize_activity_log([])
+            after = current or summarize_activity_log([])
+            self.events.publish("progress-updated", {
+                "name": name,
+                "total_activities": after["total_activities"],
+                "delta_activities": after["total_activities"] - before["total_activities"],
+                "delta_completed": _completed_count(after) - _completed_count(before),
+            })
+
+    # ── Indexes ───────────────────────────────────────────────────────────────
+    # One ascending list of (value, name) per sort field, overall and per
+    # career field, kept sorted with bisect so a page is a slice, not a scan.
+
+    def _index_keys(self, name, profile):
+        career_field = _field_key(profile.get("career_field"))
+        for field in SORT_FIELDS:
+            value = name if field == "name" else str(profile.get(field) or "")
+            entry = (value, name)
+            yield (field, None), entry
+            yield (field, career_field), entry
+
+    def _index(self, name):
+        for index_key, entry in self._index_keys(name, self._profiles[name]):
+            bisect.insort(self._indexes.setdefault(index_key, []), entry)
+
+    def _unindex(self, name):
+        profile = self._profiles.get(name)
+        if profile is None:
+            return
+        for index_key, entry in self._index_keys(name, profile):
+            index = self._indexes.get(index_key, [])
+            position = bisect.bisect_left(index, entry)
+            if position < len(index) and index[position] == entry:
+                del index[position]
+
+    def refresh_path(self, path):
+        """Bring one changed file up to date (called by watchers and writers)."""
+        path = Path(path)
+        if not _is_data_file(path):
+            return
+        with self._lock:
+            if self._loaded and self._refresh(path):
+                self._changed()
+
+    def refresh_profile(self, profile_name):
+        """Write-through hook so a process sees its own writes immediately."""
+        self.refresh_path(self.profiles_dir / f"{profile_name}.json")
+        self.refresh_path(self.progress_dir / f"{profile_name}{PROGRESS_SUFFIX}.json")
+
+    def _changed(self):
+        self._derived.clear()
+        digest = hashlib.sha1(repr(sorted(self._signatures.items())).encode()).hexdigest()
+        self._etag = digest[:16]
+        self.last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+
+    # ── Watching ──────────────────────────────────────────────────────────────
+
+    def ensure_started(self):
+        """
+        Load and start watching in this process (idempotent, fork-safe).
+
+        A worker forked from a process that already loaded (e.g. a preloaded
+        WSGI master) keeps the inherited copy and only re-checks file
+        signatures, so workers share one warm start instead of each
+        re-reading every file.
+        """
+        if self._watcher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._watcher_pid == os.getpid():
+                return
+            if self._loaded:
+                self.poll_once()
+            else:
+                self.load()
+            self._stop.clear()
+            if HAS_WATCHDOG:
+                observer = Observer()
+                handler = _ChangeHandler(self)
+                for directory in (self.profiles_dir, self.progress_dir):
+                    observer.schedule(handler, str(directory), recursive=False)
+                observer.daemon = True
+                observer.start()
+                self._watcher = observer
+            else:
+                self._watcher = threading.Thread(target=self._poll, name="read-model-poll", daemon=True)
+                self._watcher.start()
+            self._watcher_pid = os.getpid()
+
+    def stop(self):
+        """Stop the watcher thread, if running in this process."""
+        self._stop.set()
+        if self._watcher_pid == os.getpid() and HAS_WATCHDOG and self._watcher is not None:
+            self._watcher.stop()
+            self._watcher.join(timeout=5)
+        self._watcher = None
+        self._watcher_pid = None
+
+    def _poll(self):
+        """Fallback watcher: diff directory listings every ``poll_interval`` seconds."""
+        while not self._stop.wait(self.poll_interval):
+            self.poll_once()
+
+    def poll_once(self):
+        """One polling pass: refresh new, changed and deleted files."""
+        with self._lock:
+            seen = set()
+            changed = False
+            for directory in (self.profiles_dir, self.progress_dir):
+                for path in directory.glob("*.json"):
+                    if not _is_data_file(path):
+                        continue
+                    key = self._key(path)
+                    seen.add(key)
+                    changed |= self._refresh(path)
+            for kind, name in [k for k in self._signatures if k not in seen]:
+                directory = self.profiles_dir if kind == "profile" else self.progress_dir
+                suffix = "" if kind == "profile" else PROGRESS_SUFFIX
+                changed |= self._refresh(directory / f"{name}{suffix}.json")
+            if changed:
+                self._changed()
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+
+    @property
+    def etag(self):
+        """Content-derived validator; identical across processes for the same data."""
+        return self._etag
+
+    def resource_etag(self, profile_name):
+        """Validator for one profile and its progress log."""
+        with self._lock:
+            signature = (
+                self._signatures.get(("profile", profile_name)),
+                self._signatures.get(("progress", profile_name)),
+            )
+        return hashlib.sha1(f"{profile_name}:{signature}".encode()).hexdigest()[:16]
+
+    def _memo(self, key, build):
+        with self._lock:
+            if key not in self._derived:
+                self._derived[key] = build()
+            return self._derived[key]
+
+    def list_profiles(self):
+        """All profiles, most recently updated first."""
+        return self._memo("profiles", lambda: [
+            self._profiles[name] for _, name in reversed(self._indexes.get(("updated_at", None), []))
+        ])
+
+    def page_profiles(self, limit=None, cursor=None, career_field=None, sort="-updated_at", fields=None):
+        """
+        One page of profiles from the sort index.
+
+        ``cursor`` is the opaque ``next_cursor`` of the previous page, so
+        paging stays stable while profiles are added or removed. Returns
+        ``(items, next_cursor, total)``; work is proportional to ``limit``.
+        """
+        descending = sort.startswith("-")
+        field = sort.lstrip("-+")
+        if field not in SORT_FIELDS:
+            raise InvalidQuery(f"Cannot sort by {field!r}; use one of {', '.join(SORT_FIELDS)}")
+        limit = MAX_PAGE_SIZE if limit is None else max(1, min(int(limit), MAX_PAGE_SIZE))
+        after = _decode_cursor(cursor) if cursor else None
+
+        with self._lock:
+            index = self._indexes.get((field, _field_key(career_field) if career_field else None), [])
+            if descending:
+                stop = bisect.bisect_left(index, after) if after else len(index)
+                entries = index[max(0, stop - limit):stop][::-1]
+                more = stop - limit > 0
+            else:
+                start = bisect.bisect_right(index, after) if after else 0
+                entries = index[start:start + limit]
+                more = start + limit < len(index)
+            profiles = [self._profiles[name] for _, name in entries]
+            total = len(index)
+
+        if fields:
+            profiles = [{f: p.get(f) for f in fields} for p in profiles]
+        next_cursor = _encode_cursor(list(entries[-1])) if more and entries else None
+        return profiles, next_cursor, total
+
+    def get_profile(self, profile_name):
+        with self._lock:
+            return self._profiles.get(profile_name)
+
+    def get_profile_stats(self, profile_name):
+        profile = self.get_profile(profile_name)
+        return summarize_profile(profile) if profile else None
+
+    def get_progress_stats(self, profile_name):
+        with self._lock:
+            return self._progress.get(profile_name) or summarize_activity_log([])
+
+    def dashboard_stats(self):
+        """Totals for ``/api/stats``, recomputed only after a change."""
+        def build():
+            profiles = self.list_profiles()
+            total_activities = 0
+            total_completed = 0
+            for profile in profiles:
+                stats = self._progress.get(profile.get("name", ""), {})
+                total_activities += stats.get("total_activities", 0)
+                total_completed += stats.get("activity_types", {}).get("milestone_completed", 0)
+            return {
+                "total_profiles": len(profiles),
+                "total_activities": total_activities,
+                "total_completed": total_completed,
+                "recent_profiles": profiles[:5],
+            }
+        return self._memo("stats", build)
@@ -0,0 +1,152 @@
+"""
+resume_parser.py — Local Resume Section Parser
+Splits resume text into sections by recognizing headings, strips contact
+details and bullet/whitespace noise, deduplicates lines, and renders a
+compact digest to send to the model instead of the raw text.
+"""
+
+import re
+
+
+# Section → headings that open it (compared after lowercasing and
+# dropping punctuation, so "WORK EXPERIENCE:" and "## Work Experience" match)
+SECTION_HEADINGS = {
+    "summary": ["summary", "professional summary", "profile", "objective", "career objective", "about me"],
+    "skills": ["skills", "technical skills", "key skills", "core competencies", "competencies",
+               "technologies", "tech stack", "tools", "tools and technologies", "skills and tools"],
+    "experience": ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "internship", "internships", "internship experience"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects", "selected projects"],
+    "education": ["education", "academic background", "academics", "qualifications", "educational qualifications"],
+    "certifications": ["certifications", "certification", "certificates", "licenses and certifications",
+                       "courses", "training", "courses and certifications"],
+    "achievements": ["achievements", "awards", "honors", "awards and achievements", "accomplishments"],
+}
+SECTION_ORDER = list(SECTION_HEADINGS) + ["other"]
+
+_HEADING_LOOKUP = {heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings}
+_LONGEST_HEADING_WORDS = max(len(heading.split()) for heading in _HEADING_LOOKUP)
+
+EMAIL_PATTERN = re.compile(r"\S+@\S+\.\w+")
+URL_PATTERN = re.compile(r"(?:https?://|www\.)\S+|\b(?:linkedin|github|gitlab)\.com/\S*", re.IGNORECASE)
+# Phone-shaped runs only: "+" international, "(555) 123-4567" or 3-3-4 groups.
+# A looser digit run would also swallow date ranges ("2019-2021 2021-2023").
+PHONE_PATTERN = re.compile(
+    r"\+\d{1,3}[\s.-]?(?:\(\d{1,4}\)[\s.-]?)?\d{2,4}(?:[\s.-]?\d{2,4}){1,3}"
+    r"|(?:\(\d{3}\)\s?|\b\d{3}[\s.-]?)\d{3}[\s.-]?\d{4}\b"
+)
+PHONE_MIN_DIGITS = 10  # phone-shaped runs with fewer digits are left alone
+CONTACT_LABEL_PATTERN = re.compile(r"\b(?:email|e-mail|phone|mobile|tel|linkedin|github|portfolio|website)\s*:", re.IGNORECASE)
+BULLET_PATTERN = re.compile(r"^(?:[-*•●▪◦‣–—>]+|\d{1,2}[.)])\s*")
+SEPARATOR_PATTERN = re.compile(r"^[\s|,;:/·•-]*$")
+SKILL_SPLIT_PATTERN = re.compile(r"\s*(?:[,;|•·]|\s+/\s+)\s*")
+
+
+def _heading_key(line):
+    return " ".join(re.sub(r"[^a-z ]+", " ", line.lower().replace("&", " and ")).split())
+
+
+def match_heading(line):
+    """
+    ``(section, inline_content)`` if ``line`` opens a section, else None.
+
+    Handles bare headings ("EXPERIENCE", "Technical Skills:") and inline
+    ones ("Skills: Python, SQL"), where the rest of the line is content.
+    """
+    stripped = line.strip().strip("#=*_ ")
+    if not stripped:
+        return None
+    head, sep, rest = stripped.partition(":")
+    key = _heading_key(head)
+    if len(key.split()) > _LONGEST_HEADING_WORDS:
+        return None
+    section = _HEADING_LOOKUP.get(key)
+    if section is None:
+        return None
+    return section, rest.strip() if sep else ""
+
+
+def _drop_phone(match):
+    digits = sum(char.isdigit() for char in match.group())
+    return " " if digits >= PHONE_MIN_DIGITS else match.group()
+
+
+def clean_line(line):
+    """Strip contact details, bullets and repeated whitespace from one line."""
+    line = EMAIL_PATTERN.sub(" ", line)
+    line = URL_PATTERN.sub(" ", line)
+    line = PHONE_PATTERN.sub(_drop_phone, line)
+    line = CONTACT_LABEL_PATTERN.sub(" ", line)
+    line = BULLET_PATTERN.sub("", line.strip())
+    line = " ".join(line.split())
+    return "" if SEPARATOR_PATTERN.match(line) else line.strip(" |,;")
+
+
+def split_skills(lines):
+    """Individual skills from skill-section lines ("Languages: Python, Java" → Python, Java)."""
+    skills = []
+    for line in lines:
+        _, _, items = line.rpartition(":")
+        skills.extend(item.strip(" .") for item in SKILL_SPLIT_PATTERN.split(items))
+    return [skill for skill in skills if skill]
+
+
+def _dedupe(items):
+    seen = set()
+    unique = []
+    for item in items:
+        key = item.casefold()
+        if key not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
+
+
+def parse_resume(resume_text):
+    """
+    Split a resume into ``{section: [lines]}``.
+
+    Lines before the first recognized heading (name, contact block,
+    untitled intro) go to "other" once contact details are removed.
+    Skills are split into one entry per skill. Each section's lines are
+    cleaned and deduplicated case-insensitively, keeping first-seen order;
+    sections are returned in ``SECTION_ORDER`` and empty ones omitted.
+    """
+    sections = {}
+    current = "other"
+    for raw_line in resume_text.splitlines():
+        heading = match_heading(raw_line)
+        if heading:
+            current, raw_line = heading
+        line = clean_line(raw_line)
+        if line:
+            sections.setdefault(current, []).append(line)
+
+    if "skills" in sections:
+        sections["skills"] = split_skills(sections["skills"])
+    return {
+        section: _dedupe(sections[section])
+        for section in SECTION_ORDER
+        if sections.get(section)
+    }
+
+
+def resume_digest(resume_text):
+    """
+    Compact, structured version of a resume for LLM prompts.
+
+    One labelled block per section, skills on a single comma-separated
+    line. Falls back to the cleaned text when no headings are found, so
+    no content is dropped from unconventional resumes.
+    """
+    sections = parse_resume(resume_text)
+    if set(sections) <= {"other"}:
+        return "\n".join(sections.get("other", []))
+
+    blocks = []
+    for section, lines in sections.items():
+        if section == "skills":
+            blocks.append(f"SKILLS: {', '.join(lines)}")
+            continue
+        blocks.append(f"{section.upper()}:\n" + "\n".join(f"- {line}" for line in lines))
+    return "\n\n".join(blocks)
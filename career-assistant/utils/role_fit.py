@@ -0,0 +1,165 @@
+"""
+role_fit.py — Role-Fit Matrix Engine
+Compiles role requirement tables into one dense role × skill matrix so a
+candidate (or a whole batch of candidates) is scored against every role
+in a single vectorized operation.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Candidates scored per block in batch mode; bounds the
+# candidates × roles × skills intermediate to a few MB.
+BATCH_BLOCK_SIZE = 256
+
+
+class RoleFitMatrix:
+    """
+    Required skill levels for every role, aligned on one skill index.
+
+    ``readiness`` is level-weighted coverage: the share of a role's total
+    required levels the candidate meets, counting each skill at most up
+    to its requirement. ``gaps`` are ``required - current`` per skill
+    (negative for a surplus, as in ``calculate_gaps``), zero where the
+    role doesn't need the skill.
+
+    ``skill_aliases`` and ``role_aliases`` map names used by one table to
+    the names used by another, so "Linux/Unix" and "Linux" share a column
+    and "DevOps" and "DevOps Engineer" share a row. Merged requirements
+    keep the higher level.
+    """
+
+    def __init__(self, *role_tables, skill_aliases=None, role_aliases=None):
+        self.skill_aliases = dict(skill_aliases or {})
+        self.role_aliases = dict(role_aliases or {})
+        requirements = {}
+        for table in role_tables:
+            for role, skills in table.items():
+                merged = requirements.setdefault(self.resolve_role(role), {})
+                for skill, level in skills.items():
+                    skill = self.resolve_skill(skill)
+                    merged[skill] = max(level, merged.get(skill, 0))
+
+        self.roles = list(requirements)
+        self.skills = sorted({skill for skills in requirements.values() for skill in skills})
+        self.skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        self.role_index = {role: i for i, role in enumerate(self.roles)}
+
+        self.required = np.zeros((len(self.roles), len(self.skills)), dtype=np.float32)
+        for r, skills in enumerate(requirements.values()):
+            for skill, level in skills.items():
+                self.required[r, self.skill_index[skill]] = level
+        self.mask = self.required > 0
+        self.total_required = np.maximum(self.required.sum(axis=1), 1)
+        self.skill_counts = self.mask.sum(axis=1)
+
+    # ── Names ─────────────────────────────────────────────────────────────────
+
+    def resolve_skill(self, skill):
+        """The matrix's name for a skill (aliases resolved)."""
+        return self.skill_aliases.get(skill, skill)
+
+    def resolve_role(self, role):
+        """The matrix's name for a role (aliases resolved)."""
+        return self.role_aliases.get(role, role)
+
+    def role_requirements(self, role):
+        """``{skill: level}`` a role (or one of its aliases) requires; empty if unknown."""
+        r = self.role_index.get(self.resolve_role(role))
+        if r is None:
+            return {}
+        return {self.skills[c]: float(self.required[r, c]) for c in np.flatnonzero(self.mask[r])}
+
+    # ── Candidate vectors ─────────────────────────────────────────────────────
+
+    def candidate_vector(self, skills, assumed_level=None):
+        """
+        Skill levels as a vector on the matrix's skill index.
+
+        With ``assumed_level`` every listed skill counts at that level
+        (for skills detected in a resume, which carry no level). Skills
+        no role requires are ignored; aliases of one skill keep the
+        highest level.
+        """
+        vector = np.zeros(len(self.skills), dtype=np.float32)
+        for skill, level in skills.items():
+            column = self.skill_index.get(self.resolve_skill(skill))
+            if column is not None:
+                level = level if assumed_level is None else assumed_level
+                vector[column] = max(vector[column], level)
+        return vector
+
+    def candidate_matrix(self, candidates, assumed_level=None):
+        """Stack many candidates' skill dicts into a candidates × skills matrix."""
+        if not candidates:
+            return np.zeros((0, len(self.skills)), dtype=np.float32)
+        return np.stack([self.candidate_vector(skills, assumed_level) for skills in candidates])
+
+    # ── Scoring ───────────────────────────────────────────────────────────────
+
+    def _met(self, levels):
+        # candidates × roles × skills: level met, capped at each requirement
+        return np.minimum(levels[:, None, :], self.required[None, :, :])
+
+    def readiness(self, levels):
+        """Readiness % for every candidate × role (levels: candidates × skills)."""
+        levels = np.atleast_2d(levels)
+        scores = np.empty((len(levels), len(self.roles)), dtype=np.float32)
+        for start in range(0, len(levels), BATCH_BLOCK_SIZE):
+            block = levels[start:start + BATCH_BLOCK_SIZE]
+            scores[start:start + len(block)] = self._met(block).sum(axis=2) / self.total_required * 100
+        return scores
+
+    def gaps(self, levels):
+        """
+        Per-skill gaps for every role: roles × skills for one candidate
+        vector, candidates × roles × skills for a candidates matrix.
+        """
+        levels = np.asarray(levels, dtype=np.float32)
+        return np.where(self.mask, self.required - levels[..., None, :], 0)
+
+    def rank_roles(self, skills, assumed_level=None, top=None):
+        """
+        Score one candidate against every role, best fit first.
+
+        Returns a list of ``{"role", "readiness", "matched", "total",
+        "gaps"}`` where ``gaps`` maps each required skill to its gap,
+        largest first.
+        """
+        vector = self.candidate_vector(skills, assumed_level)
+        readiness = self.readiness(vector)[0]
+        gaps = self.gaps(vector)
+        matched = ((vector[None, :] > 0) & self.mask).sum(axis=1)
+
+        ranking = []
+        for r in np.argsort(-readiness, kind="stable")[:top]:
+            columns = np.flatnonzero(self.mask[r])
+            columns = columns[np.argsort(-gaps[r, columns], kind="stable")]
+            ranking.append({
+                "role": self.roles[r],
+                "readiness": round(float(readiness[r]), 1),
+                "matched": int(matched[r]),
+                "total": int(self.skill_counts[r]),
+                "gaps": {self.skills[c]: float(gaps[r, c]) for c in columns},
+            })
+        return ranking
+
+    def rank_batch(self, candidates, assumed_level=None):
+        """
+        Readiness of many candidates for every role.
+
+        ``candidates`` maps a candidate id to its skill dict. Returns a
+        candidates × roles DataFrame plus ``best_role``/``best_readiness``.
+        """
+        names = list(candidates)
+        levels = self.candidate_matrix([candidates[name] for name in names], assumed_level)
+        scores = self.readiness(levels).astype(np.float64).round(1)
+        frame = pd.DataFrame(scores, index=pd.Index(names, name="candidate"), columns=self.roles)
+        if names:
+            frame["best_role"] = frame[self.roles].idxmax(axis=1)
+            frame["best_readiness"] = frame[self.roles].max(axis=1)
+        else:
+            frame["best_role"] = pd.Series(dtype="object")
+            frame["best_readiness"] = pd.Series(dtype="float64")
+        return frame
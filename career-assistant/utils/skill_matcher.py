@@ -0,0 +1,95 @@
+"""
+skill_matcher.py — Compiled Multi-Pattern Skill Extraction
+A token trie over every skill synonym. A resume is tokenized once and
+scanned once, matching whole tokens only, so "py" no longer fires on
+"happy" and "ml" no longer fires on "html".
+"""
+
+import re
+from collections import defaultdict
+
+
+# Words, optionally with a +/# suffix (c++, c#), plus the joining
+# punctuation that is part of skill names (ci/cd, node.js). Whitespace,
+# hyphens and everything else only separate tokens, so "machine-learning"
+# and "machine\nlearning" both match "machine learning".
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+[+#]*|[./]", re.IGNORECASE)
+
+
+def tokenize(text):
+    """Lowercased ``(token, start, end)`` triples with offsets into ``text``."""
+    return [(m.group().lower(), m.start(), m.end()) for m in TOKEN_PATTERN.finditer(text)]
+
+
+class SkillMatcher:
+    """
+    Leftmost-longest phrase matcher over a synonym table.
+
+    ``synonyms`` maps a skill id to its phrases; a phrase may belong to
+    several skills. Scanning is linear in the text length (times the
+    longest phrase, a small constant), independent of how many skills
+    or synonyms are loaded.
+    """
+
+    def __init__(self, synonyms=None):
+        self._root = {}
+        self.skills = set()
+        self.max_phrase_tokens = 0
+        for skill, phrases in (synonyms or {}).items():
+            self.add(skill, skill)
+            for phrase in phrases:
+                self.add(skill, phrase)
+
+    def add(self, skill, phrase):
+        """Register ``phrase`` as a mention of ``skill``."""
+        tokens = [token for token, _, _ in tokenize(phrase)]
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node.setdefault(None, set()).add(skill)  # the None key marks a phrase end
+        self.skills.add(skill)
+        self.max_phrase_tokens = max(self.max_phrase_tokens, len(tokens))
+
+    def iter_matches(self, text):
+        """Yield ``(skills, start, end)`` for each non-overlapping phrase match."""
+        tokens = tokenize(text)
+        position = 0
+        while position < len(tokens):
+            node = self._root
+            match = None
+            cursor = position
+            while cursor < len(tokens) and tokens[cursor][0] in node:
+                node = node[tokens[cursor][0]]
+                cursor += 1
+                if None in node:
+                    match = (node[None], cursor)
+            if match is None:
+                position += 1
+                continue
+            skills, cursor = match
+            yield skills, tokens[position][1], tokens[cursor - 1][2]
+            position = cursor
+
+    def scan(self, text):
+        """
+        Find every skill mention in ``text``.
+
+        Returns ``{skill: {"count": n, "offsets": [(start, end), ...]}}``
+        with offsets into the original text.
+        """
+        found = defaultdict(lambda: {"count": 0, "offsets": []})
+        for skills, start, end in self.iter_matches(text):
+            for skill in skills:
+                found[skill]["count"] += 1
+                found[skill]["offsets"].append((start, end))
+        return dict(found)
+
+    def counts(self, text):
+        """``{skill: mentions}`` for every skill found in ``text``."""
+        counts = defaultdict(int)
+        for skills, _, _ in self.iter_matches(text):
+            for skill in skills:
+                counts[skill] += 1
+        return dict(counts)
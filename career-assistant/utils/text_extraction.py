@@ -0,0 +1,160 @@
+"""
+text_extraction.py — Cached, Parallel Resume Text Extraction
+Uploads are keyed by a SHA-256 of their bytes: Streamlit reruns and
+re-uploads of the same file reuse the extracted text instead of parsing
+it again, and sessions keep only the hash. Large PDFs are split into page
+ranges extracted in worker processes.
+"""
+
+import hashlib
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+from config import (
+    EXTRACTION_CACHE_SIZE,
+    EXTRACTION_WORKERS,
+    MAX_PDF_PAGES,
+    MAX_UPLOAD_MB,
+    PDF_PARALLEL_MIN_PAGES,
+)
+
+try:
+    from PyPDF2 import PdfReader
+    HAS_PDF = True
+except ImportError:
+    HAS_PDF = False
+
+try:
+    from docx import Document
+    HAS_DOCX = True
+except ImportError:
+    HAS_DOCX = False
+
+
+class ExtractionError(ValueError):
+    """Raised for uploads that are too large, unsupported or unreadable."""
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def content_hash(data):
+    """Stable key for an upload's bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+# ── PDF ───────────────────────────────────────────────────────────────────────
+
+def _extract_pdf_pages(data, start, stop):
+    """Text of pages ``[start, stop)``; runs in a worker process."""
+    reader = PdfReader(BytesIO(data))
+    return "\n".join((reader.pages[i].extract_text() or "") for i in range(start, stop))
+
+
+def _get_pool():
+    # Workers come from a fork server, not a fork of the multi-threaded
+    # Streamlit process, and don't re-run the app's __main__ like spawn
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _pool = ProcessPoolExecutor(
+                max_workers=EXTRACTION_WORKERS,
+                mp_context=multiprocessing.get_context(method),
+            )
+        return _pool
+
+
+def extract_pdf_bytes(data, max_pages=MAX_PDF_PAGES, workers=EXTRACTION_WORKERS):
+    """Extract a PDF's text, in parallel page ranges when it is long."""
+    if not HAS_PDF:
+        raise ExtractionError("PDF support not installed. Please run: pip install PyPDF2")
+    try:
+        page_count = len(PdfReader(BytesIO(data)).pages)
+    except Exception as e:
+        raise ExtractionError(f"Error reading PDF: {e}") from e
+    if page_count > max_pages:
+        raise ExtractionError(f"PDF has {page_count} pages; the limit is {max_pages}")
+
+    if page_count < PDF_PARALLEL_MIN_PAGES or workers <= 1:
+        return _extract_pdf_pages(data, 0, page_count)
+
+    step = -(-page_count // workers)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    pool = _get_pool()
+    futures = [pool.submit(_extract_pdf_pages, data, start, stop) for start, stop in ranges]
+    return "\n".join(future.result() for future in futures)
+
+
+# ── DOCX / TXT ────────────────────────────────────────────────────────────────
+
+def extract_docx_bytes(data):
+    if not HAS_DOCX:
+        raise ExtractionError("DOCX support not installed. Please run: pip install python-docx")
+    try:
+        document = Document(BytesIO(data))
+    except Exception as e:
+        raise ExtractionError(f"Error reading DOCX: {e}") from e
+    return "\n".join(paragraph.text for paragraph in document.paragraphs)
+
+
+def extract_txt_bytes(data):
+    return data.decode("utf-8", errors="replace")
+
+
+EXTRACTORS = {
+    ".pdf": extract_pdf_bytes,
+    ".docx": extract_docx_bytes,
+    ".txt": extract_txt_bytes,
+}
+
+
+# ── Cached Entry Points ───────────────────────────────────────────────────────
+
+def extract_upload(data, filename):
+    """
+    Text of an uploaded resume, extracted at most once per distinct file.
+
+    Returns ``(digest, text)``; keep the digest (not the text) in session
+    state and read the text back with ``get_extracted_text``. Raises
+    ``ExtractionError`` for oversized, unsupported or unreadable files.
+    """
+    if len(data) > MAX_UPLOAD_MB * 1024 * 1024:
+        raise ExtractionError(f"File is {len(data) / 2**20:.1f} MB; the limit is {MAX_UPLOAD_MB:g} MB")
+    extractor = EXTRACTORS.get(Path(filename).suffix.lower())
+    if extractor is None:
+        raise ExtractionError(f"Unsupported file type: {filename}")
+
+    digest = content_hash(data)
+    text = get_extracted_text(digest)
+    if text is None:
+        text = extractor(data)
+        remember_text(digest, text)
+    return digest, text
+
+
+def remember_text(digest, text):
+    """Store extracted text under ``digest`` (least recently used evicted first)."""
+    with _cache_lock:
+        _cache[digest] = text
+        _cache.move_to_end(digest)
+        while len(_cache) > EXTRACTION_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def get_extracted_text(digest):
+    """Cached text for an upload digest, or None if unknown or evicted."""
+    if not digest:
+        return None
+    with _cache_lock:
+        text = _cache.get(digest)
+        if text is not None:
+            _cache.move_to_end(digest)
+        return text
@@ -0,0 +1,23 @@
+"""
+wsgi.py — Production Entry Point for the Web Dashboard
+Exposes the Flask app to a WSGI server:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+The read model is loaded here, at import time. With ``preload_app`` the
+master process does this once and every forked worker inherits the warm
+profiles, progress stats and sort indexes; each worker then only starts
+its own file watcher on its first request.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.chdir(os.path.dirname(os.path.abspath(__file__)))  # data/ paths are relative
+
+from dashboard import app, read_model
+
+read_model.load()
+
+application = app
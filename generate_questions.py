@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# ============================================================================
+# QUESTION BANK GENERATION
+# ============================================================================
+# Batch-generate assessment questions with an LLM and store them in the
+# question bank, so the app serves them without calling the model. Calls for
+# each topic and difficulty band run concurrently; near-duplicates (same
+# normalized text within a topic) are dropped.
+#
+#   python generate_questions.py "SQL Basics" "Data Structures" --provider mock --dry-run
+#   python generate_questions.py "SQL Basics" --provider mock --db /tmp/scratch_bank.db
+#   python generate_questions.py "SQL Basics" --calls 4 --record data/question_replay.jsonl
+#   python generate_questions.py "SQL Basics" --calls 4 --provider replay --replay data/question_replay.jsonl
+#
+# A replay only matches prompts recorded against the same bank contents,
+# since each prompt lists the topic's newest questions to avoid.
+
+import argparse
+
+from utils import question_bank, question_generation
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate assessment questions into the question bank")
+    parser.add_argument("topics", nargs="+", help="Topics to generate questions for")
+    parser.add_argument("--provider", choices=["hf", "replay", "mock"], default="hf",
+                        help="hf = live HuggingFace model, replay = recorded responses, mock = offline synthetic")
+    parser.add_argument("--replay", help="Replay file for --provider replay")
+    parser.add_argument("--record", help="Append successful responses to this replay file")
+    parser.add_argument("--difficulties", nargs="+", choices=list(question_generation.DIFFICULTY_BANDS),
+                        help="Difficulty bands (default: all)")
+    parser.add_argument("--per-call", type=int, default=5, help="Questions requested per call")
+    parser.add_argument("--calls", type=int, default=2, help="Calls per topic and difficulty band")
+    parser.add_argument("--workers", type=int, default=question_generation.DEFAULT_WORKERS,
+                        help="Concurrent model calls")
+    parser.add_argument("--max-tokens", type=int, default=question_generation.DEFAULT_MAX_TOKENS)
+    parser.add_argument("--db", help=f"Question bank file (default: {question_bank.BANK_PATH})")
+    parser.add_argument("--dry-run", action="store_true", help="Generate and deduplicate without writing")
+    parser.add_argument("--show-errors", type=int, default=10, help="Failed calls to list")
+    args = parser.parse_args()
+    if args.provider == "mock" and not (args.dry_run or args.db):
+        # Mock items are placeholders; never let them reach the bank the app serves from
+        parser.error("--provider mock writes placeholder questions; add --dry-run or an explicit --db")
+
+    try:
+        provider = question_generation.make_provider(args.provider, args.replay, args.record)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    question_bank.open_bank(args.db)
+
+    summary = question_generation.generate_questions(
+        args.topics, provider, args.provider,
+        difficulties=args.difficulties, per_call=args.per_call, calls=args.calls,
+        workers=args.workers, max_tokens=args.max_tokens, dry_run=args.dry_run, progress=print,
+    )
+
+    calls_per_second = summary["calls"] / summary["elapsed"] if summary["elapsed"] else 0.0
+    print(f"\n{summary['calls']} calls ({summary['failed_calls']} failed, {summary['attempts']} attempts) "
+          f"in {summary['elapsed']:.1f}s, {calls_per_second:.1f} calls/s")
+    print(f"{summary['generated']} questions generated: {summary['rejected']} rejected, "
+          f"{summary['duplicates_in_run']} duplicates within the run, "
+          f"{summary['duplicates_in_bank']} already in the bank")
+    if args.dry_run:
+        print(f"dry run: {summary['would_insert']} questions would be inserted")
+    else:
+        for topic, inserted in summary["topics"].items():
+            print(f"{inserted:>8}  {topic}")
+        print(f"{summary['inserted']} inserted into {question_bank.bank_stats()['path']}")
+    for error in summary["errors"][:args.show_errors]:
+        print(f"    {error}")
+    return 1 if summary["failed_calls"] == summary["calls"] else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# ============================================================================
+# QUESTION BANK IMPORT
+# ============================================================================
+# Bulk-load assessment questions from CSV, JSON or JSON Lines files into the
+# question bank. Near-duplicate questions (same topic, same normalized text)
+# are skipped.
+#
+#   python import_questions.py questions.csv more_questions.json
+#   python import_questions.py sql.csv --topic "SQL Basics" --db data/question_bank.db
+#   python import_questions.py --stats
+
+import argparse
+import time
+
+from utils import question_bank
+
+def main():
+    parser = argparse.ArgumentParser(description="Import questions into the assessment question bank")
+    parser.add_argument("files", nargs="*", help="CSV, JSON or JSONL question files")
+    parser.add_argument("--topic", help="Topic for records that don't name one")
+    parser.add_argument("--db", help=f"Question bank file (default: {question_bank.BANK_PATH})")
+    parser.add_argument("--stats", action="store_true", help="Print per-topic counts and exit")
+    parser.add_argument("--show-rejected", type=int, default=10, help="Rejected rows to list per file")
+    args = parser.parse_args()
+
+    question_bank.open_bank(args.db)
+    if not args.stats and not args.files:
+        parser.error("give question files to import, or --stats")
+
+    failed = False
+    for path in args.files:
+        start = time.perf_counter()
+        try:
+            records = question_bank.read_question_file(path)
+        except (OSError, ValueError) as e:
+            print(f"{path}: cannot read ({e})")
+            failed = True
+            continue
+        summary = question_bank.add_questions(records, default_topic=args.topic)
+        elapsed = time.perf_counter() - start
+        print(f"{path}: {summary['inserted']} inserted, {summary['duplicates']} duplicates, "
+              f"{len(summary['rejected'])} rejected ({elapsed:.2f}s)")
+        for position, error in summary["rejected"][:args.show_rejected]:
+            print(f"    record {position}: {error}")
+        failed = failed or bool(summary["rejected"])
+
+    stats = question_bank.bank_stats()
+    print(f"\n{stats['questions']} questions, {len(stats['topics'])} topics, {stats['tags']} tags in {stats['path']}")
+    if args.stats:
+        for topic, count in stats["topics"].items():
+            print(f"{count:>8}  {topic}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,439 @@
+import contextlib
+import io
+import json
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+try:
+    from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+    HAS_STREAMLIT = True
+except ImportError:
+    HAS_STREAMLIT = False
+
+import batch_reports
+import generate_questions
+from utils import cohort, question_bank, question_generation, storage
+from utils import reports
+from utils.resume_parser import resume_digest
+from utils.reports import calculate_profile_engagement
+from utils.assessment import answer_adaptive_question, estimate_ability, start_adaptive_assessment
+
+
+def _synthetic_questions(topic, count):
+    """Four-option questions with difficulties spread over -2..2"""
+    return [{
+        "topic": topic,
+        "question": f"Synthetic question number {i}",
+        "options": ["a", "b", "c", "d"],
+        "correct": i % 4,
+        "difficulty": -2 + 4 * i / max(count - 1, 1),
+        "discrimination": 1.2,
+    } for i in range(count)]
+
+
+class BankTestCase(unittest.TestCase):
+    """Runs against a fresh question bank in a temporary directory."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.saved_path = question_bank.BANK_PATH
+        question_bank.open_bank(Path(self.tmp) / "bank.db")
+
+    def tearDown(self):
+        question_bank.close_bank()
+        question_bank.BANK_PATH = self.saved_path
+        shutil.rmtree(self.tmp)
+
+
+class TestAbilityEstimate(unittest.TestCase):
+    def test_estimate_follows_answers_and_narrows(self):
+        a, b = np.full(8, 1.5), np.linspace(-1.5, 1.5, 8)
+        for outcome, direction in ((True, 1), (False, -1)):
+            thetas, errors = [0.0], [1.0]
+            for n in range(1, 9):
+                theta, se = estimate_ability(a[:n], b[:n], np.full(n, outcome))
+                thetas.append(theta)
+                errors.append(se)
+            self.assertTrue(all(direction * (later - earlier) > 0 for earlier, later in zip(thetas, thetas[1:])))
+            self.assertTrue(all(later < earlier for earlier, later in zip(errors, errors[1:])))
+
+    def test_mixed_answers_land_between(self):
+        a, b = np.ones(6), np.zeros(6)
+        theta, _ = estimate_ability(a, b, np.array([True, False] * 3))
+        self.assertAlmostEqual(theta, 0.0, places=6)
+
+
+class TestAdaptiveAssessment(BankTestCase):
+    def setUp(self):
+        super().setUp()
+        question_bank.add_questions(_synthetic_questions("Synthetic", 40))
+
+    def _run(self, state, always_correct=True):
+        while not state["finished"]:
+            question = question_bank.get_question(state["current"])
+            answer = question["correct"] if always_correct else (question["correct"] + 1) % 4
+            answer_adaptive_question(state, answer)
+        return state
+
+    def test_stops_once_se_target_is_reached(self):
+        state = self._run(start_adaptive_assessment("Synthetic", max_questions=30, se_target=0.6))
+        self.assertLessEqual(state["se"], 0.6)
+        self.assertLess(len(state["administered"]), 30)
+        self.assertTrue(all(step["se"] > 0.6 for step in state["history"][:-1]))
+        self.assertGreater(state["theta"], 0)
+
+    def test_stops_at_max_questions(self):
+        state = self._run(start_adaptive_assessment("Synthetic", max_questions=4, se_target=0.0), always_correct=False)
+        self.assertEqual(len(state["administered"]), 4)
+        self.assertEqual(len(set(state["administered"])), 4)
+        self.assertLess(state["theta"], 0)
+
+    def test_profile_skips_seen_questions_while_enough_remain(self):
+        ids = list(question_bank.load_topic("Synthetic")["ids"][:30])
+        question_bank.mark_seen("ann", ids)
+        state = self._run(start_adaptive_assessment("Synthetic", profile="ann", max_questions=5, se_target=0.0))
+        self.assertFalse(set(state["administered"]) & set(ids))
+
+
+class TestQuestionValidation(unittest.TestCase):
+    RECORD = {"topic": "SQL", "question": "Which clause filters groups?",
+              "options": ["WHERE", "HAVING", "ORDER BY"], "correct": 1}
+
+    def test_correct_as_index_or_letter(self):
+        for correct in (1, "1", "B", "b", " b "):
+            self.assertEqual(question_bank.validate_question({**self.RECORD, "correct": correct})["correct"], 1)
+        record = question_bank.validate_question({**self.RECORD, "options": "WHERE| HAVING |", "tags": "sql; Basics"})
+        self.assertEqual(record["options"], ["WHERE", "HAVING"])
+        self.assertEqual(record["tags"], ["basics", "sql"])
+        self.assertEqual((record["difficulty"], record["discrimination"]), (0.0, 1.0))
+
+    def test_rejections(self):
+        bad = [
+            ({"topic": ""}, "missing topic"),
+            ({"question": "  "}, "missing question"),
+            ({"options": ["only one"]}, "at least two options"),
+            ({"correct": 3}, "not one of 3 options"),
+            ({"correct": "D"}, "not one of 3 options"),
+            ({"correct": None}, "not one of 3 options"),
+        ]
+        for change, message in bad:
+            with self.assertRaisesRegex(ValueError, message):
+                question_bank.validate_question({**self.RECORD, **change})
+        self.assertEqual(question_bank.validate_question({**self.RECORD, "topic": None}, "Fallback")["topic"], "Fallback")
+
+
+class TestQuestionBank(BankTestCase):
+    def test_dedupe_by_fingerprint_within_and_across_batches(self):
+        records = [
+            {"question": "What does SQL stand for?", "options": ["a", "b"], "correct": 0},
+            {"question": "what does  SQL stand for", "options": ["c", "d"], "correct": 1},
+            {"question": "What is a JOIN?", "options": ["a", "b"], "correct": "Z"},
+        ]
+        summary = question_bank.add_questions(records, default_topic="Databases")
+        self.assertEqual((summary["inserted"], summary["duplicates"]), (1, 1))
+        self.assertEqual([position for position, _ in summary["rejected"]], [3])
+
+        again = question_bank.add_questions([
+            {"question": "WHAT DOES SQL STAND FOR!", "options": ["a", "b"], "correct": 0},
+            {"question": "What does SQL stand for?", "options": ["a", "b"], "correct": 0, "topic": "Other"},
+        ], default_topic="Databases")
+        self.assertEqual((again["inserted"], again["duplicates"]), (1, 1))
+        self.assertEqual(question_bank.get_topics()["Databases"], 1)
+
+    def test_sampling_prefers_unseen_then_least_recently_seen(self):
+        question_bank.add_questions(_synthetic_questions("Synthetic", 10))
+        first = [q["id"] for q in question_bank.sample_questions("Synthetic", 4, profile="ann")]
+        second = [q["id"] for q in question_bank.sample_questions("Synthetic", 4, profile="ann")]
+        self.assertEqual(len(set(first + second)), 8)
+
+        time.sleep(0.01)
+        question_bank.mark_seen("ann", first[:2])  # seen again, so now the most recent
+        third = [q["id"] for q in question_bank.sample_questions("Synthetic", 5, profile="ann")]
+        unseen = set(question_bank.load_topic("Synthetic")["ids"].tolist()) - set(first + second)
+        self.assertEqual(set(third[:2]), unseen)
+        self.assertEqual(set(third[2:4]), set(first[2:]))  # shown in one call, so equally old
+        self.assertIn(third[4], second)
+        self.assertEqual(len(question_bank.get_seen_ids("ann", "Synthetic")), 10)
+
+    def test_sampling_filters_by_difficulty(self):
+        question_bank.add_questions(_synthetic_questions("Synthetic", 10))
+        questions = question_bank.sample_questions("Synthetic", 10, min_difficulty=0.5)
+        self.assertTrue(questions)
+        self.assertTrue(all(q["difficulty"] >= 0.5 for q in questions))
+
+    def test_read_csv_with_numbered_option_columns(self):
+        path = Path(self.tmp) / "questions.csv"
+        header = "topic,question,correct," + ",".join(f"option_{i}" for i in range(1, 11))
+        path.write_text(header + "\nCounting,Pick ten,J," + ",".join(str(i) for i in range(1, 11)) + "\n")
+        records = question_bank.read_question_file(path)
+        self.assertEqual(records[0]["options"], [str(i) for i in range(1, 11)])
+        self.assertEqual(question_bank.validate_question(records[0])["correct"], 9)
+        self.assertEqual(question_bank.add_questions(records)["inserted"], 1)
+
+
+class TestQuestionGeneration(BankTestCase):
+    def test_parse_tolerates_fences_and_prose(self):
+        response = 'Sure!\n```json\n[{"question": "q", "options": ["a", "b"], "correct": 0}, "junk"]\n```'
+        self.assertEqual(question_generation.parse_generated_questions(response),
+                         [{"question": "q", "options": ["a", "b"], "correct": 0}])
+        for response in ("I can't help with that", "[not json]"):
+            with self.assertRaises(ValueError):
+                question_generation.parse_generated_questions(response)
+
+    def test_mock_pipeline_dedupes_and_stores(self):
+        provider = question_generation.mock_provider()
+        run = lambda **kwargs: question_generation.generate_questions(
+            ["Kubernetes"], provider, "mock", per_call=6, calls=3, workers=3, **kwargs)
+
+        dry = run(dry_run=True)
+        self.assertEqual(dry["calls"], 9)
+        self.assertEqual(dry["generated"], 54)
+        self.assertGreater(dry["duplicates_in_run"], 0)
+        self.assertEqual(dry["duplicates_in_bank"], 0)
+        self.assertEqual(dry["would_insert"], 54 - dry["duplicates_in_run"])
+        self.assertNotIn("Kubernetes", question_bank.get_topics())
+
+        stored = run()
+        self.assertEqual(stored["inserted"], dry["would_insert"])
+        self.assertEqual(stored["topics"], {"Kubernetes": stored["inserted"]})
+        items = question_bank.load_topic("Kubernetes")
+        self.assertEqual(len(items["ids"]), stored["inserted"])
+        self.assertEqual(set(items["difficulty"].tolist()), {-1.0, 0.0, 1.0})
+        self.assertEqual(len(question_bank.sample_questions("Kubernetes", 3, tag="generated")), 3)
+
+        # The prompts now list the stored questions, so a rerun asks for new ones
+        again = run(dry_run=True)
+        self.assertEqual(again["would_insert"] + again["duplicates_in_bank"] + again["duplicates_in_run"], 54)
+
+    def test_record_then_replay_reproduces_the_run(self):
+        replay = Path(self.tmp) / "replay.jsonl"
+        recorded = question_generation.generate_questions(
+            ["SQL"], question_generation.recording_provider(question_generation.mock_provider(), replay),
+            "mock", difficulties=["easy"], calls=2, dry_run=True)
+        replayed = question_generation.generate_questions(
+            ["SQL"], question_generation.replay_provider(replay), "replay", difficulties=["easy"], calls=2, dry_run=True)
+        self.assertEqual(replayed["would_insert"], recorded["would_insert"])
+        self.assertEqual(replayed["failed_calls"], 0)
+
+        missing = question_generation.generate_questions(
+            ["SQL"], question_generation.replay_provider(replay), "replay", difficulties=["hard"], calls=1)
+        self.assertEqual(missing["failed_calls"], 1)
+        self.assertEqual(missing["attempts"], 1)  # a missing recording isn't retried
+
+    def test_cli_keeps_mock_questions_out_of_the_default_bank(self):
+        with mock.patch.object(sys, "argv", ["generate_questions.py", "SQL", "--provider", "mock"]), \
+                contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            generate_questions.main()
+
+
+class StorageTestCase(unittest.TestCase):
+    """Points utils.storage at a temporary data directory."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        patches = {"STORAGE_DIR": Path(self.tmp), "PROFILES_DIR": Path(self.tmp) / "profiles",
+                   "RESULTS_DIR": Path(self.tmp) / "results"}
+        for name, value in patches.items():
+            patcher = mock.patch.object(storage, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        storage.PROFILES_DIR.mkdir()
+        storage.RESULTS_DIR.mkdir()
+        cohort._cache.update(version=None, frame=None, stats=None)
+        self.addCleanup(cohort._cache.update, version=None, frame=None, stats=None)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def add_profile(self, name, level, role, roadmaps=0, resumes=0, interviews=0):
+        storage.save_profile(name, {"user_level": level, "target_role": role,
+                                    "daily_availability": "1 hour", "timeline": "6 months"})
+        for kind, count in (("roadmap", roadmaps), ("resume", resumes), ("interview", interviews)):
+            for i in range(count):
+                (storage.RESULTS_DIR / f"{name}_{kind}_20260101_0000{i:02d}.json").write_text("{}")
+
+
+class TestCohortStats(StorageTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_profile("ann", "Beginner", "Data Scientist", roadmaps=1, resumes=2)
+        self.add_profile("bob", "Advanced", "Data Scientist", roadmaps=3, resumes=1, interviews=3)
+        self.add_profile("cy_roadmap", "Beginner", "Web Developer", interviews=1)  # "_roadmap" in the name
+        self.add_profile("dee", "Intermediate", None)
+
+    def test_frame_from_disk_matches_per_profile_stats(self):
+        frame = cohort.load_cohort_frame().set_index("profile_name")
+        for name in storage.get_all_profiles():
+            stats = storage.get_profile_stats(name)
+            row = frame.loc[name]
+            for column in cohort.COUNT_COLUMNS.values():
+                self.assertEqual(row[column], stats[column], (name, column))
+            self.assertAlmostEqual(row["engagement"], calculate_profile_engagement(stats))
+        self.assertEqual(frame.loc["dee", "target_role"], "Unknown")
+
+    def test_totals_percentiles_bands_and_breakdowns(self):
+        frame = cohort.load_cohort_frame()
+        stats = cohort.compute_cohort_stats(frame)
+        engagement = frame["engagement"].to_numpy()
+
+        self.assertEqual(stats["total_profiles"], 4)
+        self.assertEqual(stats["totals"], {"roadmaps_generated": 4, "resumes_analyzed": 3,
+                                           "interviews_completed": 4, "total_interactions": 11})
+        self.assertEqual(stats["means"]["total_interactions"], 2.75)
+        self.assertEqual(stats["engagement"]["percentiles"],
+                         {f"p{p}": round(float(np.percentile(engagement, p)), 2) for p in cohort.PERCENTILES})
+        self.assertEqual(stats["engagement"]["distribution"], {"Minimal": 2, "Light": 1, "Moderate": 0, "High": 1})
+        by_role = {row["target_role"]: row for row in stats["by_target_role"]}
+        self.assertEqual(by_role["Data Scientist"]["profiles"], 2)
+        self.assertEqual(by_role["Data Scientist"]["total_interactions"], 10)
+
+    def test_empty_cohort(self):
+        stats = cohort.compute_cohort_stats(cohort.frame_from_stats([]))
+        self.assertEqual(stats["total_profiles"], 0)
+        self.assertEqual(stats["engagement"]["mean"], 0)
+
+    def test_stats_are_memoized_until_storage_changes(self):
+        first = cohort.get_cohort_stats()
+        self.assertIs(cohort.get_cohort_stats(), first)
+        storage.save_roadmap("ann", "plan")
+        second = cohort.get_cohort_stats()
+        self.assertIsNot(second, first)
+        self.assertEqual(second["totals"]["roadmaps_generated"], 5)
+
+
+def _legacy_csv_export(profiles):
+    """generate_csv_export as it was before the exporters streamed"""
+    if not profiles:
+        return "No profiles to export"
+    csv_text = ",".join(reports.CSV_HEADERS) + "\n"
+    for profile in profiles:
+        engagement = int(calculate_profile_engagement(profile) * 100) / 100
+        row = [
+            profile.get("profile_name", ""), profile.get("user_level", ""), profile.get("target_role", ""),
+            profile.get("daily_availability", ""), profile.get("timeline", ""),
+            str(profile.get("roadmaps_generated", 0)), str(profile.get("resumes_analyzed", 0)),
+            str(profile.get("interviews_completed", 0)), str(profile.get("total_interactions", 0)),
+            f"{engagement:.1f}",
+            profile.get("created_at", "").split("T")[0], profile.get("updated_at", "").split("T")[0],
+        ]
+        csv_text += ",".join('"' + str(item).replace('"', '""') + '"' for item in row) + "\n"
+    return csv_text
+
+
+class TestResumeParser(unittest.TestCase):
+    def test_digest_keeps_date_ranges_and_drops_phones(self):
+        digest = resume_digest("Jane Roe, 555-123-4567\nExperience\nSoftware Engineer, Acme 2019-2021 2021-2023")
+        self.assertIn("Software Engineer, Acme 2019-2021 2021-2023", digest)
+        self.assertNotIn("555", digest)
+
+
+class TestStreamingExports(unittest.TestCase):
+    PROFILES = [
+        {"profile_name": f"user {i}", "user_level": 'Mid "senior"', "target_role": "Data, ML\nEngineer",
+         "daily_availability": "2h", "timeline": "6 months", "roadmaps_generated": i % 3,
+         "resumes_analyzed": i % 2, "interviews_completed": i % 5, "total_interactions": i,
+         "created_at": "2026-01-02T03:04:05", "updated_at": "2026-02-03T04:05:06", "notes": ["ünïcode", None]}
+        for i in range(1203)
+    ]
+
+    def test_csv_matches_legacy_output_for_any_batch_size(self):
+        for profiles in ([], self.PROFILES[:1], self.PROFILES):
+            expected = _legacy_csv_export(profiles)
+            self.assertEqual(reports.generate_csv_export(profiles), expected)
+            for batch_rows in (1, 7, 500):
+                self.assertEqual("".join(reports.iter_csv_export(iter(profiles), batch_rows=batch_rows)), expected)
+
+    def test_csv_chunks_hold_at_most_batch_rows(self):
+        chunks = list(reports.iter_csv_export(iter(self.PROFILES), batch_rows=500))
+        self.assertEqual(len(chunks), 3)
+
+    def test_json_matches_json_dumps(self):
+        for profiles in ([], self.PROFILES[:1], self.PROFILES):
+            text = reports.generate_json_export(profiles)
+            export_date = json.loads(text)["export_date"]
+            expected = json.dumps({"export_date": export_date, "total_profiles": len(profiles),
+                                   "profiles": profiles}, indent=2)
+            self.assertEqual(text, expected)
+            streamed = "".join(reports.iter_json_export(iter(profiles), total=len(profiles)))
+            self.assertEqual(streamed.replace(json.loads(streamed)["export_date"], export_date), expected)
+
+    def test_json_of_unsized_iterable_requires_total(self):
+        consumed = []
+        profiles = (consumed.append(p) or p for p in self.PROFILES)
+        with self.assertRaises(TypeError):
+            next(reports.iter_json_export(profiles))
+        self.assertEqual(consumed, [])
+
+    def test_spooled_export_is_utf8_bytes(self):
+        spool = reports.spool_export(reports.iter_json_export(self.PROFILES[:2]), max_memory=64)
+        self.assertEqual(json.loads(spool.read().decode("utf-8"))["total_profiles"], 2)
+
+    @unittest.skipUnless(HAS_STREAMLIT, "streamlit not installed")
+    def test_spooled_export_is_accepted_by_download_button(self):
+        expected = reports.generate_csv_export(self.PROFILES)
+        for max_memory in (1 << 20, 16):  # kept in memory, spilled to disk
+            with self.subTest(max_memory=max_memory):
+                spool = reports.spool_export(reports.iter_csv_export(self.PROFILES, batch_rows=1), max_memory)
+                with spool:
+                    data, _ = convert_data_to_bytes_and_infer_mime(spool, TypeError("unsupported"))
+                self.assertEqual(data.decode("utf-8"), expected)
+
+
+@unittest.skipUnless(reports.HAS_REPORTLAB, "reportlab not installed")
+class TestPdfReports(StorageTestCase):
+    def test_single_report_renders(self):
+        pdf = reports.generate_pdf_report("Zoë <admin>", {"user_level": "Beginner & up", "total_interactions": 3},
+                                          [{"topic": "SQL", "score": 80.0, "level": "Advanced"}])
+        self.assertTrue(pdf.startswith(b"%PDF-"))
+        self.assertIn(b"%%EOF", pdf[-32:])
+
+    def test_batch_writes_a_pdf_per_profile_and_timings(self):
+        self.add_profile("ann", "Beginner", "Data Scientist", roadmaps=1)
+        self.add_profile("Bob O'Neil & co", "Advanced", "Web Developer")  # name needs sanitizing
+        output = Path(self.tmp) / "out"
+
+        results = reports.generate_batch_pdf_reports(str(output), ["ann", "Bob O'Neil & co"], workers=2)
+        self.assertEqual(sorted(r["profile_name"] for r in results), ["Bob O'Neil & co", "ann"])
+        self.assertEqual([r["error"] for r in results], ["", ""])
+        self.assertEqual(sorted(p.name for p in output.iterdir()),
+                         sorted([reports._report_filename("ann"), reports._report_filename("Bob O'Neil & co"),
+                                 "timings.csv"]))
+        self.assertRegex(reports._report_filename("Bob O'Neil & co"), r"^Bob_O_Neil_co_[0-9a-f]{8}\.pdf$")
+        for result in results:
+            self.assertTrue(Path(result["path"]).read_bytes().startswith(b"%PDF-"))
+        self.assertEqual(len((output / "timings.csv").read_text().splitlines()), 3)
+
+    def test_report_filenames_are_unique_and_never_empty(self):
+        names = ["a b", "a_b", "a/b", "&&", "***"]
+        filenames = [reports._report_filename(name) for name in names]
+        self.assertEqual(len(set(filenames)), len(names))
+        self.assertTrue(all(len(f) > len(".pdf") and "/" not in f for f in filenames))
+
+    def test_unknown_profile_gets_an_error_row(self):
+        self.add_profile("ann", "Beginner", "Data Scientist")
+        output = Path(self.tmp) / "out"
+        results = reports.generate_batch_pdf_reports(str(output), ["ann", "typo"], workers=1)
+        errors = {r["profile_name"]: r["error"] for r in results}
+        self.assertEqual(errors["ann"], "")
+        self.assertIn("not found", errors["typo"])
+        self.assertEqual(len(list(output.glob("*.pdf"))), 1)
+
+    def test_cli_renders_every_stored_profile(self):
+        self.add_profile("ann", "Beginner", "Data Scientist")
+        output = Path(self.tmp) / "cli"
+        argv = ["batch_reports.py", "--output", str(output), "--workers", "1"]
+        with mock.patch.object(sys, "argv", argv), contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(batch_reports.main(), 0)
+        self.assertIn("1/1 reports", out.getvalue())
+        self.assertTrue((output / reports._report_filename("ann")).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,21 @@
 # Provides skill assessment tests, scoring, and evaluation
 
 import random
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+from utils import question_bank
 
 # ============================================================================
 # SKILL ASSESSMENT TESTS
 # ============================================================================
+# Built-in questions, seeded into an empty question bank (utils/question_bank.py);
+# tests are served from the bank, which also holds imported questions.
+# Each question carries item response theory parameters for adaptive tests:
+# "difficulty" (b) is the ability at which a candidate has even odds of
+# answering correctly, "discrimination" (a) how sharply the question
+# separates candidates just below that ability from those just above it.
 
 ASSESSMENT_QUESTIONS = {
     "Python Fundamentals": [
@@ -16,31 +26,41 @@ ASSESSMENT_QUESTIONS = {
             "question": "What is the output of: print(len({1, 2, 2, 3, 3, 3}))",
             "options": ["3", "6", "Error", "Undefined"],
             "correct": 0,
-            "explanation": "Sets remove duplicates, so {1,2,2,3,3,3} becomes {1,2,3} with len=3"
+            "explanation": "Sets remove duplicates, so {1,2,2,3,3,3} becomes {1,2,3} with len=3",
+            "difficulty": -0.5,
+            "discrimination": 1.2
         },
         {
             "question": "Which of these is a mutable data type in Python?",
             "options": ["Tuple", "String", "List", "Integer"],
             "correct": 2,
-            "explanation": "Lists are mutable; tuples, strings, and integers are immutable"
+            "explanation": "Lists are mutable; tuples, strings, and integers are immutable",
+            "difficulty": -1.5,
+            "discrimination": 1.0
         },
         {
             "question": "What does *args do in a function definition?",
             "options": ["Stores keyword arguments", "Stores multiple positional arguments", "Stores named arguments", "None"],
             "correct": 1,
-            "explanation": "*args allows a function to accept variable number of positional arguments"
+            "explanation": "*args allows a function to accept variable number of positional arguments",
+            "difficulty": -0.3,
+            "discrimination": 1.3
         },
         {
             "question": "What is the difference between == and 'is'?",
             "options": ["No difference", "== checks equality, is checks identity", "is checks equality", "They are opposite"],
             "correct": 1,
-            "explanation": "== compares values, is compares object identity (memory address)"
+            "explanation": "== compares values, is compares object identity (memory address)",
+            "difficulty": 0.2,
+            "discrimination": 1.5
         },
         {
             "question": "What will be the output? x = [1,2,3]; x.append([4,5]); print(len(x))",
             "options": ["4", "5", "Error", "6"],
             "correct": 0,
-            "explanation": "append adds one element (the list [4,5]), so length becomes 4"
+            "explanation": "append adds one element (the list [4,5]), so length becomes 4",
+            "difficulty": 0.8,
+            "discrimination": 1.4
         }
     ],
     "SQL Basics": [
@@ -48,31 +68,41 @@ ASSESSMENT_QUESTIONS = {
             "question": "What does SQL stand for?",
             "options": ["Structured Query Language", "Simple Query Language", "Standard Query Language", "System Query Language"],
             "correct": 0,
-            "explanation": "SQL stands for Structured Query Language"
+            "explanation": "SQL stands for Structured Query Language",
+            "difficulty": -2.0,
+            "discrimination": 0.8
         },
         {
             "question": "Which SQL clause filters records after GROUP BY?",
             "options": ["WHERE", "HAVING", "FILTER", "GROUP"],
             "correct": 1,
-            "explanation": "WHERE filters before grouping, HAVING filters after GROUP BY"
+            "explanation": "WHERE filters before grouping, HAVING filters after GROUP BY",
+            "difficulty": 0.6,
+            "discrimination": 1.6
         },
         {
             "question": "What is a PRIMARY KEY?",
             "options": ["First column", "Unique identifier for each row", "Main table", "Foreign key"],
             "correct": 1,
-            "explanation": "PRIMARY KEY uniquely identifies each record in a table"
+            "explanation": "PRIMARY KEY uniquely identifies each record in a table",
+            "difficulty": -1.0,
+            "discrimination": 1.1
         },
         {
             "question": "What does a JOIN do?",
             "options": ["Combines data from multiple tables", "Joins strings", "Links to external database", "Creates backup"],
             "correct": 0,
-            "explanation": "JOIN combines columns from two or more tables based on a condition"
+            "explanation": "JOIN combines columns from two or more tables based on a condition",
+            "difficulty": -0.8,
+            "discrimination": 1.2
         },
         {
             "question": "What keyword prevents duplicate rows in results?",
             "options": ["UNIQUE", "DISTINCT", "DIFFERENT", "REMOVE"],
             "correct": 1,
-            "explanation": "DISTINCT removes duplicate rows from query results"
+            "explanation": "DISTINCT removes duplicate rows from query results",
+            "difficulty": -0.2,
+            "discrimination": 1.3
         }
     ],
     "Data Analysis": [
@@ -80,31 +110,41 @@ ASSESSMENT_QUESTIONS = {
             "question": "What does EDA stand for?",
             "options": ["Exploratory Data Analysis", "Experimental Data Algorithm", "External Data Access", "Electronic Data Arrangement"],
             "correct": 0,
-            "explanation": "EDA is Exploratory Data Analysis"
+            "explanation": "EDA is Exploratory Data Analysis",
+            "difficulty": -1.2,
+            "discrimination": 0.9
         },
         {
             "question": "Which is NOT a measure of central tendency?",
             "options": ["Mean", "Median", "Mode", "Range"],
             "correct": 3,
-            "explanation": "Range is a measure of dispersion, not central tendency"
+            "explanation": "Range is a measure of dispersion, not central tendency",
+            "difficulty": -0.4,
+            "discrimination": 1.2
         },
         {
             "question": "What does a correlation coefficient of -0.8 indicate?",
             "options": ["Strong positive correlation", "Weak negative correlation", "Strong negative correlation", "No correlation"],
             "correct": 2,
-            "explanation": "A coefficient near -1 indicates strong negative correlation"
+            "explanation": "A coefficient near -1 indicates strong negative correlation",
+            "difficulty": 0.0,
+            "discrimination": 1.3
         },
         {
             "question": "What is the purpose of normalization?",
             "options": ["Delete data", "Scale features to similar range", "Remove duplicates", "Convert format"],
             "correct": 1,
-            "explanation": "Normalization scales features to a similar range for better ML performance"
+            "explanation": "Normalization scales features to a similar range for better ML performance",
+            "difficulty": 0.3,
+            "discrimination": 1.1
         },
         {
             "question": "What percentage of data should typically be in training set?",
             "options": ["50%", "70%", "90%", "100%"],
             "correct": 1,
-            "explanation": "Common practice is 70-80% for training, 20-30% for testing"
+            "explanation": "Common practice is 70-80% for training, 20-30% for testing",
+            "difficulty": 0.9,
+            "discrimination": 0.7
         }
     ],
     "Machine Learning": [
@@ -112,31 +152,41 @@ ASSESSMENT_QUESTIONS = {
             "question": "What is overfitting?",
             "options": ["Model too simple", "Model learns training data too well", "Model has too many parameters", "Both B and C"],
             "correct": 3,
-            "explanation": "Overfitting occurs when model is too complex and learns noise; typically has too many parameters"
+            "explanation": "Overfitting occurs when model is too complex and learns noise; typically has too many parameters",
+            "difficulty": 1.0,
+            "discrimination": 1.2
         },
         {
             "question": "Which metric is best for imbalanced datasets?",
             "options": ["Accuracy", "Precision", "F1-Score", "MAE"],
             "correct": 2,
-            "explanation": "F1-Score is better for imbalanced data as it balances precision and recall"
+            "explanation": "F1-Score is better for imbalanced data as it balances precision and recall",
+            "difficulty": 0.5,
+            "discrimination": 1.5
         },
         {
             "question": "What does cross-validation do?",
             "options": ["Tests on different data splits", "Validates across countries", "Checks model complexity", "Verifies features"],
             "correct": 0,
-            "explanation": "Cross-validation evaluates model performance across multiple data splits"
+            "explanation": "Cross-validation evaluates model performance across multiple data splits",
+            "difficulty": -0.6,
+            "discrimination": 1.1
         },
         {
             "question": "Which is a supervised learning algorithm?",
             "options": ["K-Means", "PCA", "Random Forest", "DBSCAN"],
             "correct": 2,
-            "explanation": "Random Forest is supervised; K-Means and DBSCAN are unsupervised"
+            "explanation": "Random Forest is supervised; K-Means and DBSCAN are unsupervised",
+            "difficulty": -0.1,
+            "discrimination": 1.4
         },
         {
             "question": "What is feature engineering?",
             "options": ["Building ML model", "Creating new features from raw data", "Selecting algorithms", "Tuning hyperparameters"],
             "correct": 1,
-            "explanation": "Feature engineering is creating meaningful features from raw data"
+            "explanation": "Feature engineering is creating meaningful features from raw data",
+            "difficulty": -1.0,
+            "discrimination": 1.0
         }
     ]
 }
@@ -162,23 +212,7 @@ def calculate_score(answers: List[int], correct_answers: List[int]) -> Dict:
     correct_count = sum(1 for a, c in zip(answers, correct_answers) if a == c)
     total = len(answers)
     percentage = (correct_count / total) * 100
-    
-    # Performance level
-    if percentage >= 90:
-        level = "Expert"
-        feedback = "Excellent! You demonstrate strong mastery of this topic."
-    elif percentage >= 80:
-        level = "Advanced"
-        feedback = "Great job! You have solid understanding with minor gaps."
-    elif percentage >= 70:
-        level = "Proficient"
-        feedback = "Good foundation! Continue practicing to improve further."
-    elif percentage >= 60:
-        level = "Intermediate"
-        feedback = "You have basic knowledge. Focus on weak areas."
-    else:
-        level = "Beginner"
-        feedback = "Keep practicing! This topic needs more attention."
+    level, feedback = _performance_level(percentage)
     
     return {
         "correct": correct_count,
@@ -188,6 +222,19 @@ def calculate_score(answers: List[int], correct_answers: List[int]) -> Dict:
         "feedback": feedback
     }
 
+def _performance_level(percentage: float) -> Tuple[str, str]:
+    """Performance level and feedback for a (possibly estimated) percentage"""
+    if percentage >= 90:
+        return "Expert", "Excellent! You demonstrate strong mastery of this topic."
+    elif percentage >= 80:
+        return "Advanced", "Great job! You have solid understanding with minor gaps."
+    elif percentage >= 70:
+        return "Proficient", "Good foundation! Continue practicing to improve further."
+    elif percentage >= 60:
+        return "Intermediate", "You have basic knowledge. Focus on weak areas."
+    else:
+        return "Beginner", "Keep practicing! This topic needs more attention."
+
 def get_skill_level(percentage: float) -> str:
     """Get skill level based on percentage"""
     if percentage >= 90:
@@ -295,28 +342,27 @@ def score_interview_answer(answer_length: int, emotional_tone: str = "neutral")
 # ASSESSMENT RETRIEVAL
 # ============================================================================
 
-def get_assessment(topic: str, num_questions: int = 5) -> Tuple[List[Dict], List[int]]:
+def get_assessment(topic: str, num_questions: int = 5, profile: Optional[str] = None) -> Tuple[List[Dict], List[int]]:
     """
-    Get assessment questions for a topic
+    Get assessment questions for a topic from the question bank
     
     Args:
         topic: Assessment topic
         num_questions: Number of questions to return
+        profile: If given, questions this profile has already seen are
+            avoided and the new ones are added to its history
     
     Returns:
         Tuple of (questions list, correct answers list)
     """
-    if topic not in ASSESSMENT_QUESTIONS:
-        return [], []
-    
-    questions = ASSESSMENT_QUESTIONS[topic]
-    selected = random.sample(questions, min(num_questions, len(questions)))
+    selected = question_bank.sample_questions(topic, num_questions, profile=profile)
     
     questions_list = []
     correct_answers = []
     
     for q in selected:
         questions_list.append({
+            "id": q["id"],
             "question": q["question"],
             "options": q["options"],
             "explanation": q["explanation"]
@@ -327,4 +373,181 @@ def get_assessment(topic: str, num_questions: int = 5) -> Tuple[List[Dict], List
 
 def get_available_topics() -> List[str]:
     """Get list of available assessment topics"""
-    return list(ASSESSMENT_QUESTIONS.keys())
+    return list(question_bank.get_topics())
+
+# ============================================================================
+# ADAPTIVE TESTING (IRT)
+# ============================================================================
+# Two-parameter logistic model: P(correct | theta) = 1 / (1 + e^(-a(theta - b)))
+# Ability theta is on a standard-normal scale (0 = typical candidate). After
+# every answer theta is re-estimated and the next question is the one that
+# is most informative at the current estimate, so strong candidates skip
+# the easy questions and vice versa.
+
+ADAPTIVE_SE_TARGET = 0.45       # stop once theta is known to within this standard error
+ADAPTIVE_MAX_QUESTIONS = 10
+ADAPTIVE_FIRST_ITEM_POOL = 3    # first question drawn from the 3 most informative, so not everyone sees the same one
+
+THETA_GRID = np.linspace(-4.0, 4.0, 161)
+_PRIOR = np.exp(-0.5 * THETA_GRID ** 2)  # standard normal, unnormalized
+
+def response_probability(theta, a, b) -> np.ndarray:
+    """Probability of a correct answer (broadcasts over abilities and items)"""
+    return 1.0 / (1.0 + np.exp(-a * (theta - b)))
+
+def item_information(theta, a, b) -> np.ndarray:
+    """Fisher information each item carries about ability at theta"""
+    p = response_probability(theta, a, b)
+    return a ** 2 * p * (1.0 - p)
+
+def estimate_ability(a: np.ndarray, b: np.ndarray, correct: np.ndarray) -> Tuple[float, float]:
+    """
+    Expected a posteriori ability estimate
+    
+    Args:
+        a: Discrimination of each answered item
+        b: Difficulty of each answered item
+        correct: Boolean per answered item
+    
+    Returns:
+        (theta, standard error), the posterior mean and standard deviation
+    """
+    p = np.clip(response_probability(THETA_GRID[:, None], a[None, :], b[None, :]), 1e-12, 1 - 1e-12)
+    log_likelihood = np.where(correct[None, :], np.log(p), np.log1p(-p)).sum(axis=1)
+    posterior = _PRIOR * np.exp(log_likelihood - log_likelihood.max())
+    posterior /= posterior.sum()
+    theta = float(THETA_GRID @ posterior)
+    se = float(np.sqrt(((THETA_GRID - theta) ** 2) @ posterior))
+    return theta, se
+
+def select_next_item(theta: float, a: np.ndarray, b: np.ndarray, excluded: List[int],
+                     pool: int = 1) -> Optional[int]:
+    """
+    Position of the item with maximum information at theta
+    
+    Items at the `excluded` positions (already asked) are skipped. With
+    pool > 1 one of the `pool` most informative items is picked at random
+    (limits how often any single item is exposed). None when no item is left.
+    """
+    information = item_information(theta, a, b)
+    information[excluded] = -np.inf
+    remaining = len(a) - len(set(excluded))
+    if remaining <= 0:
+        return None
+    candidates = np.argsort(-information, kind="stable")[:min(pool, remaining)]
+    return int(random.choice(candidates))
+
+def _positions(items: Dict, question_ids: List[int]) -> List[int]:
+    return [items["position"][question_id] for question_id in question_ids if question_id in items["position"]]
+
+def start_adaptive_assessment(topic: str, profile: Optional[str] = None,
+                              max_questions: int = ADAPTIVE_MAX_QUESTIONS,
+                              se_target: float = ADAPTIVE_SE_TARGET) -> Dict:
+    """
+    Begin an adaptive assessment
+    
+    With a profile, questions it has already seen are skipped as long as
+    enough unseen ones remain for a full-length test.
+    
+    Returns:
+        Session-state-friendly dict; pass it to get_adaptive_question and
+        answer_adaptive_question until its "finished" flag is set
+    """
+    items = question_bank.load_topic(topic)
+    seen = list(question_bank.get_seen_ids(profile, topic)) if profile else []
+    if len(items["ids"]) - len(seen) < max_questions:
+        seen = []
+    state = {
+        "topic": topic,
+        "profile": profile,
+        "max_questions": max_questions,
+        "se_target": se_target,
+        "skipped": seen,
+        "administered": [],
+        "responses": [],
+        "theta": 0.0,
+        "se": 1.0,
+        "history": [],
+        "current": None,
+        "finished": True,
+    }
+    position = select_next_item(0.0, items["discrimination"], items["difficulty"],
+                                _positions(items, seen), pool=ADAPTIVE_FIRST_ITEM_POOL)
+    if position is not None:
+        state["current"] = int(items["ids"][position])
+        state["finished"] = False
+    return state
+
+def get_adaptive_question(state: Dict) -> Optional[Dict]:
+    """The question to show next (without its answer), or None when finished"""
+    if state["finished"] or state["current"] is None:
+        return None
+    q = question_bank.get_question(state["current"])
+    if q is None:
+        return None
+    return {"id": q["id"], "question": q["question"], "options": q["options"], "explanation": q["explanation"]}
+
+def answer_adaptive_question(state: Dict, answer: int) -> Dict:
+    """
+    Record the answer to the current question and choose the next one
+    
+    Re-estimates ability from every answer so far; the test finishes when
+    the standard error reaches the target, the question limit is hit or
+    the topic runs out of questions.
+    
+    Returns:
+        The updated state (also modified in place)
+    """
+    if state["finished"] or state["current"] is None:
+        return state
+    question = question_bank.get_question(state["current"])
+    state["administered"].append(state["current"])
+    state["responses"].append(question is not None and answer == question["correct"])
+    if state["profile"]:
+        question_bank.mark_seen(state["profile"], [state["current"]])
+
+    items = question_bank.load_topic(state["topic"])
+    answered = [(items["position"][question_id], correct)
+                for question_id, correct in zip(state["administered"], state["responses"])
+                if question_id in items["position"]]  # skips questions deleted mid-test
+    asked = [position for position, _ in answered]
+    correct = np.array([correct for _, correct in answered], dtype=bool)
+    theta, se = estimate_ability(items["discrimination"][asked], items["difficulty"][asked], correct)
+    state["theta"], state["se"] = theta, se
+    state["history"].append({"theta": round(theta, 3), "se": round(se, 3)})
+
+    state["current"] = None
+    state["finished"] = True
+    if se > state["se_target"] and len(state["administered"]) < state["max_questions"]:
+        excluded = asked + _positions(items, state["skipped"])
+        position = select_next_item(theta, items["discrimination"], items["difficulty"], excluded)
+        if position is not None:
+            state["current"] = int(items["ids"][position])
+            state["finished"] = False
+    return state
+
+def adaptive_result(state: Dict) -> Dict:
+    """
+    Score an adaptive assessment
+    
+    "percentage" is the expected score on the topic's full question set at
+    the estimated ability, so it is comparable with fixed-length results
+    and works with get_skill_level.
+    
+    Returns:
+        Same keys as calculate_score plus theta and standard_error
+    """
+    items = question_bank.load_topic(state["topic"])
+    percentage = 0.0
+    if len(items["ids"]):
+        percentage = float(response_probability(state["theta"], items["discrimination"], items["difficulty"]).mean() * 100)
+    level, feedback = _performance_level(percentage)
+    return {
+        "correct": int(sum(state["responses"])),
+        "total": len(state["responses"]),
+        "percentage": round(percentage, 2),
+        "level": level,
+        "feedback": feedback,
+        "theta": round(state["theta"], 3),
+        "standard_error": round(state["se"], 3),
+    }
@@ -0,0 +1,214 @@
+# ============================================================================
+# COHORT ANALYTICS
+# ============================================================================
+# Columnar, vectorized statistics across every stored profile
+
+import json
+import os
+import re
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from utils import storage
+
+# Result files are named <profile>_<kind>_<YYYYmmdd>_<HHMMSS>.json
+RESULT_FILE_PATTERN = re.compile(
+    r"^(?P<profile>.+)_(?P<kind>roadmap|resume|interview)_\d{8}_\d{6}\.json$"
+)
+
+COUNT_COLUMNS = {
+    "roadmap": "roadmaps_generated",
+    "resume": "resumes_analyzed",
+    "interview": "interviews_completed",
+}
+
+# Same weights as reports.calculate_profile_engagement
+ENGAGEMENT_WEIGHTS = {
+    "total_interactions": 0.4,
+    "roadmaps_generated": 10,
+    "resumes_analyzed": 15,
+    "interviews_completed": 20,
+}
+
+ENGAGEMENT_BANDS = {
+    "bins": [-np.inf, 40, 60, 80, np.inf],
+    "labels": ["Minimal", "Light", "Moderate", "High"],
+}
+
+PERCENTILES = [25, 50, 75, 90]
+
+# ============================================================================
+# FRAME CONSTRUCTION
+# ============================================================================
+
+def _typed_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Apply the cohort dtypes and derived columns to a raw frame"""
+    for column in COUNT_COLUMNS.values():
+        frame[column] = frame[column].fillna(0).astype("int32")
+    frame["total_interactions"] = frame[list(COUNT_COLUMNS.values())].sum(axis=1).astype("int32")
+    frame["skill_level"] = frame["skill_level"].fillna("Unknown").astype("category")
+    frame["target_role"] = frame["target_role"].fillna("Unknown").astype("category")
+    frame["engagement"] = engagement_scores(frame)
+    return frame
+
+def engagement_scores(frame: pd.DataFrame) -> pd.Series:
+    """
+    Vectorized calculate_profile_engagement over a cohort frame
+
+    Args:
+        frame: Frame with the activity count columns
+
+    Returns:
+        Engagement score per row (0-100)
+    """
+    score = sum(frame[column] * weight for column, weight in ENGAGEMENT_WEIGHTS.items())
+    return np.minimum(100.0, score.astype("float64"))
+
+def frame_from_stats(profiles: List[Dict]) -> pd.DataFrame:
+    """
+    Build a cohort frame from per-profile stats dicts (get_profile_stats output)
+
+    Args:
+        profiles: List of profile statistics dictionaries
+
+    Returns:
+        Typed cohort frame, one row per profile
+    """
+    frame = pd.DataFrame.from_records(profiles)
+    if frame.empty:
+        return empty_cohort_frame()
+
+    if "skill_level" not in frame and "user_level" in frame:
+        frame["skill_level"] = frame["user_level"]
+    for column in ("profile_name", "skill_level", "target_role", *COUNT_COLUMNS.values()):
+        if column not in frame:
+            frame[column] = None
+    frame = frame[["profile_name", "skill_level", "target_role", *COUNT_COLUMNS.values()]].copy()
+    return _typed_frame(frame)
+
+def empty_cohort_frame() -> pd.DataFrame:
+    """Zero-row cohort frame with the full column set"""
+    frame = pd.DataFrame(columns=["profile_name", "skill_level", "target_role", *COUNT_COLUMNS.values()])
+    return _typed_frame(frame)
+
+def _result_counts() -> pd.DataFrame:
+    """Count result files per profile and kind with a single directory scan"""
+    try:
+        names = os.listdir(storage.RESULTS_DIR)
+    except FileNotFoundError:
+        names = []
+
+    parsed = pd.Series(names, dtype="object").str.extract(RESULT_FILE_PATTERN).dropna()
+    if parsed.empty:
+        return pd.DataFrame(columns=list(COUNT_COLUMNS.values()))
+
+    counts = parsed.groupby(["profile", "kind"]).size().unstack("kind", fill_value=0)
+    return counts.reindex(columns=list(COUNT_COLUMNS), fill_value=0).rename(columns=COUNT_COLUMNS)
+
+def load_cohort_frame() -> pd.DataFrame:
+    """
+    Load every stored profile's stats into one typed frame
+
+    Profiles are read once each and result files are counted from a single
+    listing of the results directory, instead of three globs per profile.
+
+    Returns:
+        Typed cohort frame indexed by position, one row per profile
+    """
+    records = []
+    for path in sorted(storage.PROFILES_DIR.glob("*.json")):
+        try:
+            with open(path, "r") as f:
+                profile = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            continue
+        records.append({
+            "profile_name": path.stem,
+            "skill_level": profile.get("user_level"),
+            "target_role": profile.get("target_role"),
+        })
+    if not records:
+        return empty_cohort_frame()
+
+    frame = pd.DataFrame.from_records(records).join(_result_counts(), on="profile_name")
+    return _typed_frame(frame)
+
+# ============================================================================
+# AGGREGATION
+# ============================================================================
+
+def _breakdown(frame: pd.DataFrame, column: str) -> List[Dict]:
+    """Per-group profile counts, interactions and engagement"""
+    grouped = frame.groupby(column, observed=True).agg(
+        profiles=("profile_name", "size"),
+        total_interactions=("total_interactions", "sum"),
+        avg_interactions=("total_interactions", "mean"),
+        avg_engagement=("engagement", "mean"),
+    )
+    grouped = grouped.sort_values("profiles", ascending=False).round(2)
+    grouped.index = grouped.index.astype(str)
+    return grouped.reset_index().to_dict("records")
+
+def compute_cohort_stats(frame: pd.DataFrame) -> Dict:
+    """
+    Compute totals, means, engagement distribution and breakdowns
+
+    Args:
+        frame: Cohort frame from load_cohort_frame or frame_from_stats
+
+    Returns:
+        Dictionary of cohort statistics
+    """
+    num_profiles = len(frame)
+    counts = frame[[*COUNT_COLUMNS.values(), "total_interactions"]]
+    totals = counts.sum()
+    means = counts.mean() if num_profiles else totals * 0
+
+    engagement = frame["engagement"].to_numpy()
+    percentiles = np.percentile(engagement, PERCENTILES) if num_profiles else np.zeros(len(PERCENTILES))
+    bands = pd.cut(frame["engagement"], **ENGAGEMENT_BANDS, right=False).value_counts(sort=False)
+
+    return {
+        "total_profiles": num_profiles,
+        "totals": {column: int(value) for column, value in totals.items()},
+        "means": {column: round(float(value), 2) for column, value in means.items()},
+        "engagement": {
+            "mean": round(float(engagement.mean()), 2) if num_profiles else 0,
+            "percentiles": {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, percentiles)},
+            "distribution": {str(band): int(n) for band, n in bands.items()},
+        },
+        "by_target_role": _breakdown(frame, "target_role"),
+        "by_skill_level": _breakdown(frame, "skill_level"),
+        "generated_at": datetime.now().isoformat(),
+    }
+
+# ============================================================================
+# MEMOIZED ENTRY POINTS
+# ============================================================================
+
+_cache = {"version": None, "frame": None, "stats": None}
+
+def get_cohort_frame() -> pd.DataFrame:
+    """
+    Cohort frame for the current storage state, rebuilt only when
+    storage.get_storage_version() changes
+    """
+    version = storage.get_storage_version()
+    if _cache["version"] != version:
+        _cache.update(version=version, frame=load_cohort_frame(), stats=None)
+    return _cache["frame"]
+
+def get_cohort_stats() -> Dict:
+    """
+    Memoized compute_cohort_stats over every stored profile
+
+    Returns:
+        Dictionary of cohort statistics
+    """
+    frame = get_cohort_frame()
+    if _cache["stats"] is None:
+        _cache["stats"] = compute_cohort_stats(frame)
+    return _cache["stats"]
@@ -9,6 +9,8 @@
 # 5. Mock Interview Simulator
 # ============================================================================
 
+from utils.resume_parser import resume_digest
+
 def roadmap_generator_prompt(current_level: str, target_role: str, daily_availability: str, timeline: str) -> tuple:
     """Generate system and user prompts for career roadmap generation"""
     
@@ -196,9 +198,12 @@ def get_projects_prompt(career_field: str, experience: str) -> str:
     return f"{system}\n\n{user}"
 
 
+# Bump whenever the resume prompts change: cached analyses are keyed on it
+RESUME_PROMPT_VERSION = 3
+
 def get_resume_prompt(resume_text: str) -> str:
-    """Wrapper for resume analysis for app.py"""
-    system, user = resume_analyzer_prompt(resume_text=resume_text, target_role="General")
+    """Wrapper for resume analysis for app.py (sends the section digest, not the raw text)"""
+    system, user = resume_analyzer_prompt(resume_text=resume_digest(resume_text), target_role="General")
     return f"{system}\n\n{user}"
 
 
@@ -212,3 +217,29 @@ def get_followup_prompt(question: str, answer: str) -> str:
     """Wrapper for interview follow-up feedback for app.py"""
     system, user = interview_question_evaluator_prompt(answer=answer, question=question, target_role="General")
     return f"{system}\n\n{user}"
+
+
+def question_generation_prompt(topic: str, difficulty: str, count: int, batch: int = 1,
+                               avoid: list = None) -> tuple:
+    """Generate prompts for a batch of multiple-choice assessment questions"""
+
+    system_prompt = """You write multiple-choice questions for skill assessments.
+
+Reply with ONLY a JSON array, no prose and no code fences. Each element:
+{"question": "...", "options": ["...", "...", "...", "..."], "correct": <index of the right option, 0-3>, "explanation": "..."}
+
+Rules:
+- Exactly four options, one of them unambiguously correct
+- Test understanding, not trivia; keep each question self-contained
+- The explanation says in one sentence why the answer is right"""
+
+    avoid_text = ""
+    if avoid:
+        avoid_text = "\n\nDo not repeat or rephrase these existing questions:\n" + "\n".join(f"- {q}" for q in avoid)
+
+    user_input = f"""Topic: {topic}
+Difficulty: {difficulty}
+Number of questions: {count}
+Batch: {batch} (cover different subtopics in each batch){avoid_text}"""
+
+    return system_prompt, user_input
@@ -0,0 +1,399 @@
+# ============================================================================
+# QUESTION BANK
+# ============================================================================
+# SQLite-backed assessment questions, indexed by topic, difficulty and tag.
+# Topics are loaded lazily and cached until the bank changes; per-profile
+# history lets tests avoid repeating questions a user has already seen.
+
+import csv
+import hashlib
+import json
+import os
+import random
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from utils.storage import STORAGE_DIR
+
+BANK_PATH = Path(os.getenv("QUESTION_BANK_PATH", str(STORAGE_DIR / "question_bank.db")))
+
+DEFAULT_DIFFICULTY = 0.0
+DEFAULT_DISCRIMINATION = 1.0
+INSERT_BATCH_SIZE = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id             INTEGER PRIMARY KEY,
+    topic          TEXT    NOT NULL,
+    question       TEXT    NOT NULL,
+    options        TEXT    NOT NULL,             -- JSON list
+    correct        INTEGER NOT NULL,
+    explanation    TEXT    NOT NULL DEFAULT '',
+    difficulty     REAL    NOT NULL DEFAULT 0.0,
+    discrimination REAL    NOT NULL DEFAULT 1.0,
+    source         TEXT    NOT NULL DEFAULT '',
+    fingerprint    TEXT    NOT NULL UNIQUE,      -- see question_fingerprint
+    created_at     TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_questions_topic_difficulty ON questions(topic, difficulty);
+
+CREATE TABLE IF NOT EXISTS question_tags (
+    tag         TEXT    NOT NULL,
+    question_id INTEGER NOT NULL REFERENCES questions(id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, question_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS question_history (
+    profile     TEXT    NOT NULL,
+    question_id INTEGER NOT NULL REFERENCES questions(id) ON DELETE CASCADE,
+    seen_at     TEXT    NOT NULL,
+    PRIMARY KEY (profile, question_id)
+) WITHOUT ROWID;
+"""
+
+_connection = None
+_lock = threading.RLock()
+_topic_cache = {}
+_cache_version = None
+
+# ============================================================================
+# CONNECTION
+# ============================================================================
+
+def open_bank(path=None) -> sqlite3.Connection:
+    """
+    Open (creating and seeding if needed) the question bank
+
+    Called implicitly by every function here; call it directly only to
+    switch to another database file, e.g. from the import tool.
+
+    Args:
+        path: Database file (default: BANK_PATH)
+
+    Returns:
+        The shared connection
+    """
+    global _connection, BANK_PATH
+    with _lock:
+        if path is not None and Path(path) != BANK_PATH:
+            close_bank()
+            BANK_PATH = Path(path)
+        if _connection is None:
+            BANK_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # One connection shared by Streamlit's script threads, serialized by _lock
+            connection = sqlite3.connect(BANK_PATH, check_same_thread=False, timeout=10)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            connection.executescript(SCHEMA)
+            _connection = connection
+            if connection.execute("SELECT 1 FROM questions LIMIT 1").fetchone() is None:
+                _seed_builtin_questions()
+        return _connection
+
+def close_bank() -> None:
+    global _connection, _cache_version
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+        _connection = None
+        _topic_cache.clear()
+        _cache_version = None
+
+def _seed_builtin_questions() -> None:
+    """Load the built-in ASSESSMENT_QUESTIONS into an empty bank"""
+    from utils.assessment import ASSESSMENT_QUESTIONS
+    add_questions(
+        ({**question, "topic": topic, "source": "builtin"}
+         for topic, questions in ASSESSMENT_QUESTIONS.items() for question in questions)
+    )
+
+def _check_cache() -> None:
+    """Drop cached topics when any connection (or process) changed the bank"""
+    global _cache_version
+    version = _connection.execute("PRAGMA data_version").fetchone()[0]
+    if version != _cache_version:
+        _topic_cache.clear()
+        _cache_version = version
+
+# ============================================================================
+# WRITING
+# ============================================================================
+
+def normalize_question_text(text: str) -> str:
+    """Casefolded words only: punctuation, spacing and case differences vanish"""
+    return " ".join(re.findall(r"\w+", text.casefold()))
+
+def question_fingerprint(topic: str, question: str) -> str:
+    """Dedup key: near-identical question texts within a topic share it"""
+    key = f"{normalize_question_text(topic)}\x00{normalize_question_text(question)}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+def existing_fingerprints(fingerprints: Iterable[str]) -> set:
+    """The subset of these fingerprints already stored in the bank"""
+    fingerprints = list(fingerprints)
+    connection = open_bank()
+    found = set()
+    with _lock:
+        for start in range(0, len(fingerprints), 500):  # stay under SQLite's bound-parameter limit
+            chunk = fingerprints[start:start + 500]
+            found.update(row[0] for row in connection.execute(
+                f"SELECT fingerprint FROM questions WHERE fingerprint IN ({','.join('?' * len(chunk))})", chunk))
+    return found
+
+def validate_question(record: Dict, default_topic: Optional[str] = None) -> Dict:
+    """
+    Normalize one question record to the bank schema
+
+    Accepts the ASSESSMENT_QUESTIONS schema plus "topic", "tags" and
+    optional "difficulty"/"discrimination". `correct` may be an option
+    index or a letter (A = first option).
+
+    Raises:
+        ValueError: If required fields are missing or inconsistent
+    """
+    topic = str(record.get("topic") or default_topic or "").strip()
+    question = str(record.get("question") or "").strip()
+    options = record.get("options")
+    if isinstance(options, str):
+        options = options.split("|")
+    options = [str(option).strip() for option in options or [] if str(option).strip()]
+    if not topic:
+        raise ValueError("missing topic")
+    if not question:
+        raise ValueError("missing question")
+    if len(options) < 2:
+        raise ValueError("needs at least two options")
+
+    correct = record.get("correct")
+    if isinstance(correct, str):
+        correct = correct.strip()
+        correct = ord(correct.upper()) - ord("A") if len(correct) == 1 and correct.isalpha() else int(correct)
+    if not isinstance(correct, int) or not 0 <= correct < len(options):
+        raise ValueError(f"correct answer {record.get('correct')!r} is not one of {len(options)} options")
+
+    tags = record.get("tags") or []
+    if isinstance(tags, str):
+        tags = re.split(r"[;|,]", tags)
+    difficulty = record.get("difficulty")
+    discrimination = record.get("discrimination")
+    return {
+        "topic": topic,
+        "question": question,
+        "options": options,
+        "correct": correct,
+        "explanation": str(record.get("explanation") or "").strip(),
+        "difficulty": float(difficulty) if difficulty not in (None, "") else DEFAULT_DIFFICULTY,
+        "discrimination": float(discrimination) if discrimination not in (None, "") else DEFAULT_DISCRIMINATION,
+        "tags": sorted({tag.strip().lower() for tag in tags if tag.strip()}),
+        "source": str(record.get("source") or ""),
+    }
+
+def add_questions(records: Iterable[Dict], default_topic: Optional[str] = None) -> Dict:
+    """
+    Validate and insert questions in batched transactions
+
+    Questions whose fingerprint is already in the bank (or earlier in the
+    same input) are skipped as duplicates.
+
+    Returns:
+        {"inserted": n, "duplicates": n, "rejected": [(position, error), ...]}
+    """
+    summary = {"inserted": 0, "duplicates": 0, "rejected": []}
+    batch = []
+    for position, record in enumerate(records, 1):
+        try:
+            batch.append(validate_question(record, default_topic))
+        except (ValueError, TypeError, AttributeError) as e:
+            summary["rejected"].append((position, str(e)))
+            continue
+        if len(batch) >= INSERT_BATCH_SIZE:
+            _insert_batch(batch, summary)
+            batch = []
+    if batch:
+        _insert_batch(batch, summary)
+    return summary
+
+def _insert_batch(batch: List[Dict], summary: Dict) -> None:
+    connection = open_bank()
+    now = datetime.now().isoformat()
+    with _lock, connection:
+        for q in batch:
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO questions (topic, question, options, correct, explanation, "
+                "difficulty, discrimination, source, fingerprint, created_at) VALUES (?,?,?,?,?,?,?,?,?,?)",
+                (q["topic"], q["question"], json.dumps(q["options"]), q["correct"], q["explanation"],
+                 q["difficulty"], q["discrimination"], q["source"],
+                 question_fingerprint(q["topic"], q["question"]), now)
+            )
+            if cursor.rowcount == 0:
+                summary["duplicates"] += 1
+                continue
+            summary["inserted"] += 1
+            connection.executemany(
+                "INSERT OR IGNORE INTO question_tags (tag, question_id) VALUES (?, ?)",
+                [(tag, cursor.lastrowid) for tag in q["tags"]]
+            )
+        _topic_cache.clear()
+
+def read_question_file(path) -> List[Dict]:
+    """
+    Question records from a CSV, JSON or JSON Lines file
+
+    JSON may be a list of records or a {topic: [questions]} mapping like
+    ASSESSMENT_QUESTIONS. CSV needs topic, question, correct and either an
+    "options" column ("|"-separated) or option_1..option_n / option_a..
+    columns; explanation, difficulty, discrimination and tags are optional.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            option_columns = sorted((column for column in row if column and column.lower().startswith("option_")),
+                                    key=lambda column: (len(column), column))  # option_2 before option_10
+            if not row.get("options") and option_columns:
+                row["options"] = [row[column] for column in option_columns]
+        return rows
+    with open(path, encoding="utf-8") as f:
+        if suffix == ".jsonl":
+            return [json.loads(line) for line in f if line.strip()]
+        data = json.load(f)
+    if isinstance(data, dict):
+        return [{**question, "topic": topic} for topic, questions in data.items() for question in questions]
+    return data
+
+# ============================================================================
+# READING & SAMPLING
+# ============================================================================
+
+def get_topics() -> Dict[str, int]:
+    """Question count per topic"""
+    connection = open_bank()
+    with _lock:
+        rows = connection.execute("SELECT topic, COUNT(*) FROM questions GROUP BY topic ORDER BY topic").fetchall()
+    return {topic: count for topic, count in rows}
+
+def _row_to_question(row: sqlite3.Row) -> Dict:
+    return {
+        "id": row["id"],
+        "question": row["question"],
+        "options": json.loads(row["options"]),
+        "correct": row["correct"],
+        "explanation": row["explanation"],
+        "difficulty": row["difficulty"],
+        "discrimination": row["discrimination"],
+    }
+
+def load_topic(topic: str) -> Dict:
+    """
+    All questions of one topic, loaded on first use and cached
+
+    Returns:
+        {"questions": [...], "ids": np.ndarray, "position": {id: index},
+         "difficulty": np.ndarray, "discrimination": np.ndarray}
+    """
+    connection = open_bank()
+    with _lock:
+        _check_cache()
+        cached = _topic_cache.get(topic)
+        if cached is not None:
+            return cached
+        rows = connection.execute(
+            "SELECT id, question, options, correct, explanation, difficulty, discrimination "
+            "FROM questions WHERE topic = ? ORDER BY id", (topic,)
+        ).fetchall()
+        questions = [_row_to_question(row) for row in rows]
+        items = {
+            "questions": questions,
+            "ids": np.array([q["id"] for q in questions], dtype=np.int64),
+            "position": {q["id"]: i for i, q in enumerate(questions)},
+            "difficulty": np.array([q["difficulty"] for q in questions], dtype=float),
+            "discrimination": np.array([q["discrimination"] for q in questions], dtype=float),
+        }
+        _topic_cache[topic] = items
+        return items
+
+def get_seen_ids(profile: str, topic: Optional[str] = None) -> Dict[int, str]:
+    """Question ids a profile has seen (optionally within one topic) -> when"""
+    connection = open_bank()
+    query = "SELECT h.question_id, h.seen_at FROM question_history h"
+    params = [profile]
+    if topic is not None:
+        query += " JOIN questions q ON q.id = h.question_id WHERE h.profile = ? AND q.topic = ?"
+        params.append(topic)
+    else:
+        query += " WHERE h.profile = ?"
+    with _lock:
+        return dict(connection.execute(query, params).fetchall())
+
+def mark_seen(profile: str, question_ids: Iterable[int]) -> None:
+    """Record that a profile was shown these questions"""
+    now = datetime.now().isoformat()
+    connection = open_bank()
+    with _lock, connection:
+        connection.executemany(
+            "INSERT OR REPLACE INTO question_history (profile, question_id, seen_at) VALUES (?, ?, ?)",
+            [(profile, int(question_id), now) for question_id in question_ids]
+        )
+
+def sample_questions(topic: str, count: int, profile: Optional[str] = None,
+                     min_difficulty: Optional[float] = None, max_difficulty: Optional[float] = None,
+                     tag: Optional[str] = None) -> List[Dict]:
+    """
+    Randomly pick questions, avoiding ones the profile has already seen
+
+    Unseen questions are sampled without replacement; only when fewer than
+    `count` remain is the set topped up with the profile's least recently
+    seen questions. Sampled questions are recorded in the profile's history.
+
+    Returns:
+        Up to `count` question dicts (with "id" and "correct")
+    """
+    items = load_topic(topic)
+    candidates = items["ids"]
+    if min_difficulty is not None or max_difficulty is not None:
+        low = -np.inf if min_difficulty is None else min_difficulty
+        high = np.inf if max_difficulty is None else max_difficulty
+        candidates = candidates[(items["difficulty"] >= low) & (items["difficulty"] <= high)]
+    if tag is not None:
+        with _lock:
+            tagged = {row[0] for row in open_bank().execute(
+                "SELECT question_id FROM question_tags WHERE tag = ?", (tag.strip().lower(),))}
+        candidates = candidates[np.isin(candidates, list(tagged))]
+
+    seen = get_seen_ids(profile, topic) if profile else {}
+    seen_mask = np.isin(candidates, np.fromiter(seen, dtype=np.int64, count=len(seen)))
+    fresh = candidates[~seen_mask]
+    chosen = [int(i) for i in random.sample(list(fresh), min(count, len(fresh)))]
+    if len(chosen) < count:
+        repeats = sorted((int(i) for i in candidates[seen_mask]), key=lambda i: seen[i])
+        chosen += repeats[:count - len(chosen)]
+
+    if profile and chosen:
+        mark_seen(profile, chosen)
+    return [items["questions"][items["position"][question_id]] for question_id in chosen]
+
+def get_question(question_id: int) -> Optional[Dict]:
+    connection = open_bank()
+    with _lock:
+        row = connection.execute(
+            "SELECT id, question, options, correct, explanation, difficulty, discrimination "
+            "FROM questions WHERE id = ?", (question_id,)
+        ).fetchone()
+    return _row_to_question(row) if row else None
+
+def bank_stats() -> Dict:
+    """Totals for the import tool and admin views"""
+    connection = open_bank()
+    with _lock:
+        total, = connection.execute("SELECT COUNT(*) FROM questions").fetchone()
+        tags, = connection.execute("SELECT COUNT(DISTINCT tag) FROM question_tags").fetchone()
+    return {"questions": total, "topics": get_topics(), "tags": tags, "path": str(BANK_PATH)}
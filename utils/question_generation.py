@@ -0,0 +1,295 @@
+# ============================================================================
+# QUESTION GENERATION
+# ============================================================================
+# Offline pipeline that asks an LLM for multiple-choice questions per topic
+# and difficulty band, parses them into the ASSESSMENT_QUESTIONS schema,
+# drops near-duplicates by normalized-text fingerprint and writes the rest
+# into the question bank. The app then serves them with no LLM call.
+#
+# Providers are plain callables with the query_model signature:
+#   "hf"     - utils.llm.query_model (needs HUGGINGFACE_API_KEY)
+#   "replay" - answers recorded by an earlier run, keyed by prompt hash
+#   "mock"   - deterministic synthetic questions, for local dry runs
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from utils import question_bank
+from utils.prompts import question_generation_prompt
+
+DIFFICULTY_BANDS = {"easy": -1.0, "medium": 0.0, "hard": 1.0}  # IRT difficulty assigned to each band
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_TOKENS = 1500
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF = 2.0             # seconds, doubled on each retry
+AVOID_SAMPLE_SIZE = 15          # existing questions listed in the prompt as "don't repeat"
+
+Provider = Callable[[str, str, int], str]
+
+# ============================================================================
+# PROVIDERS
+# ============================================================================
+
+def prompt_key(system_prompt: str, user_input: str, max_tokens: int) -> str:
+    """Stable key for one request, used to record and replay responses"""
+    payload = json.dumps([system_prompt, user_input, max_tokens], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def hf_provider() -> Provider:
+    """The app's HuggingFace query_model; imported lazily so other providers need no API key"""
+    from utils.llm import query_model
+    return query_model
+
+def recording_provider(provider: Provider, path) -> Provider:
+    """
+    Wrap a provider so every successful response is appended to a replay file
+
+    Args:
+        provider: Provider whose answers should be recorded
+        path: JSON Lines file of {"key", "response"} records
+
+    Returns:
+        Provider with the same answers
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lock = threading.Lock()
+
+    def query(system_prompt, user_input, max_tokens=DEFAULT_MAX_TOKENS):
+        response = provider(system_prompt, user_input, max_tokens)
+        if not response.startswith("Error:"):
+            record = {"key": prompt_key(system_prompt, user_input, max_tokens), "response": response}
+            with lock, open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return response
+    return query
+
+def replay_provider(path) -> Provider:
+    """
+    Answer from a replay file written by recording_provider
+
+    Prompts that were never recorded get an "Error:" response, like a
+    failed live call, so the pipeline reports them instead of crashing.
+
+    Raises:
+        OSError: If the replay file cannot be read
+    """
+    responses = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                responses[record["key"]] = record["response"]
+
+    def query(system_prompt, user_input, max_tokens=DEFAULT_MAX_TOKENS):
+        key = prompt_key(system_prompt, user_input, max_tokens)
+        return responses.get(key, f"Error: no recorded response for prompt {key[:12]}")
+    return query
+
+_MOCK_STEMS = [
+    "Which statement about {concept} in {topic} is correct?",
+    "What is the main purpose of {concept} in {topic}?",
+    "When should you prefer {concept} in {topic}?",
+    "Which of these is a common mistake with {concept}?",
+]
+
+def mock_provider(concepts: int = 12) -> Provider:
+    """
+    Deterministic offline stand-in for the LLM
+
+    Questions are drawn from a small pool of stems and concepts seeded by
+    the prompt, so repeated batches overlap the way real model output does
+    and exercise deduplication.
+    """
+    def query(system_prompt, user_input, max_tokens=DEFAULT_MAX_TOKENS):
+        fields = dict(re.findall(r"^(Topic|Difficulty|Number of questions): (.+)$", user_input, re.MULTILINE))
+        topic = fields.get("Topic", "General")
+        difficulty = fields.get("Difficulty", "medium")
+        count = int(fields.get("Number of questions", 5))
+        rng = random.Random(prompt_key(system_prompt, user_input, max_tokens))
+        questions = []
+        for _ in range(count):
+            concept = f"{difficulty} concept {rng.randrange(concepts) + 1}"
+            correct = rng.randrange(4)
+            questions.append({
+                "question": rng.choice(_MOCK_STEMS).format(concept=concept, topic=topic),
+                "options": [f"{'Correct' if i == correct else 'Plausible'} answer {i + 1} about {concept}" for i in range(4)],
+                "correct": correct,
+                "explanation": f"Option {correct + 1} describes {concept} accurately.",
+            })
+        return json.dumps(questions)
+    return query
+
+def make_provider(name: str, replay_path=None, record_path=None) -> Provider:
+    """
+    Build a provider by name ("hf", "replay" or "mock")
+
+    Raises:
+        ValueError: For an unknown name, or "replay" without a file
+    """
+    if name == "hf":
+        provider = hf_provider()
+    elif name == "replay":
+        if not replay_path:
+            raise ValueError("the replay provider needs a replay file")
+        provider = replay_provider(replay_path)
+    elif name == "mock":
+        provider = mock_provider()
+    else:
+        raise ValueError(f"unknown provider {name!r}")
+    return recording_provider(provider, record_path) if record_path else provider
+
+# ============================================================================
+# PARSING
+# ============================================================================
+
+def parse_generated_questions(response: str) -> List[Dict]:
+    """
+    Pull the list of question objects out of a model response
+
+    Tolerates code fences and prose around the JSON array.
+
+    Raises:
+        ValueError: If no JSON array of objects can be found
+    """
+    text = re.sub(r"```(?:json)?", "", response).strip()
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end <= start:
+        raise ValueError("no JSON array in response")
+    try:
+        items = json.loads(text[start:end + 1])
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON: {e}") from e
+    if not isinstance(items, list):
+        raise ValueError("response is not a JSON array")
+    return [item for item in items if isinstance(item, dict)]
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+
+def _existing_questions(topic: str, limit: int) -> List[str]:
+    """The newest question texts already in the bank for this topic (deterministic, so replays match)"""
+    questions = question_bank.load_topic(topic)["questions"]
+    return [q["question"] for q in questions[-limit:]]
+
+def _run_job(provider: Provider, topic: str, difficulty: str, count: int, batch: int,
+             avoid: List[str], max_tokens: int) -> Dict:
+    """One provider call with retries; returns parsed records or the last error"""
+    system_prompt, user_input = question_generation_prompt(topic, difficulty, count, batch, avoid)
+    error = ""
+    for attempt in range(MAX_ATTEMPTS):
+        if attempt:
+            time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+        response = provider(system_prompt, user_input, max_tokens)
+        if response.startswith("Error:"):
+            error = response
+            if "no recorded response" in response:
+                break
+            continue
+        try:
+            records = parse_generated_questions(response)
+        except ValueError as e:
+            error = str(e)
+            continue
+        return {"records": records, "error": "", "attempts": attempt + 1}
+    return {"records": [], "error": error, "attempts": attempt + 1}
+
+def generate_questions(topics: List[str], provider: Provider, provider_name: str,
+                       difficulties: Optional[List[str]] = None, per_call: int = 5, calls: int = 2,
+                       workers: int = DEFAULT_WORKERS, max_tokens: int = DEFAULT_MAX_TOKENS,
+                       dry_run: bool = False, progress: Optional[Callable[[str], None]] = None) -> Dict:
+    """
+    Generate questions for every topic x difficulty band and store them
+
+    Calls run concurrently in a thread pool since they are network-bound.
+    Records are validated against the bank schema and deduplicated by
+    question_bank.question_fingerprint, both within this run and against
+    questions already in the bank.
+
+    Args:
+        topics: Topics to generate for
+        provider: Callable with the query_model signature
+        provider_name: Recorded as the questions' source ("generated:<name>")
+        difficulties: Difficulty bands from DIFFICULTY_BANDS (default: all)
+        per_call: Questions requested per call
+        calls: Calls per topic and band
+        workers: Concurrent calls
+        max_tokens: Response length limit per call
+        dry_run: Parse and deduplicate but don't write to the bank
+        progress: Optional callback for one-line status messages
+
+    Returns:
+        Summary with call, question and duplicate counts, per-topic
+        inserted counts and any call errors
+    """
+    difficulties = difficulties or list(DIFFICULTY_BANDS)
+    unknown = [d for d in difficulties if d not in DIFFICULTY_BANDS]
+    if unknown:
+        raise ValueError(f"unknown difficulty {unknown[0]!r}; choose from {', '.join(DIFFICULTY_BANDS)}")
+
+    jobs = [(topic, difficulty, batch) for topic in topics for difficulty in difficulties
+            for batch in range(1, calls + 1)]
+    avoid = {topic: _existing_questions(topic, AVOID_SAMPLE_SIZE) for topic in topics}
+    summary = {"calls": len(jobs), "failed_calls": 0, "attempts": 0, "generated": 0, "rejected": 0,
+               "duplicates_in_run": 0, "duplicates_in_bank": 0, "inserted": 0,
+               "topics": {topic: 0 for topic in topics}, "errors": []}
+    seen = set()
+    accepted = []
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(_run_job, provider, topic, difficulty, per_call, batch, avoid[topic], max_tokens): (topic, difficulty)
+            for topic, difficulty, batch in jobs
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            topic, difficulty = futures[future]
+            result = future.result()
+            summary["attempts"] += result["attempts"]
+            if result["error"]:
+                summary["failed_calls"] += 1
+                summary["errors"].append(f"{topic} / {difficulty}: {result['error']}")
+            kept = 0
+            for record in result["records"]:
+                summary["generated"] += 1
+                record = {**record, "topic": topic, "difficulty": DIFFICULTY_BANDS[difficulty],
+                          "source": f"generated:{provider_name}",
+                          "tags": record.get("tags") or ["generated", difficulty]}
+                try:
+                    record = question_bank.validate_question(record)
+                except (ValueError, TypeError, AttributeError):
+                    summary["rejected"] += 1
+                    continue
+                fingerprint = question_bank.question_fingerprint(topic, record["question"])
+                if fingerprint in seen:
+                    summary["duplicates_in_run"] += 1
+                    continue
+                seen.add(fingerprint)
+                accepted.append(record)
+                kept += 1
+            if progress:
+                progress(f"[{done}/{len(jobs)}] {topic} / {difficulty}: "
+                         f"{len(result['records'])} parsed, {kept} new" + (" (failed)" if result["error"] else ""))
+
+    summary["elapsed"] = time.perf_counter() - start
+    if dry_run:
+        in_bank = len(question_bank.existing_fingerprints(
+            question_bank.question_fingerprint(r["topic"], r["question"]) for r in accepted))
+        summary["duplicates_in_bank"] = in_bank
+        summary["would_insert"] = len(accepted) - in_bank
+        return summary
+
+    for topic in topics:
+        stored = question_bank.add_questions([r for r in accepted if r["topic"] == topic])
+        summary["inserted"] += stored["inserted"]
+        summary["duplicates_in_bank"] += stored["duplicates"]
+        summary["topics"][topic] = stored["inserted"]
+    return summary
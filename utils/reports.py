@@ -3,10 +3,31 @@
 # ============================================================================
 # Generates PDF reports, summaries, and exports
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
+from xml.sax.saxutils import escape
+import csv
+import hashlib
+import io
 import json
+import os
+import re
+import tempfile
+import time
+
+from utils.cohort import compute_cohort_stats, frame_from_stats
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import cm
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+    HAS_REPORTLAB = True
+except ImportError:
+    HAS_REPORTLAB = False
 
 def generate_text_report(profile_name: str, stats: Dict, assessments: List[Dict] = None) -> str:
     """
@@ -81,6 +102,76 @@ NOTES:
     
     return report
 
+# Rows buffered per chunk yielded by the streaming exporters
+EXPORT_BATCH_ROWS = 500
+
+CSV_HEADERS = [
+    "Profile Name",
+    "Skill Level",
+    "Target Role",
+    "Daily Availability",
+    "Timeline",
+    "Roadmaps Generated",
+    "Resumes Analyzed",
+    "Interviews Completed",
+    "Total Interactions",
+    "Engagement Level",
+    "Created Date",
+    "Last Updated"
+]
+
+def _csv_row(profile: Dict) -> List[str]:
+    """Flatten one profile's stats into CSV_HEADERS order"""
+    engagement = int(calculate_profile_engagement(profile) * 100) / 100
+    return [
+        profile.get("profile_name", ""),
+        profile.get("user_level", ""),
+        profile.get("target_role", ""),
+        profile.get("daily_availability", ""),
+        profile.get("timeline", ""),
+        str(profile.get("roadmaps_generated", 0)),
+        str(profile.get("resumes_analyzed", 0)),
+        str(profile.get("interviews_completed", 0)),
+        str(profile.get("total_interactions", 0)),
+        f"{engagement:.1f}",
+        profile.get("created_at", "").split("T")[0],
+        profile.get("updated_at", "").split("T")[0]
+    ]
+
+def iter_csv_export(profiles: Iterable[Dict], batch_rows: int = EXPORT_BATCH_ROWS) -> Iterator[str]:
+    """
+    Stream a CSV export of profiles in chunks of ``batch_rows`` rows
+    
+    Works with any iterable (including generators), so memory stays flat
+    however many profiles are exported. The chunks can be handed straight
+    to a Flask ``Response`` or spooled for Streamlit (see spool_export).
+    
+    Args:
+        profiles: Iterable of profile dictionaries
+        batch_rows: Rows buffered before each yield
+    
+    Yields:
+        CSV text chunks
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL, lineterminator="\n")
+    rows = 0
+    
+    for profile in profiles:
+        if rows == 0:
+            buffer.write(",".join(CSV_HEADERS) + "\n")
+        writer.writerow(_csv_row(profile))
+        rows += 1
+        if rows % batch_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    
+    if rows == 0:
+        yield "No profiles to export"
+    elif buffer.tell():
+        yield buffer.getvalue()
+
 def generate_csv_export(profiles: List[Dict]) -> str:
     """
     Generate CSV export of multiple profiles
@@ -91,48 +182,45 @@ def generate_csv_export(profiles: List[Dict]) -> str:
     Returns:
         CSV formatted string
     """
-    if not profiles:
-        return "No profiles to export"
-    
-    # CSV header
-    headers = [
-        "Profile Name",
-        "Skill Level",
-        "Target Role",
-        "Daily Availability",
-        "Timeline",
-        "Roadmaps Generated",
-        "Resumes Analyzed",
-        "Interviews Completed",
-        "Total Interactions",
-        "Engagement Level",
-        "Created Date",
-        "Last Updated"
-    ]
+    return "".join(iter_csv_export(profiles))
+
+def iter_json_export(profiles: Iterable[Dict], total: Optional[int] = None) -> Iterator[str]:
+    """
+    Stream a JSON export of profiles, one profile per chunk
+    
+    The output is byte-for-byte what ``json.dumps(..., indent=2)`` produces
+    for the same document, without ever holding the whole text in memory.
     
-    csv = ",".join(headers) + "\n"
+    Args:
+        profiles: Iterable of profile dictionaries
+        total: Profile count for the header; required for unsized iterables
     
-    # Data rows
+    Yields:
+        JSON text chunks
+    
+    Raises:
+        TypeError: If ``profiles`` has no length and ``total`` is not given
+    """
+    if total is None:
+        if not hasattr(profiles, "__len__"):
+            # Counting would mean materializing the whole stream first
+            raise TypeError("iter_json_export needs total= for unsized iterables")
+        total = len(profiles)
+    
+    yield (
+        "{\n"
+        f'  "export_date": {json.dumps(datetime.now().isoformat())},\n'
+        f'  "total_profiles": {total},\n'
+        '  "profiles": ['
+    )
+    
+    empty = True
     for profile in profiles:
-        engagement = int(calculate_profile_engagement(profile) * 100) / 100
-        row = [
-            profile.get("profile_name", ""),
-            profile.get("user_level", ""),
-            profile.get("target_role", ""),
-            profile.get("daily_availability", ""),
-            profile.get("timeline", ""),
-            str(profile.get("roadmaps_generated", 0)),
-            str(profile.get("resumes_analyzed", 0)),
-            str(profile.get("interviews_completed", 0)),
-            str(profile.get("total_interactions", 0)),
-            f"{engagement:.1f}",
-            profile.get("created_at", "").split("T")[0],
-            profile.get("updated_at", "").split("T")[0]
-        ]
-        # Escape quotes in values
-        csv += ",".join(f'"{str(item).replace('"', '""')}"' for item in row) + "\n"
+        encoded = json.dumps(profile, indent=2).replace("\n", "\n    ")
+        yield ("\n    " if empty else ",\n    ") + encoded
+        empty = False
     
-    return csv
+    yield "]\n}" if empty else "\n  ]\n}"
 
 def generate_json_export(profiles: List[Dict]) -> str:
     """
@@ -144,13 +232,43 @@ def generate_json_export(profiles: List[Dict]) -> str:
     Returns:
         JSON formatted string
     """
-    export_data = {
-        "export_date": datetime.now().isoformat(),
-        "total_profiles": len(profiles),
-        "profiles": profiles
-    }
+    return "".join(iter_json_export(profiles))
+
+def spool_export(chunks: Iterable[str], max_memory: int = 8 * 1024 * 1024) -> BinaryIO:
+    """
+    Collect streamed export chunks into a file object for st.download_button
+    
+    Small exports stay in an ``io.BytesIO``; past ``max_memory`` bytes they
+    spill to a temporary file that is reopened read-only, so large exports
+    don't have to fit in RAM as one string. Both are types that
+    st.download_button accepts (a SpooledTemporaryFile is not).
+    
+    Args:
+        chunks: Text chunks from iter_csv_export / iter_json_export
+        max_memory: Bytes kept in memory before spilling to disk
     
-    return json.dumps(export_data, indent=2)
+    Returns:
+        Binary file object positioned at the start
+    """
+    buffer = io.BytesIO()
+    spill = None
+    for chunk in chunks:
+        (spill or buffer).write(chunk.encode("utf-8"))
+        if spill is None and buffer.tell() > max_memory:
+            spill = tempfile.NamedTemporaryFile(suffix=".export", delete=False)
+            spill.write(buffer.getvalue())
+            buffer = None
+    if spill is None:
+        buffer.seek(0)
+        return buffer
+    
+    spill.close()
+    reader = open(spill.name, "rb")
+    try:
+        os.unlink(spill.name)  # the open handle keeps the data until it is closed
+    except OSError:
+        pass  # Windows won't unlink open files; the temp dir cleanup gets it
+    return reader
 
 def generate_summary_stats(profiles: List[Dict]) -> Dict:
     """
@@ -173,23 +291,20 @@ def generate_summary_stats(profiles: List[Dict]) -> Dict:
             "avg_engagement": 0
         }
     
-    total_interactions = sum(p.get("total_interactions", 0) for p in profiles)
-    total_roadmaps = sum(p.get("roadmaps_generated", 0) for p in profiles)
-    total_resumes = sum(p.get("resumes_analyzed", 0) for p in profiles)
-    total_interviews = sum(p.get("interviews_completed", 0) for p in profiles)
-    
-    num_profiles = len(profiles)
-    engagements = [calculate_profile_engagement(p) for p in profiles]
-    avg_engagement = sum(engagements) / num_profiles if engagements else 0
+    cohort = compute_cohort_stats(frame_from_stats(profiles))
+    totals = cohort["totals"]
     
     return {
-        "total_profiles": num_profiles,
-        "total_interactions": total_interactions,
-        "avg_interactions": round(total_interactions / num_profiles, 2),
-        "total_roadmaps": total_roadmaps,
-        "total_resumes": total_resumes,
-        "total_interviews": total_interviews,
-        "avg_engagement": round(avg_engagement, 2),
+        "total_profiles": cohort["total_profiles"],
+        "total_interactions": totals["total_interactions"],
+        "avg_interactions": cohort["means"]["total_interactions"],
+        "total_roadmaps": totals["roadmaps_generated"],
+        "total_resumes": totals["resumes_analyzed"],
+        "total_interviews": totals["interviews_completed"],
+        "avg_engagement": cohort["engagement"]["mean"],
+        "engagement_percentiles": cohort["engagement"]["percentiles"],
+        "engagement_distribution": cohort["engagement"]["distribution"],
+        "by_target_role": cohort["by_target_role"],
         "export_date": datetime.now().isoformat()
     }
 
@@ -311,3 +426,214 @@ def generate_achievement_text(stats: Dict) -> str:
         text += f"{milestone}\n"
     
     return text
+
+# ============================================================================
+# PDF REPORTS
+# ============================================================================
+
+def _pdf_plain(value) -> str:
+    """
+    Drop characters the built-in PDF fonts can't draw
+    
+    Helvetica only covers Latin-1, so emoji and other symbols are removed.
+    """
+    return str(value).encode("latin-1", "ignore").decode("latin-1").strip()
+
+def _pdf_text(value) -> str:
+    """Make a value safe for a reportlab Paragraph (markup escaped)"""
+    return escape(_pdf_plain(value))
+
+def _pdf_table(rows: List[List], col_widths: List[float], header: bool = False):
+    """Two-tone key/value (or header + rows) table"""
+    table = Table([[_pdf_plain(cell) for cell in row] for row in rows], colWidths=col_widths)
+    style = [
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+        ("LINEBELOW", (0, 0), (-1, -1), 0.25, colors.lightgrey),
+    ]
+    if header:
+        style += [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#6C63FF")),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ]
+    else:
+        style.append(("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"))
+    table.setStyle(TableStyle(style))
+    return table
+
+def generate_pdf_report(profile_name: str, stats: Dict, assessments: List[Dict] = None) -> bytes:
+    """
+    Generate the profile report as a PDF
+    
+    Same sections as generate_text_report, laid out with reportlab.
+    
+    Args:
+        profile_name: Name of the profile
+        stats: Profile statistics
+        assessments: Optional list of assessment results
+    
+    Returns:
+        PDF document bytes
+    """
+    if not HAS_REPORTLAB:
+        raise RuntimeError("PDF reports require reportlab: pip install reportlab")
+    
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer, pagesize=A4, title=f"Career Report - {profile_name}",
+        leftMargin=2 * cm, rightMargin=2 * cm, topMargin=2 * cm, bottomMargin=2 * cm
+    )
+    styles = getSampleStyleSheet()
+    widths = [6 * cm, 11 * cm]
+    
+    story = [
+        Paragraph("Career Assistant - Profile Report", styles["Title"]),
+        Paragraph(_pdf_text(profile_name), styles["Heading3"]),
+        Spacer(1, 0.4 * cm),
+        Paragraph("Profile Information", styles["Heading2"]),
+        _pdf_table([
+            ["Skill Level", stats.get("user_level", "N/A")],
+            ["Target Role", stats.get("target_role", "N/A")],
+            ["Daily Availability", stats.get("daily_availability", "N/A")],
+            ["Target Timeline", stats.get("timeline", "N/A")],
+            ["Created Date", stats.get("created_at", "N/A")],
+            ["Last Updated", stats.get("updated_at", "N/A")],
+        ], widths),
+        Paragraph("Activity Metrics", styles["Heading2"]),
+        _pdf_table([
+            ["Roadmaps Generated", stats.get("roadmaps_generated", 0)],
+            ["Resumes Analyzed", stats.get("resumes_analyzed", 0)],
+            ["Interviews Completed", stats.get("interviews_completed", 0)],
+            ["Total Interactions", stats.get("total_interactions", 0)],
+        ], widths),
+        Paragraph("Performance Summary", styles["Heading2"]),
+        _pdf_table([
+            ["Engagement Level", get_engagement_level(stats)],
+            ["Progress Status", get_progress_status(stats)],
+            ["Recommended Focus", get_recommended_focus(stats)],
+        ], widths),
+    ]
+    
+    if assessments:
+        story += [
+            Paragraph("Assessment Results", styles["Heading2"]),
+            _pdf_table(
+                [["Topic", "Score", "Level"]] + [
+                    [a.get("topic", "Unknown"), f"{a.get('score', 0):.1f}%", a.get("level", "N/A")]
+                    for a in assessments
+                ],
+                [9 * cm, 3 * cm, 5 * cm], header=True
+            ),
+        ]
+    
+    milestones = get_milestones_achieved(stats)
+    if milestones:
+        story.append(Paragraph("Achievements", styles["Heading2"]))
+        story += [Paragraph(_pdf_text(m), styles["Normal"]) for m in milestones]
+    
+    story += [
+        Spacer(1, 0.8 * cm),
+        Paragraph(
+            f"Generated {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Career Assistant Platform v2.0",
+            styles["Italic"]
+        ),
+    ]
+    
+    doc.build(story)
+    return buffer.getvalue()
+
+# ============================================================================
+# BATCH REPORTS
+# ============================================================================
+
+def profile_report_inputs(profile_name: str) -> tuple:
+    """
+    Load the stats and assessments a profile report is built from
+    
+    Args:
+        profile_name: Name of the profile
+    
+    Returns:
+        (stats, assessments) tuple
+    
+    Raises:
+        ValueError: If no such profile is stored
+    """
+    from utils.storage import get_profile_stats, load_profile
+    
+    profile = load_profile(profile_name)
+    if not profile:
+        raise ValueError(f"profile {profile_name!r} not found")
+    stats = get_profile_stats(profile_name)
+    stats.update({
+        "user_level": profile.get("user_level", profile.get("experience", "N/A")),
+        "target_role": profile.get("target_role", profile.get("career_field", "N/A")),
+        "daily_availability": profile.get("daily_availability", "N/A"),
+        "timeline": profile.get("timeline", "N/A"),
+    })
+    assessments = [
+        {"topic": topic, "score": result.get("percentage", 0), "level": result.get("level", "N/A")}
+        for topic, result in profile.get("assessment_scores", {}).items()
+    ]
+    return stats, assessments
+
+def _report_filename(profile_name: str) -> str:
+    """Safe, unique file name: sanitized name plus a short hash ("a b" and "a_b" differ)"""
+    stem = re.sub(r"[^\w.-]+", "_", profile_name).strip("_.")
+    digest = hashlib.sha256(profile_name.encode("utf-8")).hexdigest()[:8]
+    return f"{stem}_{digest}.pdf" if stem else f"{digest}.pdf"
+
+def _render_profile_pdf(profile_name: str, output_dir: str) -> Dict:
+    """Process-pool worker: render one profile's PDF and time it"""
+    start = time.perf_counter()
+    try:
+        stats, assessments = profile_report_inputs(profile_name)
+        path = Path(output_dir) / _report_filename(profile_name)
+        path.write_bytes(generate_pdf_report(profile_name, stats, assessments))
+        return {"profile_name": profile_name, "path": str(path), "error": "",
+                "seconds": round(time.perf_counter() - start, 4)}
+    except Exception as e:
+        return {"profile_name": profile_name, "path": "", "error": str(e),
+                "seconds": round(time.perf_counter() - start, 4)}
+
+def generate_batch_pdf_reports(output_dir: str, profile_names: List[str] = None,
+                               workers: Optional[int] = None) -> List[Dict]:
+    """
+    Render PDF reports for many profiles in a process pool
+    
+    Writes one PDF per profile plus ``timings.csv`` into ``output_dir``.
+    A failing profile is reported in its result row rather than aborting
+    the batch.
+    
+    Args:
+        output_dir: Directory to write the reports to (created if missing)
+        profile_names: Profiles to render (default: every stored profile)
+        workers: Worker processes (default: CPU count)
+    
+    Returns:
+        Per-profile results with profile_name, path, seconds and error,
+        in completion order
+    """
+    if not HAS_REPORTLAB:
+        raise RuntimeError("PDF reports require reportlab: pip install reportlab")
+    
+    if profile_names is None:
+        from utils.storage import get_all_profiles
+        profile_names = get_all_profiles()
+    
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_render_profile_pdf, name, str(output)) for name in profile_names]
+        for future in as_completed(futures):
+            results.append(future.result())
+    
+    with open(output / "timings.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["profile_name", "seconds", "path", "error"])
+        writer.writeheader()
+        writer.writerows(results)
+    
+    return results
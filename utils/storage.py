@@ -3,24 +3,112 @@
 # ============================================================================
 # Stores user profiles, roadmaps, assessments, and career data locally
 
+import hashlib
 import json
 import os
+import tempfile
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+    import msvcrt
+
 # Define storage directory
 STORAGE_DIR = Path("data")
 PROFILES_DIR = STORAGE_DIR / "profiles"
 RESULTS_DIR = STORAGE_DIR / "results"
+RESUME_CACHE_DIR = STORAGE_DIR / "resume_cache"
 
 def ensure_storage_dirs():
     """Create storage directories if they don't exist"""
     STORAGE_DIR.mkdir(exist_ok=True)
     PROFILES_DIR.mkdir(exist_ok=True)
     RESULTS_DIR.mkdir(exist_ok=True)
+    RESUME_CACHE_DIR.mkdir(exist_ok=True)
 
 ensure_storage_dirs()
 
+# ============================================================================
+# SAFE WRITES
+# ============================================================================
+
+LOCK_TIMEOUT_SECONDS = 10.0
+
+# Bumped on every write made by this process (see get_storage_version)
+_write_counter = 0
+
+def _bump_storage_version() -> None:
+    global _write_counter
+    _write_counter += 1
+
+def get_storage_version() -> tuple:
+    """
+    Cheap token that changes whenever profiles or results change
+    
+    Combines this process's write counter with the directory mtimes, which
+    move on every create/rename/delete, so writes from other processes
+    invalidate cached aggregates too.
+    
+    Returns:
+        Hashable version tuple
+    """
+    stamps = []
+    for directory in (PROFILES_DIR, RESULTS_DIR):
+        try:
+            stamps.append(directory.stat().st_mtime_ns)
+        except FileNotFoundError:
+            stamps.append(0)
+    return (_write_counter, *stamps)
+
+def _write_json_atomic(path: Path, data) -> None:
+    """Write JSON through a temp file + rename so readers never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        _bump_storage_version()
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+@contextmanager
+def _locked(path: Path, timeout: float = LOCK_TIMEOUT_SECONDS):
+    """Hold an exclusive advisory lock on a sidecar lock file for `path`"""
+    fd = os.open(path.parent / f".{path.name}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                if HAS_FCNTL:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for lock on {path.name}")
+                time.sleep(0.01)
+        try:
+            yield
+        finally:
+            if HAS_FCNTL:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
+
 # ============================================================================
 # PROFILE MANAGEMENT
 # ============================================================================
@@ -29,11 +117,21 @@ def save_profile(profile_name: str, profile_data: dict) -> bool:
     """Save a user profile"""
     try:
         profile_file = PROFILES_DIR / f"{profile_name}.json"
-        profile_data["created_at"] = profile_data.get("created_at", datetime.now().isoformat())
-        profile_data["updated_at"] = datetime.now().isoformat()
-        
-        with open(profile_file, "w") as f:
-            json.dump(profile_data, f, indent=2)
+        with _locked(profile_file):
+            current_version = 0
+            if profile_file.exists():
+                with open(profile_file, "r") as f:
+                    current_version = json.load(f).get("version", 0)
+            
+            expected_version = profile_data.get("version")
+            if expected_version is not None and expected_version != current_version:
+                print(f"Error saving profile: '{profile_name}' changed since version {expected_version}")
+                return False
+            
+            profile_data["created_at"] = profile_data.get("created_at", datetime.now().isoformat())
+            profile_data["updated_at"] = datetime.now().isoformat()
+            profile_data["version"] = current_version + 1
+            _write_json_atomic(profile_file, profile_data)
         return True
     except Exception as e:
         print(f"Error saving profile: {e}")
@@ -66,9 +164,11 @@ def delete_profile(profile_name: str) -> bool:
     """Delete a user profile"""
     try:
         profile_file = PROFILES_DIR / f"{profile_name}.json"
-        if profile_file.exists():
-            profile_file.unlink()
-            return True
+        with _locked(profile_file):
+            if profile_file.exists():
+                profile_file.unlink()
+                _bump_storage_version()
+                return True
         return False
     except Exception as e:
         print(f"Error deleting profile: {e}")
@@ -91,8 +191,7 @@ def save_roadmap(profile_name: str, roadmap_data: str) -> bool:
             "timestamp": datetime.now().isoformat()
         }
         
-        with open(result_file, "w") as f:
-            json.dump(result, f, indent=2)
+        _write_json_atomic(result_file, result)
         return True
     except Exception as e:
         print(f"Error saving roadmap: {e}")
@@ -111,13 +210,55 @@ def save_resume_analysis(profile_name: str, analysis_data: str) -> bool:
             "timestamp": datetime.now().isoformat()
         }
         
-        with open(result_file, "w") as f:
-            json.dump(result, f, indent=2)
+        _write_json_atomic(result_file, result)
         return True
     except Exception as e:
         print(f"Error saving resume analysis: {e}")
         return False
 
+def resume_fingerprint(resume_text: str, target_role: str, prompt_version) -> str:
+    """
+    Cache key for a resume analysis
+    
+    Case and whitespace are folded, so re-pasting the same resume with
+    different line breaks or capitalization maps to the same analysis.
+    
+    Args:
+        resume_text: Raw resume text
+        target_role: Role the analysis is tailored to
+        prompt_version: Version of the prompt that produced the analysis
+        
+    Returns:
+        Hex SHA-256 fingerprint
+    """
+    parts = (str(prompt_version), " ".join(target_role.casefold().split()), " ".join(resume_text.casefold().split()))
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+def get_cached_resume_analysis(fingerprint: str) -> dict:
+    """Load a cached resume analysis ({} if this fingerprint was never analyzed)"""
+    try:
+        with open(RESUME_CACHE_DIR / f"{fingerprint}.json", 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def cache_resume_analysis(fingerprint: str, analysis_data: str, target_role: str = "", prompt_version="") -> bool:
+    """Persist a resume analysis under its fingerprint"""
+    try:
+        ensure_storage_dirs()
+        entry = {
+            "fingerprint": fingerprint,
+            "target_role": target_role,
+            "prompt_version": prompt_version,
+            "content": analysis_data,
+            "timestamp": datetime.now().isoformat()
+        }
+        _write_json_atomic(RESUME_CACHE_DIR / f"{fingerprint}.json", entry)
+        return True
+    except Exception as e:
+        print(f"Error caching resume analysis: {e}")
+        return False
+
 def save_interview_session(profile_name: str, session_data: dict) -> bool:
     """Save mock interview session"""
     try:
@@ -128,8 +269,7 @@ def save_interview_session(profile_name: str, session_data: dict) -> bool:
         session_data["profile"] = profile_name
         session_data["timestamp"] = datetime.now().isoformat()
         
-        with open(result_file, "w") as f:
-            json.dump(session_data, f, indent=2)
+        _write_json_atomic(result_file, session_data)
         return True
     except Exception as e:
         print(f"Error saving interview session: {e}")
@@ -8,6 +8,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
 
+from utils.cohort import compute_cohort_stats, frame_from_stats
+
 def format_stats_for_display(stats: Dict) -> Dict:
     """
     Format stats data for Streamlit display
@@ -39,20 +41,18 @@ def format_stats_for_display(stats: Dict) -> Dict:
             "avg_interviews": 0
         }
     
-    total_roadmaps = sum(p.get("roadmaps_generated", 0) for p in profiles)
-    total_resumes = sum(p.get("resumes_analyzed", 0) for p in profiles)
-    total_interviews = sum(p.get("interviews_completed", 0) for p in profiles)
-    total_interactions = sum(p.get("total_interactions", 0) for p in profiles)
+    cohort = compute_cohort_stats(frame_from_stats(profiles))
+    totals, means = cohort["totals"], cohort["means"]
     
     return {
         "total_profiles": total_profiles,
-        "total_interactions": total_interactions,
-        "avg_roadmaps": round(total_roadmaps / total_profiles, 2),
-        "avg_resumes": round(total_resumes / total_profiles, 2),
-        "avg_interviews": round(total_interviews / total_profiles, 2),
-        "roadmaps_total": total_roadmaps,
-        "resumes_total": total_resumes,
-        "interviews_total": total_interviews
+        "total_interactions": totals["total_interactions"],
+        "avg_roadmaps": means["roadmaps_generated"],
+        "avg_resumes": means["resumes_analyzed"],
+        "avg_interviews": means["interviews_completed"],
+        "roadmaps_total": totals["roadmaps_generated"],
+        "resumes_total": totals["resumes_analyzed"],
+        "interviews_total": totals["interviews_completed"]
     }
 
 def create_metric_cards(stats: Dict) -> List[Dict]: